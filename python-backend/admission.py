@@ -0,0 +1,211 @@
+"""
+Admission control for LLM-backed endpoints
+Per-endpoint concurrency limits with bounded FIFO wait queues that fail fast when full
+"""
+
+import asyncio
+import math
+import os
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, Iterable, Optional
+
+from deadlines import DeadlineExceeded, remaining
+
+# EWMA smoothing for service time, used to estimate Retry-After
+SERVICE_TIME_ALPHA = 0.2
+
+
+class Overloaded(Exception):
+    """Raised when a request cannot be admitted; retry_after is in whole seconds"""
+
+    def __init__(self, name: str, retry_after: int, reason: str = "queue full"):
+        super().__init__(f"{name} is overloaded ({reason}), retry after {retry_after}s")
+        self.name = name
+        self.retry_after = retry_after
+        self.reason = reason
+
+
+class AdmissionLimiter:
+    """
+    At most max_concurrency requests run at once; up to max_queue more wait
+    in FIFO order. Anything beyond that is rejected immediately, and a waiter
+    that does not get a slot within queue_timeout gives up, so queued latency
+    stays bounded instead of every caller slowing down together.
+    """
+
+    def __init__(self, name: str, max_concurrency: int, max_queue: int, queue_timeout: Optional[float] = None):
+        """
+        Args:
+            name: Endpoint/operation name, used in errors and stats
+            max_concurrency: Requests allowed to run at once
+            max_queue: Requests allowed to wait for a slot
+            queue_timeout: Seconds a request may wait before being rejected (None waits indefinitely)
+        """
+        self.name = name
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_queue = max(0, max_queue)
+        self.queue_timeout = queue_timeout
+        self._active = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._service_time = 1.0
+        self._admitted = 0
+        self._rejected = 0
+        self._timed_out = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    def retry_after(self) -> int:
+        """Seconds until a slot is likely to free up for a new request"""
+        backlog = (len(self._waiters) + 1) / self.max_concurrency
+        return max(1, math.ceil(backlog * self._service_time))
+
+    def check(self) -> None:
+        """
+        Fail fast if acquire() would be rejected right now, without taking a slot.
+
+        Raises:
+            Overloaded: If every slot is taken and the queue is full
+        """
+        if (self._active >= self.max_concurrency or self._waiters) and len(self._waiters) >= self.max_queue:
+            self._rejected += 1
+            raise Overloaded(self.name, self.retry_after())
+
+    async def acquire(self) -> float:
+        """
+        Wait for a slot.
+
+        Returns:
+            Seconds spent queued
+
+        Raises:
+            Overloaded: If the queue is full or queue_timeout expires
+            DeadlineExceeded: If the request deadline passes while queued
+        """
+        if self._active < self.max_concurrency and not self._waiters:
+            self._active += 1
+            self._record_admit(0.0)
+            return 0.0
+        if len(self._waiters) >= self.max_queue:
+            self._rejected += 1
+            raise Overloaded(self.name, self.retry_after())
+
+        started = time.monotonic()
+        timeout = self.queue_timeout
+        deadline_left = remaining()
+        deadline_bound = deadline_left is not None and (timeout is None or deadline_left < timeout)
+        if deadline_bound:
+            timeout = max(0.0, deadline_left)
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), timeout)
+        except asyncio.TimeoutError:
+            self._abandon(waiter)
+            self._timed_out += 1
+            if deadline_bound:
+                raise DeadlineExceeded(f"{self.name} admission") from None
+            self._rejected += 1
+            raise Overloaded(self.name, self.retry_after(), reason="queue timeout") from None
+        except BaseException:
+            self._abandon(waiter)
+            raise
+        waited = time.monotonic() - started
+        self._record_admit(waited)
+        return waited
+
+    def release(self, service_time: Optional[float] = None) -> None:
+        """Free a slot, handing it directly to the oldest waiter if there is one"""
+        if service_time is not None:
+            self._service_time += SERVICE_TIME_ALPHA * (service_time - self._service_time)
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                # Slot ownership moves to the waiter; _active is unchanged
+                waiter.set_result(None)
+                return
+        self._active -= 1
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[float]:
+        """Hold a slot for the duration of the block; yields seconds spent queued"""
+        waited = await self.acquire()
+        started = time.monotonic()
+        try:
+            yield waited
+        finally:
+            self.release(time.monotonic() - started)
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth, wait time and rejection counters"""
+        return {
+            "active": self._active,
+            "queued": len(self._waiters),
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "admitted": self._admitted,
+            "rejected": self._rejected,
+            "timed_out": self._timed_out,
+            "avg_wait_ms": round(1000 * self._wait_total / self._admitted, 2) if self._admitted else 0.0,
+            "max_wait_ms": round(1000 * self._wait_max, 2),
+            "avg_service_ms": round(1000 * self._service_time, 2),
+        }
+
+    def _record_admit(self, waited: float) -> None:
+        self._admitted += 1
+        self._wait_total += waited
+        self._wait_max = max(self._wait_max, waited)
+
+    def _abandon(self, waiter: asyncio.Future) -> None:
+        if waiter.done() and not waiter.cancelled():
+            # The slot was handed over just as we gave up; pass it on
+            self.release()
+            return
+        waiter.cancel()
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+
+
+class AdmissionController:
+    """One AdmissionLimiter per endpoint, configured from the environment"""
+
+    def __init__(self, names: Iterable[str]):
+        """
+        Settings (environment), per operation NAME in upper case:
+            LINKEDIN_GAI_<NAME>_CONCURRENCY: defaults to LINKEDIN_GAI_ADMISSION_CONCURRENCY (8)
+            LINKEDIN_GAI_<NAME>_QUEUE: defaults to LINKEDIN_GAI_ADMISSION_QUEUE (32)
+            LINKEDIN_GAI_ADMISSION_QUEUE_TIMEOUT: seconds a request may wait, default 20
+        """
+        concurrency = int(os.getenv("LINKEDIN_GAI_ADMISSION_CONCURRENCY", "8"))
+        queue_size = int(os.getenv("LINKEDIN_GAI_ADMISSION_QUEUE", "32"))
+        timeout = float(os.getenv("LINKEDIN_GAI_ADMISSION_QUEUE_TIMEOUT", "20"))
+        self._limiters: Dict[str, AdmissionLimiter] = {}
+        for name in names:
+            prefix = f"LINKEDIN_GAI_{name.upper()}"
+            self._limiters[name] = AdmissionLimiter(
+                name,
+                max_concurrency=int(os.getenv(f"{prefix}_CONCURRENCY", str(concurrency))),
+                max_queue=int(os.getenv(f"{prefix}_QUEUE", str(queue_size))),
+                queue_timeout=timeout if timeout > 0 else None,
+            )
+
+    def __getitem__(self, name: str) -> AdmissionLimiter:
+        return self._limiters[name]
+
+    def slot(self, name: str):
+        """Shortcut for controller[name].slot()"""
+        return self._limiters[name].slot()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {name: limiter.stats() for name, limiter in self._limiters.items()}
@@ -7,28 +7,87 @@ import os
 import asyncio
 import logging
 import sys
-from typing import Dict, Any, Optional, List
-from fastapi import FastAPI, HTTPException
+import time
+
+# Cold-start clock: everything below, including the imports, counts against the startup budget
+IMPORT_STARTED = time.perf_counter()
+
+from contextlib import asynccontextmanager
+from typing import Dict, Any, Literal, Optional, List
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse, PlainTextResponse, StreamingResponse
+import orjson
+from pydantic import BaseModel, ValidationError
 import uvicorn
 from dotenv import load_dotenv
 from linkedin_gai_service import LinkedInGAIService
+from admission import AdmissionController, Overloaded
+from task_queue import TaskQueue
+import deadlines
+from deadlines import DeadlineExceeded, DeadlineMiddleware
+import metrics
+import log_pipeline
+from log_pipeline import setup_logging
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('python-backend.log')
-    ]
-)
+# Configure logging: records are written by a background thread, never on the event loop
+setup_logging('python-backend.log')
 logger = logging.getLogger(__name__)
 
 load_dotenv()
 
-app = FastAPI(title="Career Companion LinkedIn GAI API", version="1.0.0")
+# Time from IMPORT_STARTED to accepting requests that counts as a slow cold start
+COLD_START_BUDGET_MS = float(os.getenv("LINKEDIN_GAI_COLD_START_BUDGET_MS", "1000"))
+# import_ms and accepting_ms since IMPORT_STARTED
+startup_timings: Dict[str, float] = {}
+
+def _elapsed_ms() -> float:
+    return round((time.perf_counter() - IMPORT_STARTED) * 1000, 1)
+
+def startup_report() -> Dict[str, float]:
+    """Cold-start milestones since IMPORT_STARTED plus the service's warm-up phases, in ms"""
+    report = dict(startup_timings)
+    if gai_service.ready_at is not None:
+        report["ready_ms"] = round((gai_service.ready_at - IMPORT_STARTED) * 1000, 1)
+    report.update(gai_service.startup)
+    return report
+
+def _warm_up_done(future: asyncio.Future) -> None:
+    if future.cancelled() or future.exception() is not None:
+        logger.error("GAI warm-up failed: %s", gai_service.startup_error)
+        return
+    logger.info("Ready to serve LLM requests %.0f ms after start", startup_report()["ready_ms"])
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Accept traffic as soon as the app is built; backend detection and chain
+    compilation run in the background per LINKEDIN_GAI_WARM_UP:
+        background (default): start warm-up now, /ready turns 200 when it completes
+        blocking: finish warm-up before accepting requests
+        lazy: warm up on the first LLM request
+    """
+    mode = os.getenv("LINKEDIN_GAI_WARM_UP", "background")
+    if mode != "lazy":
+        warm = gai_service.start_warm_up()
+        warm.add_done_callback(_warm_up_done)
+        if mode == "blocking":
+            await warm
+    startup_timings["accepting_ms"] = _elapsed_ms()
+    if startup_timings["accepting_ms"] > COLD_START_BUDGET_MS:
+        logger.warning("Cold start took %.0f ms, over the %.0f ms budget", startup_timings["accepting_ms"], COLD_START_BUDGET_MS)
+    else:
+        logger.info("Accepting requests %.0f ms after start", startup_timings["accepting_ms"])
+    task_queue.start()
+    yield
+    await task_queue.stop()
+
+app = FastAPI(
+    title="Career Companion LinkedIn GAI API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
+)
 
 # Enable CORS for frontend integration
 app.add_middleware(
@@ -39,8 +98,43 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize LinkedIn GAI service
-gai_service = LinkedInGAIService()
+# Per-request deadline (X-Request-Timeout) and cancellation when the client disconnects
+app.add_middleware(DeadlineMiddleware)
+# Request counts and latency per route, outermost so it sees cancelled requests too
+app.add_middleware(metrics.MetricsMiddleware)
+
+# Initialize LinkedIn GAI service; the GAI backend and chains are loaded by the lifespan warm-up
+gai_service = LinkedInGAIService(lazy=True)
+
+# Per-endpoint concurrency limits and wait queues in front of the LLM gateway
+admission = AdmissionController(["generate_resume", "analyze_job_match", "generate_post", "polish_resume"])
+
+# Background worker pool behind /api/tasks; task records are shared across workers through the cache file
+task_queue = TaskQueue(
+    workers=int(os.getenv("LINKEDIN_GAI_TASK_WORKERS", "4")),
+    max_queued=int(os.getenv("LINKEDIN_GAI_TASK_QUEUE", "100")),
+    ttl_seconds=float(os.getenv("LINKEDIN_GAI_TASK_TTL", "3600")),
+    task_timeout=float(os.getenv("LINKEDIN_GAI_TASK_TIMEOUT", "300")),
+    path=os.getenv("LINKEDIN_GAI_CACHE_PATH") or None,
+)
+# Longest a GET /api/tasks/{task_id}?wait= long-poll is held open
+TASK_MAX_WAIT = float(os.getenv("LINKEDIN_GAI_TASK_MAX_WAIT", "25"))
+
+@app.exception_handler(Overloaded)
+async def overloaded_handler(request: Request, exc: Overloaded) -> ORJSONResponse:
+    """Fail fast with 429 when an endpoint's wait queue is full"""
+    logger.warning("Rejected %s request: %s", exc.name, exc.reason)
+    return ORJSONResponse(
+        {"success": False, "error": str(exc)},
+        status_code=429,
+        headers={"Retry-After": str(exc.retry_after)}
+    )
+
+@app.exception_handler(DeadlineExceeded)
+async def deadline_exceeded_handler(request: Request, exc: DeadlineExceeded) -> ORJSONResponse:
+    """Report an expired request deadline as 504, distinct from generation errors"""
+    logger.warning("Request %s timed out: %s", request.url.path, exc)
+    return ORJSONResponse({"success": False, "error": str(exc), "timed_out": True}, status_code=504)
 
 # Request/Response Models
 class ResumeGenerationRequest(BaseModel):
@@ -48,20 +142,73 @@ class ResumeGenerationRequest(BaseModel):
     target_role: Optional[str] = None
     user_profile: Optional[Dict[str, Any]] = None
     linkedin_profile: Optional[Dict[str, Any]] = None
+    # "sections" generates resume sections concurrently, "single" uses one prompt; None uses LINKEDIN_GAI_RESUME_MODE
+    mode: Optional[Literal["single", "sections"]] = None
+    # False skips the stored resume for this URL, role and profile and generates a new version
+    reuse: bool = True
+    timeout_seconds: Optional[float] = None
+
+class ResumeInvalidateRequest(BaseModel):
+    linkedin_url: str
+    target_role: Optional[str] = None
 
 class JobMatchRequest(BaseModel):
     user_skills: List[str]
     job_requirements: str
     job_description: str
+    job_id: Optional[str] = None
+    local_only: bool = False
+    timeout_seconds: Optional[float] = None
+
+class JobMatchBatchItem(BaseModel):
+    id: Optional[str] = None
+    job_requirements: str
+    job_description: str
+
+class JobMatchBatchRequest(BaseModel):
+    user_skills: List[str]
+    jobs: List[JobMatchBatchItem]
+    concurrency: Optional[int] = None
+    local_only: bool = False
+    timeout_seconds: Optional[float] = None
+
+class IndexedJob(BaseModel):
+    id: str
+    title: Optional[str] = None
+    job_requirements: str = ""
+    job_description: str = ""
+    skills: Optional[List[str]] = None
+
+class JobIndexRequest(BaseModel):
+    jobs: List[IndexedJob]
+
+class JobRankRequest(BaseModel):
+    user_skills: List[str]
+    top_k: int = 20
+    analyze: bool = False
+    concurrency: Optional[int] = None
+    timeout_seconds: Optional[float] = None
 
 class LinkedInPostRequest(BaseModel):
     topic: str
     details: Optional[str] = None
     user_profile: Optional[Dict[str, Any]] = None
+    timeout_seconds: Optional[float] = None
 
 class ResumePolishRequest(BaseModel):
     resume_data: Dict[str, Any]
     job_data: Dict[str, Any]
+    # "incremental" reuses suggestions for sections unchanged since the last polish, "full" re-polishes everything;
+    # None uses LINKEDIN_GAI_POLISH_MODE
+    mode: Optional[Literal["full", "incremental"]] = None
+    # Fill keywordOptimization from the local keyword engine instead of the LLM; None uses LINKEDIN_GAI_LOCAL_KEYWORDS
+    local_keywords: Optional[bool] = None
+    timeout_seconds: Optional[float] = None
+
+class KeywordGapRequest(BaseModel):
+    resume_data: Dict[str, Any]
+    job_data: Dict[str, Any]
+    top_k: int = 20
 
 class APIResponse(BaseModel):
     success: bool
@@ -71,115 +218,460 @@ class APIResponse(BaseModel):
     polishing_suggestions: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
 
+async def _sse_response(events, operation: Optional[str] = None) -> StreamingResponse:
+    """
+    Format service events ({"event", "data"}) as a Server-Sent Events stream.
+
+    With an operation name, a full admission queue is rejected with 429 before
+    the response starts; the slot itself is taken inside the body generator and
+    held until the stream ends, so a response whose body never runs (client
+    gone, handler cancelled) holds no slot.
+    """
+    limiter = admission[operation] if operation else None
+    if limiter:
+        limiter.check()
+
+    async def stream():
+        try:
+            if limiter:
+                await limiter.acquire()
+        except (Overloaded, DeadlineExceeded) as e:
+            logger.warning("Stream not admitted: %s", e)
+            error = {"error": str(e)}
+            error.update({"retry_after": e.retry_after} if isinstance(e, Overloaded) else {"timed_out": True})
+            yield b"event: error\ndata: " + orjson.dumps(error) + b"\n\n"
+            return
+        started = time.monotonic()
+        try:
+            async for event in events:
+                yield b"event: " + event["event"].encode() + b"\ndata: " + orjson.dumps(event["data"]) + b"\n\n"
+        except DeadlineExceeded as e:
+            logger.warning("Stream timed out: %s", e)
+            yield b"event: error\ndata: " + orjson.dumps({"error": str(e), "timed_out": True}) + b"\n\n"
+        finally:
+            if limiter:
+                limiter.release(time.monotonic() - started)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+def api_content(success: bool, **fields: Any) -> Dict[str, Any]:
+    """An APIResponse-shaped dict, every field present"""
+    content = dict.fromkeys(APIResponse.model_fields)
+    content.update(fields, success=success)
+    return content
+
+def api_response(success: bool, **fields: Any) -> ORJSONResponse:
+    """Serialize an APIResponse-shaped payload exactly once, skipping response_model re-encoding"""
+    return ORJSONResponse(api_content(success, **fields))
+
 @app.get("/health")
 async def health_check():
-    """Health check endpoint"""
+    """Liveness check: the process is up and serving, whether or not warm-up has finished"""
     return {
         "status": "healthy",
+        "ready": gai_service.ready,
         "gai_available": gai_service.gai_available,
         "service": "Career Companion LinkedIn GAI API"
     }
 
+@app.get("/ready")
+async def readiness_check():
+    """Readiness check: 200 once the GAI backend is detected and chains are compiled, 503 before"""
+    content = {
+        "ready": gai_service.ready,
+        "gai_available": gai_service.gai_available,
+        "startup": startup_report(),
+        "cold_start_budget_ms": COLD_START_BUDGET_MS,
+    }
+    if gai_service.startup_error:
+        content["error"] = gai_service.startup_error
+    return ORJSONResponse(content, status_code=200 if gai_service.ready else 503)
+
 @app.post("/api/linkedin/generate-resume", response_model=APIResponse)
 async def generate_resume_endpoint(request: ResumeGenerationRequest):
     """Generate resume from LinkedIn profile using LinkedIn GAI"""
-    logger.info(f"Received resume generation request: linkedin_url={request.linkedin_url}, target_role={request.target_role}")
-    logger.info(f"User profile provided: {request.user_profile is not None}")
+    deadlines.tighten(request.timeout_seconds)
+    logger.info("Received resume generation request: linkedin_url=%s, target_role=%s", request.linkedin_url, request.target_role)
+    logger.info("User profile provided: %s", request.user_profile is not None)
     
-    try:
-        resume_content_str = await gai_service.generate_resume_from_profile(
-            linkedin_url=request.linkedin_url,
-            target_role=request.target_role,
-            user_profile=request.user_profile
-        )
-        
-        # Parse JSON string to dictionary for APIResponse
-        import json
-        resume_content = json.loads(resume_content_str) if resume_content_str else None
+    async with admission.slot("generate_resume"):
+        try:
+            resume_content = await gai_service.generate_resume_from_profile(
+                linkedin_url=request.linkedin_url,
+                target_role=request.target_role,
+                user_profile=request.user_profile,
+                sectioned=None if request.mode is None else request.mode == "sections",
+                reuse=request.reuse,
+            )
         
-        logger.info(f"Successfully generated resume, content length: {len(resume_content_str) if resume_content_str else 0}")
+            logger.info("Successfully generated resume, sections: %s", list(resume_content) if resume_content else [])
         
-        return APIResponse(
-            success=True,
-            resume_content=resume_content
-        )
+            return api_response(
+                success=True,
+                resume_content=resume_content
+            )
     
-    except Exception as e:
-        logger.error(f"Failed to generate resume: {str(e)}", exc_info=True)
-        return APIResponse(
-            success=False,
-            error=f"Failed to generate resume: {str(e)}"
-        )
+        except DeadlineExceeded:
+            raise
+        except Exception as e:
+            logger.error("Failed to generate resume: %s", e, exc_info=True)
+            return api_response(
+                success=False,
+                error=f"Failed to generate resume: {str(e)}"
+            )
+
+@app.post("/api/linkedin/generate-resume/stream")
+async def generate_resume_stream_endpoint(request: ResumeGenerationRequest):
+    """Generate resume from LinkedIn profile, streaming tokens over Server-Sent Events"""
+    deadlines.tighten(request.timeout_seconds)
+    logger.info("Received streaming resume generation request: linkedin_url=%s, target_role=%s", request.linkedin_url, request.target_role)
+    events = gai_service.stream_resume_from_profile(
+        linkedin_url=request.linkedin_url,
+        target_role=request.target_role,
+        user_profile=request.user_profile
+    )
+    return await _sse_response(events, "generate_resume")
+
+# The store endpoints are plain defs: FastAPI runs them in its threadpool, so SQLite I/O stays off the event loop
+def _resume_store():
+    if gai_service.resume_store is None:
+        raise HTTPException(status_code=503, detail="Resume store is disabled (LINKEDIN_GAI_RESUME_STORE=0)")
+    return gai_service.resume_store
+
+@app.get("/api/resumes")
+def list_resume_versions_endpoint(linkedin_url: str, target_role: Optional[str] = None, include_invalidated: bool = True):
+    """Stored resume versions for a LinkedIn URL (and role), newest first, without their content"""
+    versions = _resume_store().versions(linkedin_url, target_role, include_invalidated=include_invalidated)
+    return {"success": True, "versions": versions}
+
+@app.get("/api/resumes/{version_id}")
+def get_resume_version_endpoint(version_id: int):
+    """One stored resume version with its content"""
+    record = _resume_store().get(version_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail=f"No stored resume version {version_id}")
+    return {"success": True, **record}
+
+@app.post("/api/resumes/invalidate")
+def invalidate_resumes_endpoint(request: ResumeInvalidateRequest):
+    """Stop serving the stored resumes of a LinkedIn URL (or one of its roles), e.g. after the profile changed"""
+    count = _resume_store().invalidate(request.linkedin_url, request.target_role)
+    logger.info("Invalidated %d stored resume(s) for %s", count, request.linkedin_url)
+    return {"success": True, "invalidated": count}
 
 @app.post("/api/linkedin/analyze-job-match", response_model=APIResponse)
 async def analyze_job_match_endpoint(request: JobMatchRequest):
     """Analyze job compatibility using LinkedIn GAI"""
+    deadlines.tighten(request.timeout_seconds)
     try:
-        match_analysis = await gai_service.analyze_job_compatibility(
-            user_skills=request.user_skills,
-            job_requirements=request.job_requirements,
-            job_description=request.job_description
-        )
+        if request.local_only:
+            match_analysis = gai_service.estimate_job_compatibility(
+                user_skills=request.user_skills,
+                job_requirements=request.job_requirements,
+                job_description=request.job_description
+            )
+        else:
+            async with admission.slot("analyze_job_match"):
+                match_analysis = await gai_service.analyze_job_compatibility(
+                    user_skills=request.user_skills,
+                    job_requirements=request.job_requirements,
+                    job_description=request.job_description,
+                    job_id=request.job_id
+                )
         
-        return APIResponse(
+        return api_response(
             success=True,
             match_analysis=match_analysis
         )
     
+    except (DeadlineExceeded, Overloaded):
+        raise
     except Exception as e:
-        return APIResponse(
+        return api_response(
             success=False,
             error=f"Failed to analyze job match: {str(e)}"
         )
 
+def _batch_concurrency(requested: Optional[int]) -> int:
+    """
+    Analyses a batch may run at once: the requested width (default LINKEDIN_GAI_BATCH_CONCURRENCY),
+    capped by LINKEDIN_GAI_BATCH_MAX_CONCURRENCY and by the analyze_job_match admission limit,
+    so one batch never queues more items than the endpoint can run
+    """
+    concurrency = requested or int(os.getenv("LINKEDIN_GAI_BATCH_CONCURRENCY", "8"))
+    max_concurrency = int(os.getenv("LINKEDIN_GAI_BATCH_MAX_CONCURRENCY", "32"))
+    return max(1, min(concurrency, max_concurrency, admission["analyze_job_match"].max_concurrency))
+
+@app.post("/api/linkedin/analyze-job-match/batch")
+async def analyze_job_match_batch_endpoint(request: JobMatchBatchRequest):
+    """Analyze job compatibility for many jobs, streaming NDJSON results as each finishes"""
+    deadlines.tighten(request.timeout_seconds)
+    concurrency = _batch_concurrency(request.concurrency)
+    jobs = [job.model_dump() for job in request.jobs]
+    logger.info("Received batch job match request: %s jobs, concurrency=%s", len(jobs), concurrency or 'default')
+    if not request.local_only:
+        # Each item takes an analyze_job_match slot; a saturated endpoint rejects the whole batch up front
+        admission["analyze_job_match"].check()
+
+    async def stream_results():
+        async for item in gai_service.analyze_job_compatibility_batch(
+            user_skills=request.user_skills,
+            jobs=jobs,
+            concurrency=concurrency,
+            local_only=request.local_only,
+            admit=admission["analyze_job_match"].slot
+        ):
+            yield orjson.dumps(item) + b"\n"
+
+    return StreamingResponse(stream_results(), media_type="application/x-ndjson")
+
+@app.post("/api/jobs/index")
+async def index_jobs_endpoint(request: JobIndexRequest):
+    """Add or update jobs in the local skill index used for ranking"""
+    total = gai_service.index_jobs([job.model_dump() for job in request.jobs])
+    return {"success": True, "indexed": len(request.jobs), "total": total}
+
+@app.delete("/api/jobs/index/{job_id}")
+async def remove_indexed_job_endpoint(job_id: str):
+    """Remove a job from the local skill index"""
+    removed = gai_service.job_index.remove_job(job_id)
+    if not removed:
+        raise HTTPException(status_code=404, detail=f"Job not indexed: {job_id}")
+    return {"success": True, "total": len(gai_service.job_index)}
+
+@app.post("/api/jobs/features")
+async def job_features_endpoint(request: JobIndexRequest):
+    """Precompute normalized text, skills, ATS keywords and a summary for jobs, reused by later match and polish calls"""
+    features = [
+        gai_service.job_features.features(
+            job.job_requirements, job.job_description, job_id=job.id, title=job.title, skills=job.skills
+        ).to_dict()
+        for job in request.jobs
+    ]
+    return {"success": True, "features": features}
+
+@app.get("/api/jobs/{job_id}/features")
+async def get_job_features_endpoint(job_id: str):
+    """Features last computed for a job"""
+    features = gai_service.job_features.get(job_id)
+    if features is None:
+        raise HTTPException(status_code=404, detail=f"No features stored for job: {job_id}")
+    return {"success": True, "features": features.to_dict()}
+
+@app.post("/api/jobs/rank")
+async def rank_jobs_endpoint(request: JobRankRequest):
+    """Shortlist the top K indexed jobs for a skill set, optionally analyzing only the shortlist with LinkedIn GAI"""
+    deadlines.tighten(request.timeout_seconds)
+    if request.analyze:
+        admission["analyze_job_match"].check()
+    try:
+        results = await gai_service.rank_jobs(
+            user_skills=request.user_skills,
+            top_k=request.top_k,
+            analyze=request.analyze,
+            concurrency=_batch_concurrency(request.concurrency),
+            admit=admission["analyze_job_match"].slot
+        )
+        return {"success": True, "results": results, "indexed_jobs": len(gai_service.job_index)}
+    except (DeadlineExceeded, Overloaded):
+        raise
+    except Exception as e:
+        logger.error("Failed to rank jobs: %s", e, exc_info=True)
+        return {"success": False, "results": [], "error": f"Failed to rank jobs: {str(e)}"}
+
 @app.post("/api/linkedin/generate-post", response_model=APIResponse)
 async def generate_linkedin_post_endpoint(request: LinkedInPostRequest):
     """Generate LinkedIn post using LinkedIn GAI"""
-    try:
-        post_result = await gai_service.generate_linkedin_post(
-            topic=request.topic,
-            details=request.details,
-            tone="professional"
-        )
+    deadlines.tighten(request.timeout_seconds)
+    async with admission.slot("generate_post"):
+        try:
+            post_result = await gai_service.generate_linkedin_post(
+                topic=request.topic,
+                details=request.details,
+                tone="professional"
+            )
         
-        return APIResponse(
-            success=post_result.get("success", False),
-            post_content=post_result.get("post_content", ""),
-            error=post_result.get("error")
-        )
+            return api_response(
+                success=post_result.get("success", False),
+                post_content=post_result.get("post_content", ""),
+                error=post_result.get("error")
+            )
     
-    except Exception as e:
-        return APIResponse(
-            success=False,
-            error=f"Failed to generate LinkedIn post: {str(e)}"
-        )
+        except DeadlineExceeded:
+            raise
+        except Exception as e:
+            return api_response(
+                success=False,
+                error=f"Failed to generate LinkedIn post: {str(e)}"
+            )
+
+@app.post("/api/linkedin/generate-post/stream")
+async def generate_linkedin_post_stream_endpoint(request: LinkedInPostRequest):
+    """Generate LinkedIn post, streaming tokens over Server-Sent Events"""
+    deadlines.tighten(request.timeout_seconds)
+    events = gai_service.stream_linkedin_post(
+        topic=request.topic,
+        details=request.details,
+        tone="professional"
+    )
+    return await _sse_response(events, "generate_post")
 
 @app.post("/api/resume/polish", response_model=APIResponse)
 async def polish_resume_endpoint(request: ResumePolishRequest):
     """Polish resume for specific job using LinkedIn GAI"""
-    logger.info(f"Received resume polishing request for job: {request.job_data.get('title', 'Unknown')}")
-    logger.info(f"Resume data provided: {bool(request.resume_data)}")
+    deadlines.tighten(request.timeout_seconds)
+    logger.info("Received resume polishing request for job: %s", request.job_data.get('title', 'Unknown'))
+    logger.info("Resume data provided: %s", bool(request.resume_data))
     
-    try:
-        polish_result = await gai_service.polish_resume_for_job(
-            resume_data=request.resume_data,
-            job_data=request.job_data
-        )
+    async with admission.slot("polish_resume"):
+        try:
+            polish_result = await gai_service.polish_resume_for_job(
+                resume_data=request.resume_data,
+                job_data=request.job_data,
+                incremental=None if request.mode is None else request.mode == "incremental",
+                local_keywords=request.local_keywords,
+            )
         
-        logger.info(f"Resume polishing completed: success={polish_result.get('success', False)}")
+            logger.info("Resume polishing completed: success=%s", polish_result.get('success', False))
+            if "incremental" in polish_result:
+                logger.info("Incremental polish: %s", polish_result["incremental"])
         
-        return APIResponse(
-            success=polish_result.get("success", False),
-            polishing_suggestions=polish_result.get("polishingSuggestions"),
-            error=polish_result.get("error")
-        )
+            return api_response(
+                success=polish_result.get("success", False),
+                polishing_suggestions=polish_result.get("polishingSuggestions"),
+                error=polish_result.get("error")
+            )
     
-    except Exception as e:
-        logger.error(f"Failed to polish resume: {str(e)}", exc_info=True)
-        return APIResponse(
-            success=False,
-            error=f"Failed to polish resume: {str(e)}"
+        except DeadlineExceeded:
+            raise
+        except Exception as e:
+            logger.error("Failed to polish resume: %s", e, exc_info=True)
+            return api_response(
+                success=False,
+                error=f"Failed to polish resume: {str(e)}"
+            )
+
+@app.post("/api/resume/keyword-gaps")
+def keyword_gaps_endpoint(request: KeywordGapRequest):
+    """ATS keyword gaps of a resume for a job from local TF-IDF statistics, without calling LinkedIn GAI (CPU-bound, so it runs in the threadpool)"""
+    return {"success": True, **gai_service.keyword_gaps(request.resume_data, request.job_data, top_k=request.top_k)}
+
+@app.post("/api/resume/polish/stream")
+async def polish_resume_stream_endpoint(request: ResumePolishRequest):
+    """Polish resume for specific job, streaming each suggestion over Server-Sent Events as it completes"""
+    deadlines.tighten(request.timeout_seconds)
+    events = gai_service.stream_polish_resume_for_job(
+        resume_data=request.resume_data,
+        job_data=request.job_data,
+        incremental=None if request.mode is None else request.mode == "incremental",
+        local_keywords=request.local_keywords,
+    )
+    return await _sse_response(events, "polish_resume")
+
+# Task handlers call the service directly: the queue's worker pool is their admission limit,
+# and a failure raises so the task is recorded as failed with the error
+async def _generate_resume_task(payload: Dict[str, Any]) -> Dict[str, Any]:
+    request = ResumeGenerationRequest(**payload)
+    resume_content = await gai_service.generate_resume_from_profile(
+        linkedin_url=request.linkedin_url,
+        target_role=request.target_role,
+        user_profile=request.user_profile,
+        sectioned=None if request.mode is None else request.mode == "sections",
+        reuse=request.reuse,
+    )
+    return api_content(True, resume_content=resume_content)
+
+async def _analyze_job_match_task(payload: Dict[str, Any]) -> Dict[str, Any]:
+    request = JobMatchRequest(**payload)
+    if request.local_only:
+        match_analysis = gai_service.estimate_job_compatibility(
+            user_skills=request.user_skills,
+            job_requirements=request.job_requirements,
+            job_description=request.job_description
+        )
+    else:
+        match_analysis = await gai_service.analyze_job_compatibility(
+            user_skills=request.user_skills,
+            job_requirements=request.job_requirements,
+            job_description=request.job_description,
+            job_id=request.job_id
         )
+    return api_content(True, match_analysis=match_analysis)
+
+async def _generate_post_task(payload: Dict[str, Any]) -> Dict[str, Any]:
+    request = LinkedInPostRequest(**payload)
+    post_result = await gai_service.generate_linkedin_post(topic=request.topic, details=request.details, tone="professional")
+    return api_content(
+        post_result.get("success", False),
+        post_content=post_result.get("post_content", ""),
+        error=post_result.get("error")
+    )
+
+async def _polish_resume_task(payload: Dict[str, Any]) -> Dict[str, Any]:
+    request = ResumePolishRequest(**payload)
+    polish_result = await gai_service.polish_resume_for_job(
+        resume_data=request.resume_data,
+        job_data=request.job_data,
+        incremental=None if request.mode is None else request.mode == "incremental",
+        local_keywords=request.local_keywords,
+    )
+    return api_content(
+        polish_result.get("success", False),
+        polishing_suggestions=polish_result.get("polishingSuggestions"),
+        error=polish_result.get("error")
+    )
+
+# Operations runnable as tasks: request model and handler
+TASK_OPERATIONS = {
+    "generate_resume": (ResumeGenerationRequest, _generate_resume_task),
+    "analyze_job_match": (JobMatchRequest, _analyze_job_match_task),
+    "generate_post": (LinkedInPostRequest, _generate_post_task),
+    "polish_resume": (ResumePolishRequest, _polish_resume_task),
+}
+
+for _operation, (_model, _handler) in TASK_OPERATIONS.items():
+    task_queue.register(_operation, _handler)
+
+def _task_response(record: Dict[str, Any], status_code: int = 200) -> ORJSONResponse:
+    content = {"success": True, **record, "status_url": f"/api/tasks/{record['task_id']}"}
+    return ORJSONResponse(content, status_code=status_code)
+
+@app.post("/api/tasks/{operation}")
+async def submit_task_endpoint(operation: str, payload: Dict[str, Any]):
+    """
+    Queue a generation and return its task id at once (202); the body is the
+    operation's regular request. Poll GET /api/tasks/{task_id} for the result.
+    """
+    if operation not in TASK_OPERATIONS:
+        raise HTTPException(status_code=404, detail=f"Unknown task operation: {operation}")
+    model, _ = TASK_OPERATIONS[operation]
+    try:
+        request = model(**payload)
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=e.errors(include_url=False))
+    record = task_queue.submit(operation, request.model_dump(), timeout_seconds=request.timeout_seconds)
+    logger.info("Queued %s task %s", operation, record["task_id"])
+    return _task_response(record, status_code=202)
+
+@app.get("/api/tasks/{task_id}")
+async def get_task_endpoint(task_id: str, wait: float = 0):
+    """Task status and, once finished, its result; wait=N long-polls up to N seconds for completion"""
+    record = await task_queue.wait(task_id, min(max(wait, 0.0), TASK_MAX_WAIT))
+    if record is None:
+        raise HTTPException(status_code=404, detail="Task not found or expired")
+    return _task_response(record)
+
+@app.delete("/api/tasks/{task_id}")
+async def cancel_task_endpoint(task_id: str):
+    """Cancel a queued or running task"""
+    record = task_queue.cancel(task_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail="Task not found on this worker")
+    return _task_response(record)
 
 @app.get("/api/service/status")
 async def service_status():
@@ -187,27 +679,142 @@ async def service_status():
     return {
         "linkedin_gai_available": gai_service.gai_available,
         "service_type": "Real LinkedIn GAI" if gai_service.gai_available else "Mock Implementation",
+        "ready": gai_service.ready,
+        "startup": startup_report(),
         "endpoints": [
             "/api/linkedin/generate-resume",
+            "/api/linkedin/generate-resume/stream",
+            "/api/resumes",
             "/api/linkedin/analyze-job-match", 
+            "/api/linkedin/analyze-job-match/batch",
+            "/api/jobs/index",
+            "/api/jobs/features",
+            "/api/jobs/rank",
             "/api/linkedin/generate-post",
-            "/api/resume/polish"
-        ]
+            "/api/linkedin/generate-post/stream",
+            "/api/resume/polish",
+            "/api/resume/polish/stream",
+            "/api/resume/keyword-gaps",
+            "/api/tasks/{operation}",
+            "/api/tasks/{task_id}"
+        ],
+        "caches": gai_service.cache_stats(),
+        "context_compaction": gai_service.compactor.stats(),
+        "generation": gai_service.generation.stats(),
+        "in_flight": gai_service.inflight.stats(),
+        "shared_flight": gai_service.shared_flight.stats() if gai_service.shared_flight else None,
+        "worker_pid": os.getpid(),
+        "admission": admission.stats(),
+        "call_outcomes": gai_service.call_outcomes,
+        "circuit_breaker": gai_service.breaker_stats(),
+        "client_disconnects": deadlines.stats()["disconnects"],
+        "job_index": gai_service.job_index.stats(),
+        "job_features": gai_service.job_features.stats(),
+        "keyword_engine": gai_service.keyword_engine.stats(),
+        "tasks": task_queue.stats(),
+        "resume_store": gai_service.resume_store.stats() if gai_service.resume_store else None,
+        "logging": log_pipeline.stats()
     }
 
+def _collect_service_metrics():
+    """Expose service-owned counters (caches, breaker, queues) as metric families on each scrape"""
+    caches = gai_service.cache_stats()
+    yield "gai_cache_hits_total", "counter", "Result cache hits", [({"cache": name}, c["hits"]) for name, c in caches.items()]
+    yield "gai_cache_misses_total", "counter", "Result cache misses", [({"cache": name}, c["misses"]) for name, c in caches.items()]
+    yield "gai_cache_evictions_total", "counter", "Result cache LRU evictions", [({"cache": name}, c["evictions"]) for name, c in caches.items()]
+    yield "gai_cache_entries", "gauge", "Result cache in-memory entries", [({"cache": name}, c["size"]) for name, c in caches.items()]
+
+    outcomes = [
+        ({"operation": operation, "outcome": outcome}, count)
+        for operation, counts in gai_service.call_outcomes.items()
+        for outcome, count in counts.items()
+    ]
+    yield "gai_llm_calls_total", "counter", "LLM calls by operation and outcome", outcomes
+
+    inflight = gai_service.inflight.stats()
+    yield "gai_coalesced_calls_total", "counter", "Calls that joined an identical in-flight LLM call", [({}, inflight["coalesced"])]
+    if gai_service.shared_flight is not None:
+        shared = gai_service.shared_flight.stats()
+        yield "gai_shared_flight_calls_total", "counter", "LLM calls coordinated with other worker processes, by role", [
+            ({"role": role}, shared[role]) for role in ("led", "followed", "taken_over")
+        ]
+
+    breaker = gai_service.breaker_stats()
+    yield "gai_circuit_open", "gauge", "1 while the gateway circuit is open or half-open", [({}, 0 if breaker["state"] == "closed" else 1)]
+    yield "gai_circuit_rejected_total", "counter", "Calls rejected by the open circuit", [({}, breaker["rejected"])]
+
+    queues = admission.stats()
+    yield "gai_admission_active", "gauge", "Requests holding an admission slot", [({"operation": name}, q["active"]) for name, q in queues.items()]
+    yield "gai_admission_queued", "gauge", "Requests waiting for an admission slot", [({"operation": name}, q["queued"]) for name, q in queues.items()]
+    yield "gai_admission_rejected_total", "counter", "Requests rejected with 429", [({"operation": name}, q["rejected"]) for name, q in queues.items()]
+
+    tasks = task_queue.stats()
+    yield "gai_tasks_queued", "gauge", "Tasks waiting for a task worker", [({}, tasks["queued"])]
+    yield "gai_tasks_running", "gauge", "Tasks being run by a task worker", [({}, tasks["running"])]
+    yield "gai_tasks_total", "counter", "Finished and rejected tasks by outcome", [
+        ({"outcome": outcome}, tasks[outcome]) for outcome in ("succeeded", "failed", "cancelled", "rejected")
+    ]
+
+    if gai_service.resume_store is not None:
+        store = gai_service.resume_store.stats()
+        yield "gai_resume_store_lookups_total", "counter", "Stored resume lookups by result", [({"result": "hit"}, store["hits"]), ({"result": "miss"}, store["misses"])]
+        yield "gai_resume_store_versions", "gauge", "Stored resume versions", [({"state": "valid"}, store["valid"]), ({"state": "invalidated"}, store["versions"] - store["valid"])]
+
+    generation = gai_service.generation.stats()["operations"]
+    yield "gai_max_tokens", "gauge", "max_tokens chosen for the latest call", [
+        ({"operation": name}, g["last_max_tokens"]) for name, g in generation.items() if g["last_max_tokens"] is not None
+    ]
+    yield "gai_truncated_outputs_total", "counter", "LLM outputs that reached max_tokens", [({"operation": name}, g["truncated"]) for name, g in generation.items()]
+
+    yield "gai_ready", "gauge", "1 once the GAI backend and chains are loaded", [({}, 1 if gai_service.ready else 0)]
+    yield "gai_startup_seconds", "gauge", "Cold-start milestones and warm-up phases", [({"phase": name[:-3]}, round(ms / 1000, 4)) for name, ms in startup_report().items()]
+
+    yield "gai_client_disconnects_total", "counter", "Requests cancelled because the client disconnected", [({}, deadlines.stats()["disconnects"])]
+    yield "gai_log_records_dropped_total", "counter", "Log records dropped because the log queue was full", [({}, log_pipeline.stats()["dropped"])]
+
+metrics.REGISTRY.add_collector(_collect_service_metrics)
+
+@app.get("/metrics")
+async def metrics_endpoint():
+    """Prometheus metrics in text exposition format"""
+    return PlainTextResponse(metrics.REGISTRY.render(), media_type="text/plain; version=0.0.4")
+
+@app.post("/api/service/reload-chains")
+async def reload_chains():
+    """Recompile prompt templates and chains without restarting the server"""
+    try:
+        await gai_service.ensure_ready()
+        operations = gai_service.reload_chains()
+        return {"success": True, "operations": operations}
+    except Exception as e:
+        logger.error("Failed to reload chains: %s", e, exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Failed to reload chains: {str(e)}")
+
+startup_timings["import_ms"] = _elapsed_ms()
+
 if __name__ == "__main__":
     port = int(os.getenv("PORT", 8000))
     host = os.getenv("HOST", "0.0.0.0")
+    # Auto-reload watches the source tree and re-imports the app in a child process; development only
+    dev_mode = os.getenv("LINKEDIN_GAI_ENV", "production") == "development" or "--reload" in sys.argv
+    # Worker processes, each with its own event loop; reload supports only one
+    workers = 1 if dev_mode else max(1, int(os.getenv("LINKEDIN_GAI_WORKERS", "1")))
+    if workers > 1:
+        # Workers share results and in-flight LLM calls through this SQLite file (inherited by the worker processes)
+        os.environ.setdefault("LINKEDIN_GAI_CACHE_PATH", "gai_cache.sqlite3")
     
     print(f"🚀 Starting Career Companion LinkedIn GAI API server...")
     print(f"📍 Server: http://{host}:{port}")
-    print(f"🔗 LinkedIn GAI Available: {gai_service.gai_available}")
+    print(f"🔁 Auto-reload: {dev_mode}")
+    print(f"👥 Workers: {workers}" + (f" (shared cache: {os.environ['LINKEDIN_GAI_CACHE_PATH']})" if workers > 1 else ""))
     print(f"📚 API Docs: http://{host}:{port}/docs")
     
     uvicorn.run(
-        "api_server:app",
+        # reload and workers need an import string; otherwise serve this module's app instead of importing it a second time
+        "api_server:app" if dev_mode or workers > 1 else app,
         host=host,
         port=port,
-        reload=True,
+        reload=dev_mode,
+        workers=workers,
         log_level="info"
     )
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Benchmark resume response serialization
+Compares the old dict -> JSON string -> dict -> FastAPI encode path with a single orjson encode
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+# Add the python-backend directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from api_server import APIResponse, api_response
+
+
+def build_resume(roles: int, achievements: int) -> dict:
+    """A large, realistic resume payload"""
+    return {
+        "personalInfo": {
+            "name": "Benchmark Candidate",
+            "email": "candidate@example.com",
+            "phone": "+1-555-0100",
+            "location": "Sunnyvale, California, United States",
+            "linkedinUrl": "https://www.linkedin.com/in/benchmark"
+        },
+        "summary": "Engineer building search, recommendation and LLM agent systems at scale. " * 8,
+        "experience": [
+            {
+                "title": f"Senior Staff Software Engineer {i}",
+                "company": f"Company {i}",
+                "duration": "2018 - 2024",
+                "achievements": [
+                    f"Led a cross-functional effort {j} that improved relevance metrics by {j + 3}% across key surfaces"
+                    for j in range(achievements)
+                ]
+            }
+            for i in range(roles)
+        ],
+        "skills": [f"Skill {i}" for i in range(80)],
+        "education": [
+            {"degree": "M.S. Computer Science", "institution": "University", "year": "2012"}
+        ]
+    }
+
+
+def old_path(resume: dict) -> bytes:
+    """Service json.dumps(indent=2), endpoint json.loads, FastAPI validate + encode + json.dumps"""
+    resume_content_str = json.dumps(resume, indent=2)
+    resume_content = json.loads(resume_content_str)
+    response = APIResponse(success=True, resume_content=resume_content)
+    return JSONResponse(jsonable_encoder(response)).body
+
+
+def new_path(resume: dict) -> bytes:
+    """Service returns the dict, endpoint serializes it once with orjson"""
+    return api_response(True, resume_content=resume).body
+
+
+def measure(fn, resume: dict, iterations: int) -> dict:
+    fn(resume)  # warm up
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    for _ in range(iterations):
+        fn(resume)
+    cpu = time.process_time() - cpu_start
+    wall = time.perf_counter() - wall_start
+
+    tracemalloc.start()
+    fn(resume)
+    _, peak = tracemalloc.get_traced_memory()
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(stat.size for stat in snapshot.statistics("filename"))
+
+    return {
+        "cpu_us_per_request": cpu / iterations * 1e6,
+        "wall_us_per_request": wall / iterations * 1e6,
+        "peak_alloc_kb": peak / 1024,
+        "retained_alloc_kb": allocated / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--roles", type=int, default=40, help="experience entries in the resume")
+    parser.add_argument("--achievements", type=int, default=12, help="achievements per experience entry")
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    resume = build_resume(args.roles, args.achievements)
+    assert json.loads(old_path(resume)) == json.loads(new_path(resume))
+
+    print(f"Resume size: {len(json.dumps(resume)) / 1024:.1f} KB, {args.iterations} iterations")
+    results = {"old": measure(old_path, resume, args.iterations), "new": measure(new_path, resume, args.iterations)}
+    for name, result in results.items():
+        print(
+            f"{name:>4}: cpu {result['cpu_us_per_request']:9.1f} us/req  "
+            f"wall {result['wall_us_per_request']:9.1f} us/req  "
+            f"peak alloc {result['peak_alloc_kb']:8.1f} KB"
+        )
+    speedup = results["old"]["cpu_us_per_request"] / results["new"]["cpu_us_per_request"]
+    print(f"CPU speedup: {speedup:.1f}x, peak allocation saved: "
+          f"{results['old']['peak_alloc_kb'] - results['new']['peak_alloc_kb']:.1f} KB per request")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Cold-start benchmark for the GAI API
+Starts the server as a fresh process and measures time until it accepts requests (/health) and until it is ready (/ready)
+"""
+
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from typing import Any, Dict, Optional, Tuple
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def get(url: str) -> Tuple[Optional[int], Optional[Dict[str, Any]]]:
+    try:
+        with urllib.request.urlopen(url, timeout=1) as response:
+            return response.status, json.load(response)
+    except urllib.error.HTTPError as e:
+        return e.code, None
+    except (urllib.error.URLError, ConnectionError, socket.timeout):
+        return None, None
+
+
+def wait_for(url: str, started: float, timeout: float) -> Tuple[float, Optional[Dict[str, Any]]]:
+    """Poll url until it returns 200; returns ms since started and the response body"""
+    while time.perf_counter() - started < timeout:
+        status, body = get(url)
+        if status == 200:
+            return (time.perf_counter() - started) * 1000, body
+        time.sleep(0.005)
+    raise TimeoutError(f"{url} not ready after {timeout}s")
+
+
+def measure_once(timeout: float) -> Dict[str, Any]:
+    port = free_port()
+    env = dict(os.environ, PORT=str(port), HOST="127.0.0.1", LINKEDIN_GAI_LOG_LEVEL="WARNING")
+    env.pop("LINKEDIN_GAI_ENV", None)
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "api_server.py"], cwd=BACKEND_DIR, env=env,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        accepting_ms, _ = wait_for(f"http://127.0.0.1:{port}/health", started, timeout)
+        ready_ms, ready = wait_for(f"http://127.0.0.1:{port}/ready", started, timeout)
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+    return {"accepting_ms": round(accepting_ms, 1), "ready_ms": round(ready_ms, 1), "server": ready["startup"]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=60.0, help="seconds to wait for each server")
+    parser.add_argument("--budget-ms", type=float, default=float(os.getenv("LINKEDIN_GAI_COLD_START_BUDGET_MS", "1000")),
+                        help="fail if the median time to accept requests exceeds this")
+    parser.add_argument("--output", help="write the JSON report here")
+    args = parser.parse_args()
+
+    runs = [measure_once(args.timeout) for _ in range(args.runs)]
+    for i, run in enumerate(runs, 1):
+        print(f"run {i}: accepting {run['accepting_ms']:.0f} ms, ready {run['ready_ms']:.0f} ms, server phases {run['server']}")
+    accepting = statistics.median(run["accepting_ms"] for run in runs)
+    ready = statistics.median(run["ready_ms"] for run in runs)
+    within = accepting <= args.budget_ms
+    print(f"median: accepting {accepting:.0f} ms, ready {ready:.0f} ms; budget {args.budget_ms:.0f} ms {'OK' if within else 'EXCEEDED'}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"budget_ms": args.budget_ms, "median_accepting_ms": accepting, "median_ready_ms": ready, "runs": runs}, f, indent=2)
+        print(f"Report written to {args.output}")
+    sys.exit(0 if within else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+Fake LLM runnable for offline benchmarks
+Streams canned, operation-shaped responses with configurable latency, token rate and failures
+"""
+
+import asyncio
+import json
+import math
+import random
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Optional
+
+from langchain_core.runnables import RunnableGenerator
+
+import generation_settings
+
+# Prompt fragments that identify which operation a prompt belongs to (see prompt_templates.py)
+# Section templates also mention "expert resume writer", so they are matched first
+OPERATION_MARKERS = (
+    ("resume_summary", "professional summary paragraph"),
+    ("resume_experience", "achievement bullets"),
+    ("resume_skills", "drafting the skills section"),
+    ("generate_resume", "expert resume writer"),
+    ("analyze_job_match", "job matching specialist"),
+    ("generate_post", "LinkedIn content creator"),
+    ("polish_resume_sections", "edited some sections"),
+    ("polish_resume", "resume coach"),
+)
+
+CANNED_RESPONSES = {
+    "generate_resume": json.dumps({
+        "personalInfo": {"name": "Bench Candidate", "email": "bench@example.com", "location": "Remote"},
+        "summary": "Backend engineer focused on distributed systems, search relevance and LLM serving. " * 3,
+        "experience": [
+            {
+                "title": f"Software Engineer {i}",
+                "company": f"Company {i}",
+                "duration": "2019 - 2024",
+                "achievements": [f"Reduced p99 latency of service {i}.{j} by {10 + j}%" for j in range(4)],
+            }
+            for i in range(4)
+        ],
+        "skills": ["Python", "FastAPI", "Kubernetes", "PostgreSQL", "Kafka", "LangChain"],
+        "education": [{"degree": "B.S. Computer Science", "institution": "State University", "year": "2018"}],
+    }),
+    "resume_summary": "Backend engineer focused on distributed systems, search relevance and LLM serving. " * 3,
+    "resume_experience": json.dumps([f"Reduced p99 latency of service {j} by {10 + j}%" for j in range(4)]),
+    "resume_skills": json.dumps(["Python", "FastAPI", "Kubernetes", "PostgreSQL", "Kafka", "LangChain"]),
+    "analyze_job_match": json.dumps({
+        "compatibilityScore": 72,
+        "matchingSkills": ["Python", "AWS"],
+        "missingSkills": ["Go"],
+        "recommendations": ["Highlight distributed systems work", "Learn Go basics"],
+        "strengthAreas": ["Backend development"],
+        "improvementAreas": ["Systems programming"],
+        "overallAssessment": "Good fit with a small skills gap",
+    }),
+    "generate_post": (
+        "Excited to share what I learned shipping LLM features to production this quarter. "
+        "Latency budgets, caching and graceful degradation mattered more than model choice. "
+        "What has your experience been? #AI #Engineering #LinkedIn"
+    ),
+    "polish_resume_sections": json.dumps({
+        "suggestions": [
+            {"section": "experience:0", "priority": "high", "type": "rewrite", "current": "Built APIs", "suggested": "Built APIs serving 10k rps at 50 ms p99", "reasoning": "Quantify impact"},
+        ],
+        "experienceOptimization": [{"experienceTitle": "Engineer", "suggestion": "Lead with latency work", "focusAreas": ["performance"]}],
+    }),
+    "polish_resume": json.dumps({
+        "overallScore": 78,
+        "suggestions": [
+            {"type": "summary", "section": "summary", "current": "Engineer", "suggested": "Backend engineer with LLM serving experience", "reason": "Matches the role"},
+            {"type": "skills", "section": "skills", "current": "Python", "suggested": "Python, FastAPI, Kubernetes", "reason": "Keywords from the posting"},
+            {"type": "experience", "section": "experience", "current": "Built APIs", "suggested": "Built APIs serving 10k rps at 50 ms p99", "reason": "Quantify impact"},
+        ],
+        "keywordOptimization": {"missingKeywords": ["Kafka"], "recommendedKeywords": ["streaming"]},
+        "atsOptimization": {"score": 80, "improvements": ["Use standard section headings"]},
+    }),
+}
+
+
+class FakeLLMError(RuntimeError):
+    """Injected gateway failure"""
+
+
+@dataclass
+class FakeLLMConfig:
+    """
+    Attributes:
+        latency_ms: Median time to first token
+        latency_sigma: Lognormal spread of time to first token (0 = constant)
+        token_rate: Output tokens per second after the first (0 = all at once)
+        chunk_tokens: Tokens per streamed chunk
+        failure_rate: Probability a call raises FakeLLMError
+        seed: Random seed, so runs are reproducible
+    """
+    latency_ms: float = 200.0
+    latency_sigma: float = 0.3
+    token_rate: float = 0.0
+    chunk_tokens: int = 4
+    failure_rate: float = 0.0
+    seed: Optional[int] = 1234
+
+
+def detect_operation(prompt_text: str) -> Optional[str]:
+    for operation, marker in OPERATION_MARKERS:
+        if marker in prompt_text:
+            return operation
+    return None
+
+
+def create_fake_llm(config: FakeLLMConfig) -> RunnableGenerator:
+    """
+    Build a streaming runnable that stands in for the gateway LLM.
+
+    It works with both ainvoke and astream, like the real gai_stream runnable,
+    and honours max_tokens from generation_settings.current().
+    """
+    rng = random.Random(config.seed)
+
+    async def fake_stream(inputs: AsyncIterator[Any]) -> AsyncIterator[str]:
+        prompt = None
+        async for prompt in inputs:
+            pass
+        text = prompt.to_string() if hasattr(prompt, "to_string") else str(prompt)
+        response = CANNED_RESPONSES.get(detect_operation(text), CANNED_RESPONSES["generate_post"])
+        settings = generation_settings.current()
+        finish_reason = "stop"
+        if settings is not None and len(response) > settings.max_tokens * 4:
+            # Like the gateway, stop at max_tokens (4 characters per token)
+            response = response[:settings.max_tokens * 4]
+            finish_reason = "length"
+
+        delay = config.latency_ms / 1000.0
+        if config.latency_sigma > 0:
+            delay *= rng.lognormvariate(0.0, config.latency_sigma)
+        await asyncio.sleep(delay)
+        if rng.random() < config.failure_rate:
+            raise FakeLLMError("injected gateway failure")
+
+        if config.token_rate <= 0:
+            yield response
+        else:
+            chunk_chars = max(1, config.chunk_tokens) * 4
+            pause = config.chunk_tokens / config.token_rate
+            for start in range(0, len(response), chunk_chars):
+                if start:
+                    await asyncio.sleep(pause)
+                yield response[start:start + chunk_chars]
+        # Usage as the gateway reports it
+        generation_settings.report_usage(math.ceil(len(response) / 4), finish_reason)
+
+    return RunnableGenerator(fake_stream)
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Offline load test for the GAI API
+Drives each endpoint in-process (no network) against a fake LLM and reports throughput, latency percentiles and CPU per request
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional
+
+# Add the python-backend directory to Python path
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fake_llm import FakeLLMConfig, create_fake_llm
+
+SCHEMA_VERSION = 1
+
+
+def resume_payload(i: int) -> Dict[str, Any]:
+    return {
+        "linkedin_url": f"https://linkedin.com/in/bench-{i}",
+        "target_role": "Senior Backend Engineer",
+        "user_profile": {"headline": "Backend engineer", "skills": ["Python", "Kafka", "AWS"], "years": i % 15},
+    }
+
+
+def sectioned_resume_payload(i: int) -> Dict[str, Any]:
+    """A structured LinkedIn profile with six positions, generated section by section"""
+    positions = [
+        {
+            "title": f"Software Engineer {level}",
+            "companyName": f"Company {i}-{level}",
+            "description": "Built data pipelines and APIs. Reduced p99 latency by 30%. Mentored three engineers.",
+            "startDate": {"month": 1, "year": 2012 + 2 * level},
+            "endDate": None if level == 5 else {"month": 12, "year": 2013 + 2 * level},
+            "isCurrent": level == 5,
+        }
+        for level in reversed(range(6))
+    ]
+    return {
+        "linkedin_url": f"https://linkedin.com/in/bench-sections-{i}",
+        "target_role": "Senior Backend Engineer",
+        "mode": "sections",
+        "user_profile": {
+            "firstName": "Bench",
+            "lastName": f"Candidate {i}",
+            "headline": "Backend engineer",
+            "summary": "Backend engineer focused on distributed systems.",
+            "positions": positions,
+            "educations": [{"schoolName": "State University", "degree": "B.S.", "fieldOfStudy": "Computer Science", "endDate": {"year": 2011}}],
+            "skills": [{"name": name} for name in ("Python", "Kafka", "AWS", "PostgreSQL")],
+        },
+    }
+
+
+def repeat_resume_payload(i: int) -> Dict[str, Any]:
+    """Eight candidates asking for the same resume again, served from the resume store after the first generation"""
+    return resume_payload(i % 8)
+
+
+def job_match_payload(i: int, local_only: bool = False) -> Dict[str, Any]:
+    return {
+        "user_skills": ["Python", "AWS", "PostgreSQL", "Docker"],
+        "job_requirements": f"Python, Go, AWS, Kubernetes. Posting {i}",
+        "job_description": f"Backend engineer building data pipelines and APIs for team {i}.",
+        "local_only": local_only,
+    }
+
+
+def post_payload(i: int) -> Dict[str, Any]:
+    return {"topic": f"Lessons from shipping LLM features #{i}", "details": "Latency, caching and fallbacks"}
+
+
+def polish_payload(i: int) -> Dict[str, Any]:
+    return {
+        "resume_data": {"summary": "Backend engineer", "skills": ["Python", "AWS"], "experience": [{"title": f"Engineer {i}"}]},
+        "job_data": {"title": "Senior Backend Engineer", "company": {"name": f"Company {i}"}, "requirements": "Python, Kafka"},
+    }
+
+
+def incremental_polish_payload(i: int) -> Dict[str, Any]:
+    """Eight candidates re-polishing against their job, editing one bullet of one experience entry each time"""
+    candidate = i % 8
+    experience = [
+        {"title": f"Engineer {level}", "company": f"Company {level}", "achievements": ["Built APIs", "Reduced p99 latency by 30%"]}
+        for level in range(6)
+    ]
+    experience[i % 6]["achievements"].append(f"Shipped release {i}")
+    return {
+        "mode": "incremental",
+        "resume_data": {
+            "personalInfo": {"name": f"Candidate {candidate}", "email": f"candidate{candidate}@example.com"},
+            "summary": "Backend engineer",
+            "skills": ["Python", "AWS"],
+            "experience": experience,
+        },
+        "job_data": {"title": "Senior Backend Engineer", "company": {"name": f"Company {candidate}"}, "requirements": "Python, Kafka"},
+    }
+
+
+# Scenario name -> (path, payload factory); every request gets distinct inputs so caches and coalescing do not hide LLM cost
+SCENARIOS: Dict[str, Any] = {
+    "generate_resume": ("/api/linkedin/generate-resume", resume_payload),
+    # Sections mode trades extra first-token latencies for shorter outputs: compare it with generate_resume at a nonzero --token-rate
+    "generate_resume_sections": ("/api/linkedin/generate-resume", sectioned_resume_payload),
+    "generate_resume_repeat": ("/api/linkedin/generate-resume", repeat_resume_payload),
+    "analyze_job_match": ("/api/linkedin/analyze-job-match", job_match_payload),
+    "analyze_job_match_local": ("/api/linkedin/analyze-job-match", lambda i: job_match_payload(i, local_only=True)),
+    "generate_post": ("/api/linkedin/generate-post", post_payload),
+    "generate_post_stream": ("/api/linkedin/generate-post/stream", post_payload),
+    "polish_resume": ("/api/resume/polish", polish_payload),
+    "polish_resume_incremental": ("/api/resume/polish", incremental_polish_payload),
+}
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(q / 100.0 * len(sorted_values) + 0.5)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def fallback_count() -> float:
+    """Responses the service served from a fallback (stale result, canned content, local scoring)"""
+    import metrics
+    return sum(value for _, _, value in metrics.FALLBACKS.samples())
+
+
+async def run_scenario(client, path: str, payload: Callable[[int], Dict[str, Any]], requests: int, concurrency: int, offset: int) -> Dict[str, Any]:
+    """Closed-loop load: `concurrency` workers issue `requests` requests in total"""
+    latencies: List[float] = []
+    statuses: Counter = Counter()
+    next_index = iter(range(requests))
+
+    async def worker() -> None:
+        for i in next_index:
+            started = time.perf_counter()
+            try:
+                response = await client.post(path, json=payload(offset + i))
+                status = str(response.status_code)
+                if response.status_code == 200 and response.headers.get("content-type", "").startswith("application/json"):
+                    if response.json().get("success") is False:
+                        status = "200_error"
+            except Exception as e:
+                status = type(e).__name__
+            latencies.append(time.perf_counter() - started)
+            statuses[status] += 1
+
+    fallbacks_before = fallback_count()
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+
+    latencies.sort()
+    return {
+        "path": path,
+        "requests": requests,
+        "concurrency": concurrency,
+        "throughput_rps": round(requests / wall, 2) if wall else 0.0,
+        "latency_ms": {
+            "p50": round(percentile(latencies, 50) * 1000, 2),
+            "p95": round(percentile(latencies, 95) * 1000, 2),
+            "p99": round(percentile(latencies, 99) * 1000, 2),
+            "max": round(latencies[-1] * 1000, 2) if latencies else 0.0,
+            "mean": round(sum(latencies) / len(latencies) * 1000, 2) if latencies else 0.0,
+        },
+        "cpu_ms_per_request": round(cpu / requests * 1000, 3) if requests else 0.0,
+        "statuses": dict(sorted(statuses.items())),
+        "fallbacks": int(fallback_count() - fallbacks_before),
+    }
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_report(report: Dict[str, Any], baseline: Optional[Dict[str, Any]] = None) -> None:
+    print(f"commit {report['commit'] or 'unknown'}  fake LLM {report['fake_llm']}")
+    print(f"{'scenario':<26}{'rps':>9}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'cpu ms/req':>12}{'fallbacks':>11}  statuses")
+    for name, result in report["scenarios"].items():
+        latency = result["latency_ms"]
+        print(
+            f"{name:<26}{result['throughput_rps']:>9.1f}{latency['p50']:>10.1f}{latency['p95']:>10.1f}"
+            f"{latency['p99']:>10.1f}{result['cpu_ms_per_request']:>12.3f}{result['fallbacks']:>11}  {result['statuses']}"
+        )
+        before = (baseline or {}).get("scenarios", {}).get(name)
+        if before:
+            def delta(new: float, old: float) -> str:
+                return f"{(new - old) / old * 100:+.1f}%" if old else "n/a"
+            print(
+                f"{'  vs ' + (baseline.get('commit') or 'baseline'):<26}{delta(result['throughput_rps'], before['throughput_rps']):>9}"
+                f"{delta(latency['p50'], before['latency_ms']['p50']):>10}{delta(latency['p95'], before['latency_ms']['p95']):>10}"
+                f"{delta(latency['p99'], before['latency_ms']['p99']):>10}"
+                f"{delta(result['cpu_ms_per_request'], before['cpu_ms_per_request']):>12}"
+            )
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    import httpx
+    import api_server
+
+    fake_config = FakeLLMConfig(
+        latency_ms=args.latency_ms,
+        latency_sigma=args.latency_sigma,
+        token_rate=args.token_rate,
+        chunk_tokens=args.chunk_tokens,
+        failure_rate=args.failure_rate,
+        seed=args.seed,
+    )
+    service = api_server.gai_service
+    service.warm_up()
+    service.chains.reload(llm=create_fake_llm(fake_config))
+    service.gai_available = True
+
+    report = {
+        "schema": SCHEMA_VERSION,
+        "commit": git_revision(),
+        "python": platform.python_version(),
+        "fake_llm": vars(fake_config),
+        "scenarios": {},
+    }
+    transport = httpx.ASGITransport(app=api_server.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        for index, name in enumerate(args.scenarios):
+            path, payload = SCENARIOS[name]
+            if args.warmup:
+                await run_scenario(client, path, payload, args.warmup, min(args.warmup, args.concurrency), offset=10_000_000 * (index + 1))
+            report["scenarios"][name] = await run_scenario(
+                client, path, payload, args.requests, args.concurrency, offset=10_000_000 * (index + 1) + args.warmup
+            )
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scenarios", nargs="+", default=list(SCENARIOS), choices=list(SCENARIOS))
+    parser.add_argument("--requests", type=int, default=200, help="requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=16, help="concurrent clients per scenario")
+    parser.add_argument("--warmup", type=int, default=10, help="unmeasured requests before each scenario")
+    parser.add_argument("--latency-ms", type=float, default=200.0, help="median fake LLM time to first token")
+    parser.add_argument("--latency-sigma", type=float, default=0.3, help="lognormal spread of the fake LLM latency")
+    parser.add_argument("--token-rate", type=float, default=0.0, help="fake LLM output tokens/s (0 = whole response at once)")
+    parser.add_argument("--chunk-tokens", type=int, default=4, help="tokens per streamed chunk")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="probability a fake LLM call fails")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--output", help="write the JSON report here")
+    parser.add_argument("--baseline", help="earlier JSON report to compare against")
+    args = parser.parse_args()
+    if "generate_resume_sections" in args.scenarios and args.token_rate <= 0:
+        print("note: with --token-rate 0 the fake LLM returns whole responses at once, so generate_resume_sections "
+              "only shows its extra per-call latency; pass e.g. --token-rate 200 to compare it with generate_resume")
+
+    # Quiet, unlimited service defaults so the benchmark measures the code path, not admission rejections
+    os.environ.setdefault("LINKEDIN_GAI_LOG_LEVEL", "WARNING")
+    os.environ.setdefault("LINKEDIN_GAI_ADMISSION_CONCURRENCY", str(max(args.concurrency, 1)))
+    os.environ.setdefault("LINKEDIN_GAI_ADMISSION_QUEUE", str(max(args.concurrency, 1)))
+    os.environ.setdefault("LINKEDIN_GAI_LOG_PAYLOAD_SAMPLE_RATE", "0")
+    # A fresh resume store per run, so resumes stored by earlier runs are not served as lookups
+    os.environ.setdefault("LINKEDIN_GAI_RESUME_STORE_PATH", os.path.join(tempfile.mkdtemp(prefix="gai-bench-"), "resumes.sqlite3"))
+
+    report = asyncio.run(run(args))
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+    print_report(report, baseline)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
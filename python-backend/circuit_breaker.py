@@ -0,0 +1,222 @@
+"""
+Circuit breaker for the LinkedIn GAI gateway
+Trips on error rate, slow calls or consecutive failures, and probes recovery in half-open state
+"""
+
+import asyncio
+import logging
+import math
+import os
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpen(Exception):
+    """Raised instead of calling the gateway while the circuit is open"""
+
+    def __init__(self, name: str, retry_after: float):
+        super().__init__(f"{name} circuit is open, retry after {math.ceil(retry_after)}s")
+        self.name = name
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    Tracks call outcomes over a sliding time window.
+
+    The circuit opens when, over at least min_calls recent calls, the share of
+    failed or slow calls reaches failure_rate, or immediately after
+    consecutive_failures failures in a row. While open, calls fail fast with
+    CircuitOpen. After open_seconds, up to half_open_calls probe calls are let
+    through: a success closes the circuit, a failure re-opens it.
+
+    Calls cancelled early (e.g. the client disconnected) are not counted;
+    calls cancelled after running past slow_call_seconds count as slow.
+    """
+
+    def __init__(
+        self,
+        name: str = "gai_gateway",
+        failure_rate: float = 0.5,
+        min_calls: int = 10,
+        window_seconds: float = 60.0,
+        consecutive_failures: int = 5,
+        slow_call_seconds: Optional[float] = 20.0,
+        open_seconds: float = 30.0,
+        half_open_calls: int = 1,
+    ):
+        """
+        Args:
+            name: Name used in errors, logs and stats
+            failure_rate: Failed-or-slow share of windowed calls that opens the circuit
+            min_calls: Calls needed in the window before failure_rate applies
+            window_seconds: Age of the oldest outcome considered
+            consecutive_failures: Failures in a row that open the circuit regardless of volume
+            slow_call_seconds: Successful calls slower than this count against the circuit (None disables)
+            open_seconds: Time spent open before probing
+            half_open_calls: Concurrent probe calls allowed while half-open
+        """
+        self.name = name
+        self.failure_rate = failure_rate
+        self.min_calls = max(1, min_calls)
+        self.window_seconds = window_seconds
+        self.consecutive_failures = max(1, consecutive_failures)
+        self.slow_call_seconds = slow_call_seconds
+        self.open_seconds = open_seconds
+        self.half_open_calls = max(1, half_open_calls)
+
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probes = 0
+        self._streak = 0
+        # (timestamp, failed_or_slow)
+        self._outcomes: Deque[Tuple[float, bool]] = deque()
+        self._counts = {"successes": 0, "failures": 0, "slow_calls": 0, "rejected": 0, "opened": 0}
+
+    @classmethod
+    def from_env(cls, name: str = "gai_gateway") -> "CircuitBreaker":
+        """Build a breaker from LINKEDIN_GAI_BREAKER_* environment settings"""
+        slow = float(os.getenv("LINKEDIN_GAI_BREAKER_SLOW_CALL_SECONDS", "20"))
+        return cls(
+            name,
+            failure_rate=float(os.getenv("LINKEDIN_GAI_BREAKER_FAILURE_RATE", "0.5")),
+            min_calls=int(os.getenv("LINKEDIN_GAI_BREAKER_MIN_CALLS", "10")),
+            window_seconds=float(os.getenv("LINKEDIN_GAI_BREAKER_WINDOW_SECONDS", "60")),
+            consecutive_failures=int(os.getenv("LINKEDIN_GAI_BREAKER_CONSECUTIVE_FAILURES", "5")),
+            slow_call_seconds=slow if slow > 0 else None,
+            open_seconds=float(os.getenv("LINKEDIN_GAI_BREAKER_OPEN_SECONDS", "30")),
+        )
+
+    @property
+    def state(self) -> str:
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.open_seconds:
+            return HALF_OPEN
+        return self._state
+
+    def before_call(self) -> None:
+        """
+        Reserve permission for one gateway call.
+
+        Raises:
+            CircuitOpen: If the circuit is open, or half-open with all probe slots taken
+        """
+        now = time.monotonic()
+        if self._state == OPEN:
+            waited = now - self._opened_at
+            if waited < self.open_seconds:
+                self._counts["rejected"] += 1
+                raise CircuitOpen(self.name, self.open_seconds - waited)
+            self._state = HALF_OPEN
+            self._probes = 0
+            logger.info("Circuit %s half-open, probing the gateway", self.name)
+        if self._state == HALF_OPEN:
+            if self._probes >= self.half_open_calls:
+                self._counts["rejected"] += 1
+                raise CircuitOpen(self.name, 1.0)
+            self._probes += 1
+
+    def record_success(self, duration: float) -> None:
+        """Record a completed call; slow calls count against the circuit"""
+        slow = self.slow_call_seconds is not None and duration > self.slow_call_seconds
+        if slow:
+            self._counts["slow_calls"] += 1
+            self._record(True)
+            return
+        self._counts["successes"] += 1
+        self._streak = 0
+        if self._state == HALF_OPEN:
+            self._state = CLOSED
+            self._outcomes.clear()
+            logger.info("Circuit %s closed, gateway recovered", self.name)
+        self._record(False)
+
+    def record_failure(self) -> None:
+        """Record a failed call"""
+        self._counts["failures"] += 1
+        self._record(True)
+
+    def record_cancelled(self, duration: float) -> None:
+        """
+        Record a call abandoned by its caller.
+
+        Early cancellations only return their half-open probe slot; a call
+        abandoned after running past slow_call_seconds (e.g. on a deadline)
+        counts as slow.
+        """
+        if self.slow_call_seconds is not None and duration > self.slow_call_seconds:
+            self._counts["slow_calls"] += 1
+            self._record(True)
+        elif self._state == HALF_OPEN and self._probes > 0:
+            self._probes -= 1
+
+    async def call(self, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run fn() through the breaker.
+
+        Raises:
+            CircuitOpen: Without calling fn() while the circuit is open
+        """
+        self.before_call()
+        started = time.monotonic()
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            self.record_cancelled(time.monotonic() - started)
+            raise
+        except Exception:
+            self.record_failure()
+            raise
+        self.record_success(time.monotonic() - started)
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """Current state, windowed failure rate and lifetime counters"""
+        self._trim(time.monotonic())
+        calls = len(self._outcomes)
+        failed = sum(1 for _, bad in self._outcomes if bad)
+        return {
+            "state": self.state,
+            "window_calls": calls,
+            "window_failure_rate": round(failed / calls, 3) if calls else 0.0,
+            **self._counts,
+        }
+
+    def _record(self, bad: bool) -> None:
+        now = time.monotonic()
+        self._outcomes.append((now, bad))
+        self._trim(now)
+        if not bad:
+            return
+        self._streak += 1
+        if self._state == HALF_OPEN:
+            self._open(now, "probe failed")
+            return
+        if self._state != CLOSED:
+            return
+        if self._streak >= self.consecutive_failures:
+            self._open(now, f"{self._streak} consecutive failures")
+            return
+        calls = len(self._outcomes)
+        if calls >= self.min_calls:
+            rate = sum(1 for _, failed in self._outcomes if failed) / calls
+            if rate >= self.failure_rate:
+                self._open(now, f"failure rate {rate:.0%} over {calls} calls")
+
+    def _open(self, now: float, reason: str) -> None:
+        self._state = OPEN
+        self._opened_at = now
+        self._probes = 0
+        self._counts["opened"] += 1
+        logger.warning("Circuit %s opened: %s", self.name, reason)
+
+    def _trim(self, now: float) -> None:
+        cutoff = now - self.window_seconds
+        while self._outcomes and self._outcomes[0][0] < cutoff:
+            self._outcomes.popleft()
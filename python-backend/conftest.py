@@ -0,0 +1,21 @@
+"""
+Shared pytest fixtures for the backend tests
+"""
+
+import pytest
+
+
+class FakeClock:
+    """Callable stand-in for time.time/time.monotonic that only moves when a test advances now"""
+
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """A FakeClock for the test to patch over the clock of the module under test"""
+    return FakeClock()
@@ -0,0 +1,259 @@
+"""
+Prompt context compaction for LinkedIn GAI operations
+Minified canonical JSON, empty-field pruning, duplicate and boilerplate removal, and per-operation token budgets
+"""
+
+import json
+import logging
+import math
+import os
+import re
+import threading
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import metrics
+
+logger = logging.getLogger(__name__)
+
+# Default token budget per prompt field, per operation; fields not listed are compacted but never trimmed
+DEFAULT_BUDGETS: Dict[str, Dict[str, int]] = {
+    "generate_resume": {"user_context": 3000},
+    "analyze_job_match": {"job_requirements": 800, "job_description": 1200},
+    "polish_resume": {"resume_content": 3000, "job_requirements": 800, "job_description": 1200},
+    "polish_resume_local_keywords": {"resume_content": 3000, "job_requirements": 800, "job_description": 1200},
+    "polish_resume_sections": {"resume_content": 2000, "job_requirements": 800, "job_description": 1200},
+    "generate_post": {"details": 600},
+}
+
+# Equal-opportunity, accommodation and application boilerplate common in postings; carries no matching signal
+BOILERPLATE = re.compile(
+    r"equal opportunity employer|without regard to (race|age|color)|all qualified applicants"
+    r"|reasonable accommodations?\b|e-?verify|privacy (notice|policy)|click (the )?apply|apply now",
+    re.IGNORECASE,
+)
+
+# Long string values inside structured context are shortened to this many characters at most when over budget
+MIN_STRING_CHARS = 200
+
+_WORD = re.compile(r"\w+|[^\w\s]", re.UNICODE)
+_SENTENCE_END = re.compile(r"(?<=[.!?;])\s+")
+_SPACES = re.compile(r"[ \t\r\f\v]+")
+_NORMALIZE = re.compile(r"[\W_]+", re.UNICODE)
+
+
+def count_tokens(text: str) -> int:
+    """
+    Approximate GPT-style token count without a tokenizer.
+
+    Words cost one token per 4 characters (at least one), punctuation one
+    token per character; typically within 10-15% of tiktoken on English
+    prose and JSON.
+    """
+    if not text:
+        return 0
+    return sum(math.ceil(len(piece) / 4) if piece[0].isalnum() or piece[0] == "_" else 1 for piece in _WORD.findall(text))
+
+
+def prune(value: Any) -> Any:
+    """
+    Drop None, empty strings and empty containers, collapse whitespace in
+    strings and remove duplicate list items. Zero and False are kept.
+    """
+    if isinstance(value, dict):
+        pruned = {}
+        for key, item in value.items():
+            item = prune(item)
+            if item is not None:
+                pruned[key] = item
+        return pruned or None
+    if isinstance(value, (list, tuple)):
+        items, seen = [], set()
+        for item in value:
+            item = prune(item)
+            if item is None:
+                continue
+            marker = json.dumps(item, sort_keys=True, ensure_ascii=False, default=str)
+            if marker not in seen:
+                seen.add(marker)
+                items.append(item)
+        return items or None
+    if isinstance(value, str):
+        value = " ".join(value.split())
+        return value or None
+    return value
+
+
+def compact_json(value: Any) -> str:
+    """Pruned, key-sorted JSON without whitespace"""
+    return json.dumps(prune(value), sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def _shorten_strings(value: Any, limit: int) -> Any:
+    if isinstance(value, dict):
+        return {key: _shorten_strings(item, limit) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_shorten_strings(item, limit) for item in value]
+    if isinstance(value, str) and len(value) > limit:
+        return value[:limit].rsplit(" ", 1)[0] + "…"
+    return value
+
+
+def compact_text(text: str, budget: Optional[int] = None, seen: Optional[Set[str]] = None) -> Tuple[str, bool]:
+    """
+    Normalize free text and fit it to a token budget.
+
+    Collapses whitespace and blank lines, drops boilerplate sentences and
+    sentences already in ``seen`` (shared across fields of one prompt), then
+    keeps whole sentences from the start until the budget is spent.
+
+    Returns:
+        The compacted text, and whether it was trimmed to the budget
+    """
+    seen = seen if seen is not None else set()
+    lines: List[str] = []
+    used = 0
+    trimmed = False
+    for raw_line in text.splitlines():
+        kept = []
+        for sentence in _SENTENCE_END.split(_SPACES.sub(" ", raw_line).strip()):
+            key = _NORMALIZE.sub(" ", sentence).strip().casefold()
+            if not key or key in seen or BOILERPLATE.search(sentence):
+                continue
+            seen.add(key)
+            cost = count_tokens(sentence)
+            if budget is not None and used + cost > budget:
+                trimmed = True
+                break
+            used += cost
+            kept.append(sentence)
+        if kept:
+            lines.append(" ".join(kept))
+        if trimmed:
+            break
+    result = "\n".join(lines)
+    return (result + " …" if trimmed else result), trimmed
+
+
+class ContextCompactor:
+    """
+    Turns raw prompt context (profiles, resumes, job postings) into compact
+    prompt strings, and keeps per-operation counts of the tokens saved.
+
+    Structured fields (dicts/lists) become pruned, minified JSON; text fields
+    are normalized and de-duplicated against the fields before them, so a
+    description repeating its requirements is sent once. Fields with a
+    budget are trimmed to it.
+    """
+
+    def __init__(self, budgets: Optional[Dict[str, Dict[str, int]]] = None, enabled: bool = True):
+        """
+        Args:
+            budgets: Operation -> field -> max tokens, defaults to DEFAULT_BUDGETS
+            enabled: When False, fields are serialized as before (plain json.dumps, raw text)
+        """
+        self.budgets = {operation: dict(fields) for operation, fields in (budgets or DEFAULT_BUDGETS).items()}
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._totals: Dict[str, Dict[str, int]] = {}
+        self._last: Dict[str, Dict[str, Any]] = {}
+
+    @classmethod
+    def from_env(cls) -> "ContextCompactor":
+        """
+        Settings (environment):
+            LINKEDIN_GAI_COMPACT_CONTEXT: "0" disables compaction
+            LINKEDIN_GAI_<OPERATION>_<FIELD>_TOKENS: overrides one budget,
+                e.g. LINKEDIN_GAI_POLISH_RESUME_JOB_DESCRIPTION_TOKENS=800 (0 removes it)
+        """
+        budgets = {}
+        for operation, fields in DEFAULT_BUDGETS.items():
+            budgets[operation] = {}
+            for field, default in fields.items():
+                tokens = int(os.getenv(f"LINKEDIN_GAI_{operation.upper()}_{field.upper()}_TOKENS", str(default)))
+                if tokens > 0:
+                    budgets[operation][field] = tokens
+        return cls(budgets, enabled=os.getenv("LINKEDIN_GAI_COMPACT_CONTEXT", "1") != "0")
+
+    def compact(self, operation: str, fields: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Compact the context fields of one prompt.
+
+        Args:
+            operation: GAI operation name, selects the budgets
+            fields: Prompt variable -> raw value; str values are free text, anything else is serialized as JSON.
+                    Text is de-duplicated in field order, so list the most important field first.
+
+        Returns:
+            Prompt variable -> compacted string
+        """
+        budgets = self.budgets.get(operation, {})
+        seen: Set[str] = set()
+        compacted: Dict[str, str] = {}
+        before = after = 0
+        trimmed: List[str] = []
+        for name, value in fields.items():
+            original = value if isinstance(value, str) else json.dumps(value, default=str)
+            before += count_tokens(original)
+            if not self.enabled:
+                compacted[name] = original
+            elif isinstance(value, str):
+                compacted[name], was_trimmed = compact_text(value, budgets.get(name), seen)
+                if was_trimmed:
+                    trimmed.append(name)
+            else:
+                compacted[name], was_trimmed = self._compact_structured(value, budgets.get(name))
+                if was_trimmed:
+                    trimmed.append(name)
+            after += count_tokens(compacted[name])
+        self._record(operation, before, after, trimmed)
+        return compacted
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-operation totals of prompt context tokens before and after compaction, and the last call"""
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "operations": {
+                    operation: {**totals, "last": self._last.get(operation)}
+                    for operation, totals in self._totals.items()
+                },
+            }
+
+    def _compact_structured(self, value: Any, budget: Optional[int]) -> Tuple[str, bool]:
+        pruned = prune(value)
+        text = json.dumps(pruned, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+        if budget is None or count_tokens(text) <= budget:
+            return text, False
+        # Shorten the longest strings first, halving the cap until the budget fits or strings are short
+        limit = max((len(s) for s in _strings(pruned)), default=0)
+        while limit > MIN_STRING_CHARS and count_tokens(text) > budget:
+            limit = max(MIN_STRING_CHARS, limit // 2)
+            text = json.dumps(_shorten_strings(pruned, limit), sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+        return text, True
+
+    def _record(self, operation: str, before: int, after: int, trimmed: List[str]) -> None:
+        saved = before - after
+        with self._lock:
+            totals = self._totals.setdefault(operation, {"calls": 0, "tokens_before": 0, "tokens_after": 0, "tokens_saved": 0, "trimmed": 0})
+            totals["calls"] += 1
+            totals["tokens_before"] += before
+            totals["tokens_after"] += after
+            totals["tokens_saved"] += saved
+            totals["trimmed"] += 1 if trimmed else 0
+            self._last[operation] = {"tokens_before": before, "tokens_after": after, "tokens_saved": saved, "trimmed_fields": trimmed}
+        metrics.CONTEXT_TOKENS_SAVED.inc(max(saved, 0), operation=operation)
+        logger.info(
+            "Compacted %s context: %d -> %d tokens (saved %d%s)",
+            operation, before, after, saved, f", trimmed {', '.join(trimmed)}" if trimmed else "",
+        )
+
+
+def _strings(value: Any):
+    if isinstance(value, dict):
+        for item in value.values():
+            yield from _strings(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _strings(item)
+    elif isinstance(value, str):
+        yield value
@@ -0,0 +1,169 @@
+"""
+Request deadlines and client-disconnect cancellation
+A per-request deadline travels in a context variable so every chain invocation can enforce it
+"""
+
+import asyncio
+import contextvars
+import logging
+import os
+import time
+from typing import Any, AsyncIterator, Awaitable, Dict, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEADLINE_HEADER = b"x-request-timeout"
+
+# Absolute deadline on the time.monotonic() clock, or None for no deadline
+_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar("gai_request_deadline", default=None)
+
+_counters = {"disconnects": 0}
+
+
+class DeadlineExceeded(Exception):
+    """The request's deadline passed before the work finished"""
+
+    def __init__(self, operation: str = "request"):
+        super().__init__(f"Deadline exceeded during {operation}")
+        self.operation = operation
+
+
+def remaining() -> Optional[float]:
+    """Seconds left before the current deadline, or None if there is none"""
+    deadline = _deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
+
+
+def tighten(timeout_seconds: Optional[float]) -> None:
+    """Shorten the current deadline to at most timeout_seconds from now; never extends it"""
+    if timeout_seconds is None or timeout_seconds <= 0:
+        return
+    deadline = time.monotonic() + timeout_seconds
+    current = _deadline.get()
+    if current is None or deadline < current:
+        _deadline.set(deadline)
+
+
+async def with_deadline(awaitable: Awaitable[T], operation: str = "request") -> T:
+    """
+    Await under the current deadline, cancelling the awaitable when it passes.
+
+    Raises:
+        DeadlineExceeded: If the deadline has passed or passes while waiting
+    """
+    left = remaining()
+    if left is None:
+        return await awaitable
+    if left <= 0:
+        if asyncio.iscoroutine(awaitable):
+            awaitable.close()
+        raise DeadlineExceeded(operation)
+    try:
+        return await asyncio.wait_for(awaitable, left)
+    except asyncio.TimeoutError:
+        raise DeadlineExceeded(operation) from None
+
+
+async def iterate_with_deadline(iterator: AsyncIterator[T], operation: str = "request") -> AsyncIterator[T]:
+    """Re-yield an async iterator, cancelling it if the current deadline passes between items"""
+    try:
+        while True:
+            try:
+                item = await with_deadline(iterator.__anext__(), operation)
+            except StopAsyncIteration:
+                return
+            yield item
+    finally:
+        aclose = getattr(iterator, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+def stats() -> Dict[str, int]:
+    """Requests cancelled because the client went away"""
+    return dict(_counters)
+
+
+class DeadlineMiddleware:
+    """
+    ASGI middleware that starts each HTTP request's deadline and cancels the
+    handler when the client disconnects before the response is complete.
+
+    The deadline comes from the X-Request-Timeout header (seconds), or
+    LINKEDIN_GAI_REQUEST_TIMEOUT when the header is absent. Handlers may
+    tighten it further from a request body field.
+    """
+
+    def __init__(self, app: Any):
+        self.app = app
+        self.default_timeout = float(os.getenv("LINKEDIN_GAI_REQUEST_TIMEOUT", "0")) or None
+
+    async def __call__(self, scope: Dict[str, Any], receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timeout = self.default_timeout
+        for name, value in scope.get("headers", []):
+            if name == DEADLINE_HEADER:
+                try:
+                    timeout = float(value)
+                except ValueError:
+                    logger.warning("Ignoring invalid X-Request-Timeout header: %r", value)
+                break
+
+        disconnected = asyncio.Event()
+        body_read = False
+        response_done = False
+        watcher: Optional[asyncio.Task] = None
+
+        async def watch_disconnect() -> None:
+            while True:
+                message = await receive()
+                if message["type"] == "http.disconnect":
+                    disconnected.set()
+                    if not response_done:
+                        handler.cancel()
+                    return
+
+        async def wrapped_receive() -> Dict[str, Any]:
+            # Once the body is read, the watcher owns the real receive channel
+            nonlocal body_read, watcher
+            if body_read:
+                await disconnected.wait()
+                return {"type": "http.disconnect"}
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                disconnected.set()
+            elif not message.get("more_body", False):
+                body_read = True
+                watcher = asyncio.ensure_future(watch_disconnect())
+            return message
+
+        async def wrapped_send(message: Dict[str, Any]) -> None:
+            nonlocal response_done
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                response_done = True
+            await send(message)
+
+        async def run() -> None:
+            _deadline.set(None)
+            tighten(timeout)
+            await self.app(scope, wrapped_receive, wrapped_send)
+
+        # The handler runs in its own task (and context) so a disconnect can cancel it
+        handler = asyncio.ensure_future(run())
+        try:
+            await handler
+        except asyncio.CancelledError:
+            if not disconnected.is_set():
+                raise
+            _counters["disconnects"] += 1
+            logger.info("Client disconnected, cancelled %s %s", scope.get("method"), scope.get("path"))
+        finally:
+            if watcher is not None:
+                watcher.cancel()
+            if not handler.done():
+                handler.cancel()
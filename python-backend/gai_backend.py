@@ -0,0 +1,145 @@
+"""
+LinkedIn GAI backend detection
+Imports the linkedin.* packages and builds the gateway runnable on demand instead of at import time
+"""
+
+import logging
+import os
+from dataclasses import dataclass
+from typing import Any, Callable
+
+import generation_settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class GAIBackend:
+    """The LLM runnable the chains are built on, and how to wrap chains for observability"""
+    llm: Any
+    available: bool
+    observe: Callable[[Any], Any]
+
+
+# Mock observability classes for environments without linkedin.gai_observe_langchain
+class ObserveConfig:
+    def __init__(self, has_hc_data=False):
+        self.has_hc_data = has_hc_data
+
+
+class ObservedLCEL:
+    def __init__(self, chain, observe_config=None):
+        self.chain = chain
+
+    async def ainvoke(self, inputs):
+        return await self.chain.ainvoke(inputs)
+
+    async def astream(self, inputs):
+        async for chunk in self.chain.astream(inputs):
+            yield chunk
+
+
+def create_linkedin_gai_runnable(resource_id=None, deployment_id=None, max_tokens=2000, temperature=0.7):
+    """
+    Build a streaming runnable around ProxiedGPTChat.
+
+    max_tokens and temperature are the client defaults; each call binds the
+    per-operation settings from generation_settings.current() over them.
+
+    Raises:
+        ImportError: If lipy-langchain is not installed
+        Exception: If the client cannot be configured (e.g. outside LinkedIn infrastructure)
+    """
+    from linkedin.langchain import ProxiedGPTChat
+    from langchain_core.runnables import RunnableGenerator
+
+    gai_client = ProxiedGPTChat(
+        resource_id=resource_id,
+        deployment_id=deployment_id,
+        max_tokens=max_tokens,
+        temperature=temperature
+    )
+
+    def to_messages(inputs):
+        # Convert inputs to the format expected by ProxiedGPTChat
+        if isinstance(inputs, dict) and 'messages' in inputs:
+            return inputs['messages']
+        elif isinstance(inputs, list):
+            return inputs
+        else:
+            # Handle string inputs by converting to message format
+            return [{"role": "user", "content": str(inputs)}]
+
+    async def gai_stream(input_stream):
+        # The prompt emits a single value; stream the completion token by token
+        inputs = None
+        async for inputs in input_stream:
+            pass
+        settings = generation_settings.current()
+        client = gai_client.bind(**settings.model_kwargs()) if settings is not None else gai_client
+        output_tokens, finish_reason = None, None
+        async for chunk in client.astream(to_messages(inputs)):
+            # Usage is reported per chunk or on the last one; chunk counts add up
+            usage = getattr(chunk, "usage_metadata", None)
+            if usage and usage.get("output_tokens") is not None:
+                output_tokens = (output_tokens or 0) + usage["output_tokens"]
+            finish_reason = (getattr(chunk, "response_metadata", None) or {}).get("finish_reason") or finish_reason
+            yield chunk
+        generation_settings.report_usage(output_tokens, finish_reason)
+
+    # ainvoke aggregates the streamed chunks; astream forwards them as they arrive
+    return RunnableGenerator(gai_stream)
+
+
+def create_mock_runnable():
+    """Runnable returning a fixed string, used when the gateway is not reachable"""
+    from langchain_core.runnables import RunnableLambda
+
+    async def mock_gai_invoke(inputs):
+        # Mock response for development
+        return "Mock GAI response - LinkedIn GAI not available in development environment"
+
+    return RunnableLambda(mock_gai_invoke)
+
+
+def _observer() -> Callable[[Any], Any]:
+    try:
+        from linkedin.gai_observe_langchain.observed_lcel import ObserveConfig as Config, ObservedLCEL as Observed
+    except ImportError:
+        Config, Observed = ObserveConfig, ObservedLCEL
+
+    def observe(chain):
+        """Wrap a raw LCEL chain with GAI observability"""
+        return Observed(chain, observe_config=Config(has_hc_data=False))
+
+    return observe
+
+
+def load_backend(max_tokens: int = 15000, temperature: float = 0.5) -> GAIBackend:
+    """
+    Import the gateway client and build the LLM runnable.
+
+    The client configured for LINKEDIN_GAI_RESOURCE_ID/LINKEDIN_GAI_DEPLOYMENT_ID
+    is the availability check itself: if lipy-langchain is missing or the
+    client cannot be constructed, a mock runnable is returned instead. This
+    is slow (heavy imports), so callers run it off the request path.
+
+    Returns:
+        The backend to compile chains against
+    """
+    try:
+        llm = create_linkedin_gai_runnable(
+            resource_id=os.getenv("LINKEDIN_GAI_RESOURCE_ID", "swc-generativeai-prod-001"),
+            deployment_id=os.getenv("LINKEDIN_GAI_DEPLOYMENT_ID", "shared-paygo-gpt41nano-0414"),
+            max_tokens=max_tokens,
+            temperature=temperature,
+        )
+        available = True
+    except ImportError:
+        logger.info("lipy-langchain not installed, using mock GAI backend")
+        llm, available = create_mock_runnable(), False
+    except Exception as e:
+        # LinkedIn infrastructure not available, fall back to mock
+        logger.warning("LinkedIn GAI client unavailable, using mock GAI backend: %s", e)
+        llm, available = create_mock_runnable(), False
+    return GAIBackend(llm=llm, available=available, observe=_observer())
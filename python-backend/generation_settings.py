@@ -0,0 +1,280 @@
+"""
+Per-operation generation settings for LinkedIn GAI calls
+max_tokens, temperature and stop sequences chosen per call from the operation, the input size and observed output lengths
+"""
+
+import contextvars
+import json
+import logging
+import math
+import os
+import threading
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class GenerationSettings:
+    """
+    Model parameters for one LLM call.
+
+    Attributes:
+        budget: Input-scaled output limit the call was sized from, before adaptation;
+                observed output lengths are learned relative to it
+    """
+    max_tokens: int
+    temperature: float
+    stop: Optional[Tuple[str, ...]] = None
+    budget: Optional[int] = None
+
+    def model_kwargs(self) -> Dict[str, Any]:
+        """Keyword arguments to bind onto the chat model"""
+        kwargs: Dict[str, Any] = {"max_tokens": self.max_tokens, "temperature": self.temperature}
+        if self.stop:
+            kwargs["stop"] = list(self.stop)
+        return kwargs
+
+
+@dataclass(frozen=True)
+class OutputPolicy:
+    """
+    How max_tokens is chosen for an operation.
+
+    Attributes:
+        floor: Smallest max_tokens ever used
+        ceiling: Largest max_tokens ever used, and the starting point before outputs are observed
+        per_input_token: If set, max_tokens starts at floor plus this many tokens per prompt-context token
+                         instead of the ceiling (long profiles need long resumes)
+        temperature: Sampling temperature
+        stop: Optional stop sequences
+    """
+    floor: int
+    ceiling: int
+    per_input_token: float = 0.0
+    temperature: float = 0.5
+    stop: Optional[Tuple[str, ...]] = None
+
+
+# generate_post asks for 150-300 words (~400 tokens); JSON operations scale with the resume or profile they describe
+DEFAULT_POLICIES: Dict[str, OutputPolicy] = {
+    # A resume from the URL alone still runs to a few thousand tokens, so the floor covers a whole resume
+    "generate_resume": OutputPolicy(floor=4000, ceiling=10000, per_input_token=1.0, temperature=0.5),
+    "analyze_job_match": OutputPolicy(floor=400, ceiling=1200, temperature=0.2),
+    "generate_post": OutputPolicy(floor=300, ceiling=700, temperature=0.7),
+    "polish_resume": OutputPolicy(floor=800, ceiling=3000, per_input_token=0.5, temperature=0.3),
+    "polish_resume_local_keywords": OutputPolicy(floor=600, ceiling=2600, per_input_token=0.5, temperature=0.3),
+    "polish_resume_sections": OutputPolicy(floor=300, ceiling=2000, per_input_token=0.5, temperature=0.3),
+    # Section-wise resume generation: one paragraph, up to 5 bullets, up to 15 skills
+    "resume_summary": OutputPolicy(floor=150, ceiling=400, temperature=0.5),
+    "resume_experience": OutputPolicy(floor=200, ceiling=600, temperature=0.5),
+    "resume_skills": OutputPolicy(floor=100, ceiling=300, temperature=0.3),
+}
+
+# Used for operations without a policy; matches the single client the service used to share
+FALLBACK_POLICY = OutputPolicy(floor=2000, ceiling=15000, temperature=0.5)
+
+_current: contextvars.ContextVar[Optional[GenerationSettings]] = contextvars.ContextVar("gai_generation_settings", default=None)
+# Filled by the gateway runnable with the usage it reports for the current call
+_usage: contextvars.ContextVar[Optional[Dict[str, Any]]] = contextvars.ContextVar("gai_generation_usage", default=None)
+
+
+def current() -> Optional[GenerationSettings]:
+    """Settings for the LLM call running in this context, read by the GAI runnable"""
+    return _current.get()
+
+
+@contextmanager
+def use(settings: GenerationSettings, usage: Optional[Dict[str, Any]] = None) -> Iterator[GenerationSettings]:
+    """
+    Apply settings to LLM calls made inside the block.
+
+    Args:
+        settings: Settings for the calls
+        usage: Dict that receives the gateway's "output_tokens" and "finish_reason" for the call, if it reports them
+    """
+    previous, previous_usage = _current.get(), _usage.get()
+    _current.set(settings)
+    _usage.set(usage)
+    try:
+        yield settings
+    finally:
+        # set() rather than reset(token): the block may span yields of an async generator
+        _current.set(previous)
+        _usage.set(previous_usage)
+
+
+def report_usage(output_tokens: Optional[int] = None, finish_reason: Optional[str] = None) -> None:
+    """Record what the gateway reported for the current call; a no-op outside use(..., usage)"""
+    usage = _usage.get()
+    if usage is None:
+        return
+    if output_tokens is not None:
+        usage["output_tokens"] = output_tokens
+    if finish_reason is not None:
+        usage["finish_reason"] = finish_reason
+
+
+def _percentile(sorted_values, q: float) -> int:
+    rank = max(1, math.ceil(q / 100.0 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class GenerationTuner:
+    """
+    Chooses GenerationSettings per call and learns output lengths.
+
+    Each call has a budget: the operation's ceiling or, for operations
+    whose output grows with their input, floor plus per_input_token times
+    the prompt context size. max_tokens starts at the budget (capped at the
+    ceiling). Outputs are learned as a fraction of their call's budget, so
+    once min_samples outputs have been observed max_tokens is tightened to
+    headroom times the p99 fraction times this call's budget: a long
+    profile still gets a proportionally long limit. It never drops below
+    the floor. Outputs the gateway reports as cut off (finish_reason
+    "length"), or that reach the limit, count as truncated and push the
+    p99, and so the limit, back up.
+    """
+
+    def __init__(
+        self,
+        policies: Optional[Dict[str, OutputPolicy]] = None,
+        adaptive: bool = True,
+        headroom: float = 1.5,
+        window: int = 200,
+        min_samples: int = 20,
+    ):
+        """
+        Args:
+            policies: Operation -> OutputPolicy, defaults to DEFAULT_POLICIES
+            adaptive: Tighten max_tokens from observed output lengths
+            headroom: Multiplier on the p99 observed output length
+            window: Recent outputs kept per operation
+            min_samples: Outputs needed before adapting
+        """
+        self.policies = dict(policies or DEFAULT_POLICIES)
+        self.adaptive = adaptive
+        self.headroom = headroom
+        self.window = window
+        self.min_samples = min_samples
+        self._lock = threading.Lock()
+        self._outputs: Dict[str, Deque[int]] = {}
+        self._ratios: Dict[str, Deque[float]] = {}
+        self._truncated: Dict[str, int] = {}
+        self._last: Dict[str, int] = {}
+
+    @classmethod
+    def from_env(cls) -> "GenerationTuner":
+        """
+        Settings (environment), per operation NAME in upper case:
+            LINKEDIN_GAI_<NAME>_MAX_TOKENS: ceiling for max_tokens
+            LINKEDIN_GAI_<NAME>_MIN_TOKENS: floor for max_tokens
+            LINKEDIN_GAI_<NAME>_TEMPERATURE: sampling temperature
+            LINKEDIN_GAI_<NAME>_STOP: JSON array of stop sequences
+            LINKEDIN_GAI_ADAPTIVE_MAX_TOKENS: "0" disables adapting to observed output lengths
+            LINKEDIN_GAI_MAX_TOKENS_HEADROOM: multiplier on the p99 output length, default 1.5
+        """
+        policies = {}
+        for name, policy in DEFAULT_POLICIES.items():
+            prefix = f"LINKEDIN_GAI_{name.upper()}"
+            stop = os.getenv(f"{prefix}_STOP")
+            policies[name] = OutputPolicy(
+                floor=int(os.getenv(f"{prefix}_MIN_TOKENS", str(policy.floor))),
+                ceiling=int(os.getenv(f"{prefix}_MAX_TOKENS", str(policy.ceiling))),
+                per_input_token=policy.per_input_token,
+                temperature=float(os.getenv(f"{prefix}_TEMPERATURE", str(policy.temperature))),
+                stop=tuple(json.loads(stop)) if stop else policy.stop,
+            )
+        return cls(
+            policies,
+            adaptive=os.getenv("LINKEDIN_GAI_ADAPTIVE_MAX_TOKENS", "1") != "0",
+            headroom=float(os.getenv("LINKEDIN_GAI_MAX_TOKENS_HEADROOM", "1.5")),
+        )
+
+    def settings_for(self, operation: str, input_tokens: int = 0) -> GenerationSettings:
+        """
+        Args:
+            operation: GAI operation name
+            input_tokens: Approximate size of the prompt context
+
+        Returns:
+            Settings for one call of the operation
+        """
+        policy = self.policies.get(operation, FALLBACK_POLICY)
+        budget = policy.floor + int(policy.per_input_token * input_tokens) if policy.per_input_token else policy.ceiling
+        limit = min(policy.ceiling, budget)
+        if self.adaptive:
+            with self._lock:
+                ratios = self._ratios.get(operation)
+                observed = _percentile(sorted(ratios), 99) if ratios and len(ratios) >= self.min_samples else None
+            if observed is not None:
+                limit = min(limit, math.ceil(observed * self.headroom * budget))
+        limit = max(policy.floor, limit)
+        with self._lock:
+            self._last[operation] = limit
+        return GenerationSettings(max_tokens=limit, temperature=policy.temperature, stop=policy.stop, budget=budget)
+
+    def observe(
+        self,
+        operation: str,
+        output_tokens: int,
+        settings: Optional[GenerationSettings] = None,
+        exact: bool = False,
+        finish_reason: Optional[str] = None,
+    ) -> None:
+        """
+        Record the length of a completed output.
+
+        Args:
+            operation: GAI operation name
+            output_tokens: Output length in tokens
+            settings: Settings the call ran with
+            exact: output_tokens comes from the gateway's usage report rather than count_tokens()
+            finish_reason: Gateway finish reason, if reported; "length" means the output was cut off
+
+        Without a finish reason, an exact count within 5% of max_tokens counts as
+        truncated; an approximate one only at max_tokens, since count_tokens()
+        overcounts JSON punctuation.
+        """
+        with self._lock:
+            outputs = self._outputs.get(operation)
+            if outputs is None:
+                outputs = self._outputs[operation] = deque(maxlen=self.window)
+            outputs.append(output_tokens)
+            if settings is not None and settings.budget:
+                ratios = self._ratios.get(operation)
+                if ratios is None:
+                    ratios = self._ratios[operation] = deque(maxlen=self.window)
+                ratios.append(output_tokens / settings.budget)
+            if finish_reason is not None:
+                truncated = finish_reason == "length"
+            else:
+                truncated = settings is not None and output_tokens >= (0.95 if exact else 1.0) * settings.max_tokens
+            if truncated:
+                self._truncated[operation] = self._truncated.get(operation, 0) + 1
+                logger.warning("%s output reached max_tokens (%d)", operation, settings.max_tokens if settings else -1)
+
+    def stats(self) -> Dict[str, Any]:
+        """Policy, last chosen max_tokens and observed output-length percentiles per operation"""
+        with self._lock:
+            result = {}
+            for name in sorted(set(self.policies) | set(self._outputs)):
+                policy = self.policies.get(name, FALLBACK_POLICY)
+                outputs = sorted(self._outputs.get(name, ()))
+                ratios = sorted(self._ratios.get(name, ()))
+                result[name] = {
+                    "floor": policy.floor,
+                    "ceiling": policy.ceiling,
+                    "temperature": policy.temperature,
+                    "last_max_tokens": self._last.get(name),
+                    "samples": len(outputs),
+                    "output_tokens_p50": _percentile(outputs, 50) if outputs else None,
+                    "output_tokens_p95": _percentile(outputs, 95) if outputs else None,
+                    "output_tokens_p99": _percentile(outputs, 99) if outputs else None,
+                    "output_budget_ratio_p99": round(_percentile(ratios, 99), 4) if ratios else None,
+                    "truncated": self._truncated.get(name, 0),
+                }
+            return {"adaptive": self.adaptive, "headroom": self.headroom, "operations": result}
@@ -0,0 +1,229 @@
+"""
+Precomputed job features for LinkedIn GAI operations
+Normalized posting text, required skills, ATS keywords and a compact summary per job, stored by job id and content hash
+"""
+
+import logging
+import threading
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
+
+from context_compactor import ContextCompactor, compact_text, count_tokens
+from job_index import STOPWORDS
+from result_cache import ResultCache, canonical_key
+from skill_matcher import SkillMatcher, tokenize
+
+if TYPE_CHECKING:
+    from keyword_engine import KeywordEngine
+
+logger = logging.getLogger(__name__)
+
+# Bump when the feature computation changes so stored features are recomputed
+FEATURES_VERSION = 1
+
+MAX_KEYWORDS = 25
+
+# Posting vocabulary that is frequent everywhere and never worth matching on, on top of the index stopwords
+KEYWORD_STOPWORDS = STOPWORDS | frozenset("""
+required requirements preferred qualifications responsibilities candidate candidates looking join company
+opportunity position apply ideal bonus etc new like great help make own once across every each other able
+""".split())
+SUMMARY_TOKENS = 120
+
+
+@dataclass
+class JobFeatures:
+    """
+    Everything derived from one job posting.
+
+    Attributes:
+        content_hash: Hash of the raw posting fields the features were computed from
+        requirements: Normalized requirements, boilerplate and duplicate sentences removed, within the prompt budget
+        description: Normalized description, without sentences already in the requirements, within the prompt budget
+        skills: Vocabulary and listed skills, most emphasized first
+        skill_counts: Mentions per vocabulary skill
+        keywords: Frequent non-stopword terms (ATS keywords), most frequent first
+        summary: Title, top skills and opening sentences in about SUMMARY_TOKENS tokens
+        tokens_raw: Approximate tokens of the raw requirements and description
+        tokens_compact: Approximate tokens of requirements and description after normalization and budgeting
+        job_id: Id the job was stored under, if any
+    """
+    content_hash: str
+    requirements: str
+    description: str
+    skills: List[str] = field(default_factory=list)
+    skill_counts: Dict[str, int] = field(default_factory=dict)
+    keywords: List[str] = field(default_factory=list)
+    summary: str = ""
+    tokens_raw: int = 0
+    tokens_compact: int = 0
+    job_id: Optional[str] = None
+
+    @property
+    def text(self) -> str:
+        """Requirements and description, as matched against user skills"""
+        return f"{self.requirements}\n{self.description}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def content_hash(requirements: str, description: str, title: Optional[str] = None, skills: Optional[Iterable[str]] = None) -> str:
+    """Hash of the posting fields features are derived from"""
+    return canonical_key("job_features", {
+        "version": FEATURES_VERSION,
+        "title": title or "",
+        "requirements": requirements or "",
+        "description": description or "",
+        "skills": sorted(skills or []),
+    })
+
+
+def extract_keywords(text: str, limit: int = MAX_KEYWORDS) -> List[str]:
+    """Most frequent terms of at least three characters that are not stopwords"""
+    counts = Counter(token for token in tokenize(text) if len(token) > 2 and token not in KEYWORD_STOPWORDS and not token.isdigit())
+    return [term for term, _ in counts.most_common(limit)]
+
+
+class JobFeatureStore:
+    """
+    Computes JobFeatures once per posting and serves them afterwards.
+
+    Features are stored by content hash (so identical postings under
+    different ids share them) and job ids map to the hash they were last
+    stored with; a job whose text changed gets fresh features. Text is
+    normalized with the analyze_job_match budgets of the context compactor,
+    and those budgets are part of the storage key, so changing them
+    recomputes the features instead of serving text trimmed to the old ones.
+    Other operations (polish) compact the raw posting with their own budgets.
+    """
+
+    def __init__(
+        self,
+        matcher: Optional[SkillMatcher] = None,
+        compactor: Optional[ContextCompactor] = None,
+        keyword_engine: Optional["KeywordEngine"] = None,
+        max_entries: int = 4096,
+        ttl_seconds: Optional[float] = 604800,
+        disk_path: Optional[str] = None,
+    ):
+        """
+        Args:
+            matcher: Skill vocabulary used for extraction
+            compactor: Supplies the text normalization and budgets, defaults to ContextCompactor()
+            keyword_engine: Corpus every posting's text is added to for TF-IDF keywords
+            max_entries: In-memory entries per tier (features, and job id mappings)
+            ttl_seconds: Time-to-live of stored features
+            disk_path: Optional SQLite file shared with the result caches
+        """
+        self._matcher = matcher or SkillMatcher()
+        self._compactor = compactor or ContextCompactor()
+        self._keyword_engine = keyword_engine
+        self._features = ResultCache(max_entries=max_entries, ttl_seconds=ttl_seconds, disk_path=disk_path, namespace="job_features")
+        self._ids = ResultCache(max_entries=max_entries, ttl_seconds=ttl_seconds, disk_path=disk_path, namespace="job_feature_ids")
+        self._lock = threading.Lock()
+        self._computed = 0
+        self._reused = 0
+
+    def features(
+        self,
+        requirements: str,
+        description: str,
+        job_id: Optional[str] = None,
+        title: Optional[str] = None,
+        skills: Optional[Iterable[str]] = None,
+    ) -> JobFeatures:
+        """
+        Features for a posting, computed on first use.
+
+        Args:
+            requirements: Raw requirements text
+            description: Raw description text
+            job_id: Job identifier to store the features under, if known
+            title: Job title, used in the summary
+            skills: Explicitly listed job skills
+
+        Returns:
+            The posting's features
+        """
+        skills = [skill for skill in (skills or []) if skill]
+        digest = content_hash(requirements, description, title, skills)
+        key = self._storage_key(digest)
+        stored = self._features.get(key)
+        if stored is not None:
+            with self._lock:
+                self._reused += 1
+            features = JobFeatures(**stored)
+        else:
+            features = self._compute(digest, requirements or "", description or "", title, skills)
+            self._features.set(key, features.to_dict())
+            with self._lock:
+                self._computed += 1
+        if self._keyword_engine is not None and digest not in self._keyword_engine:
+            # Also covers features another worker computed into the shared cache
+            self._keyword_engine.add(digest, features.text)
+        if job_id is not None:
+            job_id = str(job_id)
+            self._ids.set(job_id, key)
+            features.job_id = job_id
+        return features
+
+    def get(self, job_id: str) -> Optional[JobFeatures]:
+        """Features last stored for a job id, or None"""
+        key = self._ids.get(str(job_id))
+        stored = self._features.get(key) if key else None
+        if stored is None:
+            return None
+        features = JobFeatures(**stored)
+        features.job_id = str(job_id)
+        return features
+
+    def invalidate(self, job_id: str) -> None:
+        """Forget which features a job id maps to"""
+        self._ids.invalidate(str(job_id))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"computed": self._computed, "reused": self._reused, "cache": self._features.stats()}
+
+    def _storage_key(self, digest: str) -> str:
+        # Features depend on the analyze_job_match budgets as well as the posting
+        return canonical_key("job_features_budgeted", {
+            "content": digest,
+            "enabled": self._compactor.enabled,
+            "budgets": self._compactor.budgets.get("analyze_job_match", {}),
+        })
+
+    def _compute(self, digest: str, requirements: str, description: str, title: Optional[str], listed: List[str]) -> JobFeatures:
+        compacted = self._compactor.compact("analyze_job_match", {
+            "job_requirements": requirements,
+            "job_description": description,
+        })
+        text = f"{compacted['job_requirements']}\n{compacted['job_description']}"
+        # Skills and keywords come from the whole posting, not just the part within the prompt budget
+        raw = f"{requirements}\n{description}"
+        unbudgeted, _ = compact_text(raw)
+
+        skill_counts = self._matcher.extract_skills(raw)
+        for skill in listed:
+            name = self._matcher.canonical_skill(skill) or skill.strip()
+            # Explicitly listed skills count as strongly as repeated mentions
+            skill_counts[name] = skill_counts.get(name, 0) + 2
+        skills = sorted(skill_counts, key=lambda name: -skill_counts[name])
+
+        opening, _ = compact_text(compacted["job_description"] or compacted["job_requirements"], SUMMARY_TOKENS)
+        lead = " · ".join(part for part in (title, ", ".join(skills[:8])) if part)
+        summary = f"{lead}\n{opening}".strip() if lead else opening
+
+        return JobFeatures(
+            content_hash=digest,
+            requirements=compacted["job_requirements"],
+            description=compacted["job_description"],
+            skills=skills,
+            skill_counts=skill_counts,
+            keywords=extract_keywords(unbudgeted),
+            summary=summary,
+            tokens_raw=count_tokens(requirements) + count_tokens(description),
+            tokens_compact=count_tokens(text),
+        )
@@ -0,0 +1,198 @@
+"""
+Inverted skill index over job postings
+Ranks jobs for a skill set with sparse scoring so LLM analysis only runs on a shortlist
+"""
+
+import heapq
+import math
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+from skill_matcher import SkillMatcher, tokenize
+
+# Common English and job-posting filler excluded from keyword postings
+STOPWORDS = frozenset("""
+a about above after all also an and any are as at be been being both but by can could do does
+for from has have having how if in into is it its job may more most must not of on or our over
+per plus role should so such than that the their them then there these they this to under up
+us using via was we well were what when where which while who will with within work would you
+your years year experience experienced strong ability skills skill team teams knowledge including
+""".split())
+
+SKILL_PREFIX = "skill:"
+KEYWORD_PREFIX = "kw:"
+# Keyword matches only back up skills the vocabulary does not know
+KEYWORD_WEIGHT = 0.5
+
+
+@dataclass
+class RankedJob:
+    """A job shortlisted for a skill set"""
+    job_id: str
+    score: float
+    matched_terms: List[str] = field(default_factory=list)
+
+
+class JobIndex:
+    """
+    Maps normalized skills and keywords to posting lists of job ids.
+
+    Jobs are added incrementally; each posting stores a log-scaled term
+    weight. A query scores only jobs that share at least one term with the
+    skill set: matched IDF-weighted skill mass over the job's total
+    IDF-weighted skill mass.
+    """
+
+    def __init__(self, matcher: Optional[SkillMatcher] = None):
+        self._matcher = matcher or SkillMatcher()
+        self._postings: Dict[str, Dict[str, float]] = {}
+        self._job_terms: Dict[str, Dict[str, float]] = {}
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def __contains__(self, job_id: str) -> bool:
+        return job_id in self._jobs
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """The job payload stored when it was indexed"""
+        return self._jobs.get(job_id)
+
+    def add_job(self, job_id: str, text: str, skills: Optional[Iterable[str]] = None, payload: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Index or re-index one job.
+
+        Args:
+            job_id: Unique job identifier
+            text: Requirements and description text
+            skills: Explicitly listed job skills, if any
+            payload: Job data kept for later analysis of shortlisted jobs
+
+        Returns:
+            Number of distinct terms indexed for the job
+        """
+        terms = self._job_term_weights(text, skills or [])
+        with self._lock:
+            self._remove(job_id)
+            for term, weight in terms.items():
+                self._postings.setdefault(term, {})[job_id] = weight
+            self._job_terms[job_id] = terms
+            self._jobs[job_id] = payload or {}
+        return len(terms)
+
+    def remove_job(self, job_id: str) -> bool:
+        """Drop a job from the index; returns False if it was not indexed"""
+        with self._lock:
+            return self._remove(job_id)
+
+    def top_k(self, user_skills: Iterable[str], k: int = 20) -> List[RankedJob]:
+        """
+        Rank indexed jobs for a skill set.
+
+        Args:
+            user_skills: User's skills, in any spelling/case
+            k: Number of jobs to return
+
+        Returns:
+            Up to k jobs, best first
+        """
+        query = self._query_terms(user_skills)
+        n_jobs = len(self._jobs)
+        if not query or not n_jobs:
+            return []
+
+        idf = {}
+        numerators: Dict[str, float] = {}
+        matched: Dict[str, List[str]] = {}
+        for term, factor in query.items():
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf[term] = self._idf(len(postings), n_jobs)
+            for job_id, weight in postings.items():
+                numerators[job_id] = numerators.get(job_id, 0.0) + factor * idf[term] * weight
+                matched.setdefault(job_id, []).append(term)
+
+        def score(job_id: str) -> float:
+            mass = 0.0
+            for term, weight in self._job_terms[job_id].items():
+                if term.startswith(SKILL_PREFIX):
+                    mass += self._idf(len(self._postings[term]), n_jobs) * weight
+            if not mass:
+                # Jobs without recognizable skills rank on keyword overlap alone
+                return min(1.0, numerators[job_id] / (1.0 + numerators[job_id]))
+            return min(1.0, numerators[job_id] / mass)
+
+        scored = ((score(job_id), job_id) for job_id in numerators)
+        best = heapq.nlargest(k, scored, key=lambda pair: (pair[0], numerators[pair[1]]))
+        return [
+            RankedJob(
+                job_id=job_id,
+                score=round(value, 4),
+                matched_terms=[term.split(":", 1)[1] for term in matched[job_id]],
+            )
+            for value, job_id in best
+        ]
+
+    def stats(self) -> Dict[str, int]:
+        """Index size counters"""
+        return {
+            "jobs": len(self._jobs),
+            "terms": len(self._postings),
+            "postings": sum(len(postings) for postings in self._postings.values()),
+        }
+
+    @staticmethod
+    def _idf(document_frequency: int, n_jobs: int) -> float:
+        return math.log(1.0 + (n_jobs - document_frequency + 0.5) / (document_frequency + 0.5))
+
+    def _remove(self, job_id: str) -> bool:
+        terms = self._job_terms.pop(job_id, None)
+        if terms is None:
+            return False
+        for term in terms:
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(job_id, None)
+                if not postings:
+                    del self._postings[term]
+        self._jobs.pop(job_id, None)
+        return True
+
+    def _job_term_weights(self, text: str, skills: Iterable[str]) -> Dict[str, float]:
+        counts: Dict[str, int] = {}
+        for name, count in self._matcher.extract_skills(text).items():
+            counts[SKILL_PREFIX + name.lower()] = count
+        for skill in skills:
+            term = self._skill_term(skill)
+            if term:
+                # Explicitly listed skills count as strongly as repeated mentions
+                counts[term] = counts.get(term, 0) + 2
+        for token in tokenize(text):
+            if len(token) > 2 and token not in STOPWORDS:
+                term = KEYWORD_PREFIX + token
+                counts[term] = counts.get(term, 0) + 1
+        return {term: 1.0 + math.log(count) for term, count in counts.items()}
+
+    def _skill_term(self, skill: str) -> Optional[str]:
+        canonical = self._matcher.canonical_skill(skill)
+        if canonical:
+            return SKILL_PREFIX + canonical.lower()
+        phrase = " ".join(tokenize(skill))
+        return SKILL_PREFIX + phrase if phrase else None
+
+    def _query_terms(self, user_skills: Iterable[str]) -> Dict[str, float]:
+        query: Dict[str, float] = {}
+        for skill in user_skills:
+            term = self._skill_term(skill)
+            if not term:
+                continue
+            query[term] = 1.0
+            if self._matcher.canonical_skill(skill) is None:
+                tokens = [token for token in tokenize(skill) if token not in STOPWORDS]
+                for token in tokens:
+                    query.setdefault(KEYWORD_PREFIX + token, KEYWORD_WEIGHT / len(tokens))
+        return query
@@ -0,0 +1,243 @@
+"""
+Corpus-level TF-IDF keyword engine for ATS keyword optimization
+Incrementally updated sparse term statistics over every job seen; distinctive keywords per job and their coverage in a resume, no LLM call
+"""
+
+import threading
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from job_features import KEYWORD_STOPWORDS
+from skill_matcher import SkillMatcher, tokenize
+
+# Resume sections searched for keywords, in the order usage is reported
+RESUME_SECTIONS = ("summary", "experience", "skills", "education")
+
+
+def _keyword_token(token: str) -> bool:
+    return len(token) > 2 and token not in KEYWORD_STOPWORDS and not token.isdigit()
+
+
+def extract_terms(text: str, matcher: SkillMatcher) -> Tuple[Counter, Dict[str, str]]:
+    """
+    Keyword terms in text with their counts.
+
+    Terms are single keyword tokens plus vocabulary skills, which also
+    covers short skills like "Go" and multi-word ones like "Machine
+    Learning". Arbitrary word pairs are left out: in a single posting they
+    are almost all unique, so their IDF would crowd out real keywords.
+
+    Returns:
+        (term -> count, term -> display form for terms that are vocabulary skills)
+    """
+    counts: Counter = Counter(token for token in tokenize(text) if _keyword_token(token))
+    display: Dict[str, str] = {}
+    for name, count in matcher.extract_skills(text).items():
+        term = " ".join(tokenize(name)) or name.lower()
+        counts[term] = max(counts[term], count)
+        display[term] = name
+    return counts, display
+
+
+@dataclass
+class KeywordGap:
+    """One distinctive job keyword and how the resume uses it"""
+    keyword: str
+    weight: float
+    resume_count: int = 0
+    sections: List[str] = field(default_factory=list)
+
+    @property
+    def present(self) -> bool:
+        return self.resume_count > 0
+
+
+class KeywordEngine:
+    """
+    TF-IDF statistics over a corpus of job postings.
+
+    Each job is a sparse row (term column indices and log-scaled term
+    frequencies as NumPy arrays); document frequencies live in one dense
+    vector indexed by term column and are updated as jobs are added and
+    evicted, so the IDF is always current without a rebuild. A term whose
+    document frequency drops to zero is forgotten and its column reused,
+    so the vocabulary stays bounded by the live corpus. A job's
+    keywords are its terms ranked by tf * idf: the terms it stresses that
+    the rest of the corpus does not.
+    """
+
+    def __init__(self, matcher: Optional[SkillMatcher] = None, max_jobs: int = 20000):
+        """
+        Args:
+            matcher: Skill vocabulary, so skill names count as keywords in their canonical spelling
+            max_jobs: Jobs kept in the corpus; the oldest are evicted first
+        """
+        self._matcher = matcher or SkillMatcher()
+        self.max_jobs = max_jobs
+        self._columns: Dict[str, int] = {}
+        self._terms: List[str] = []
+        self._display: Dict[int, str] = {}
+        self._df = np.zeros(1024, dtype=np.int32)
+        self._free: List[int] = []
+        self._rows: "OrderedDict[str, Tuple[np.ndarray, np.ndarray]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, job_key: str) -> bool:
+        return job_key in self._rows
+
+    def add(self, job_key: str, text: str) -> int:
+        """
+        Add or replace a job in the corpus.
+
+        Args:
+            job_key: Job identifier (e.g. the job feature content hash)
+            text: Posting text
+
+        Returns:
+            Number of distinct terms in the job
+        """
+        counts, display = extract_terms(text, self._matcher)
+        with self._lock:
+            self._remove(job_key)
+            columns = np.fromiter((self._column(term, display.get(term)) for term in counts), dtype=np.int32, count=len(counts))
+            tf = 1.0 + np.log(np.fromiter(counts.values(), dtype=np.float64, count=len(counts)))
+            self._df[columns] += 1
+            self._rows[job_key] = (columns, tf)
+            while len(self._rows) > self.max_jobs:
+                self._remove(next(iter(self._rows)))
+        return len(counts)
+
+    def remove(self, job_key: str) -> bool:
+        """Drop a job from the corpus; returns False if it was not there"""
+        with self._lock:
+            return self._remove(job_key)
+
+    def keywords(self, job_key: str, top_k: int = 20) -> List[Tuple[str, float]]:
+        """
+        The job's most distinctive terms.
+
+        Returns:
+            Up to top_k (keyword, tf-idf weight) pairs, best first; empty if the job is unknown
+        """
+        with self._lock:
+            row = self._rows.get(job_key)
+            if row is None:
+                return []
+            columns, tf = row
+            n_jobs = len(self._rows)
+            # Smoothed IDF: a term in every job still weighs 1
+            idf = np.log((1.0 + n_jobs) / (1.0 + self._df[columns])) + 1.0
+            weights = tf * idf
+            k = min(top_k, len(weights))
+            top = np.argpartition(-weights, k - 1)[:k] if k < len(weights) else np.arange(len(weights))
+            top = top[np.argsort(-weights[top], kind="stable")]
+            return [
+                (self._display.get(int(columns[i]), self._terms[int(columns[i])]), round(float(weights[i]), 4))
+                for i in top
+            ]
+
+    def gaps(self, job_key: str, resume_data: Dict[str, Any], top_k: int = 20) -> List[KeywordGap]:
+        """
+        The job's keywords and where the resume uses them.
+
+        Args:
+            job_key: Job identifier passed to add()
+            resume_data: Resume content (summary, experience, skills, education)
+            top_k: Number of job keywords to check
+
+        Returns:
+            One KeywordGap per keyword, best first
+        """
+        usage = {section: extract_terms(resume_section_text(resume_data, section), self._matcher)[0] for section in RESUME_SECTIONS}
+        gaps = []
+        for keyword, weight in self.keywords(job_key, top_k):
+            term = " ".join(tokenize(keyword)) or keyword.lower()
+            sections = [section for section in RESUME_SECTIONS if usage[section].get(term)]
+            gaps.append(KeywordGap(
+                keyword=keyword,
+                weight=weight,
+                resume_count=sum(usage[section][term] for section in sections),
+                sections=sections,
+            ))
+        return gaps
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "jobs": len(self._rows),
+                "terms": len(self._columns),
+                "nonzeros": int(sum(len(columns) for columns, _ in self._rows.values())),
+            }
+
+    def _column(self, term: str, display: Optional[str]) -> int:
+        column = self._columns.get(term)
+        if column is None and self._free:
+            column = self._columns[term] = self._free.pop()
+            self._terms[column] = term
+        elif column is None:
+            column = self._columns[term] = len(self._terms)
+            self._terms.append(term)
+            if column >= len(self._df):
+                self._df = np.concatenate([self._df, np.zeros(len(self._df), dtype=np.int32)])
+        if display:
+            self._display[column] = display
+        return column
+
+    def _remove(self, job_key: str) -> bool:
+        row = self._rows.pop(job_key, None)
+        if row is None:
+            return False
+        columns = row[0]
+        self._df[columns] -= 1
+        # Forget terms no remaining job uses, and reuse their columns
+        for column in columns[self._df[columns] == 0].tolist():
+            del self._columns[self._terms[column]]
+            self._display.pop(column, None)
+            self._terms[column] = ""
+            self._free.append(column)
+        return True
+
+
+def resume_section_text(resume_data: Dict[str, Any], section: str) -> str:
+    """All text of one resume section, flattened"""
+    return "\n".join(_strings(resume_data.get(section)))
+
+
+def _strings(value: Any) -> Iterable[str]:
+    if isinstance(value, dict):
+        for item in value.values():
+            yield from _strings(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _strings(item)
+    elif isinstance(value, str):
+        yield value
+
+
+def keyword_optimization(gaps: List[KeywordGap]) -> List[Dict[str, str]]:
+    """Gaps in the keywordOptimization shape of the polish response, missing keywords first"""
+    entries = []
+    for gap in sorted(gaps, key=lambda gap: gap.present):
+        if gap.present:
+            usage = f"Used {gap.resume_count} time{'s' if gap.resume_count != 1 else ''} in {', '.join(gap.sections)}"
+            suggestion = (
+                f"Also mention {gap.keyword} in your experience bullets" if "experience" not in gap.sections
+                else f"Keep {gap.keyword} prominent; it is distinctive for this job"
+            )
+        else:
+            usage = "Missing from the resume"
+            suggestion = f"Add {gap.keyword} where it reflects real experience, e.g. in skills or a relevant bullet"
+        entries.append({"keyword": gap.keyword, "currentUsage": usage, "suggestion": suggestion})
+    return entries
+
+
+def coverage(gaps: List[KeywordGap]) -> float:
+    """Share of the keywords' total weight the resume covers"""
+    total = sum(gap.weight for gap in gaps)
+    return round(sum(gap.weight for gap in gaps if gap.present) / total, 4) if total else 0.0
@@ -5,125 +5,385 @@ This module handles integration with LinkedIn's GAI gateway for AI-powered featu
 
 import os
 import re
-from typing import Dict, Any, Optional, List
+import sqlite3
+import time
+import asyncio
+import contextlib
+import contextvars
+import threading
+from typing import TYPE_CHECKING, AsyncContextManager, Callable, Dict, Any, Optional, List, AsyncIterator, TypedDict
 import json
 import logging
 
 # Configure logger for this module
 logger = logging.getLogger(__name__)
 
-from langchain_core.output_parsers import StrOutputParser
-from langchain_core.prompts import ChatPromptTemplate
 from dotenv import load_dotenv
 
-# LinkedIn GAI imports - based on lss-gai-mt examples
-try:
-    from linkedin.langchain import ProxiedGPTChat
-    from langchain_core.runnables import RunnableLambda
-    
-    # Try to import optional observability components
-    try:
-        from linkedin.gai_observe_langchain.observed_lcel import ObserveConfig, ObservedLCEL
-        HAS_OBSERVABILITY = True
-    except ImportError:
-        # Create mock observability classes if not available
-        HAS_OBSERVABILITY = False
-        class ObserveConfig:
-            def __init__(self, has_hc_data=False):
-                self.has_hc_data = has_hc_data
-        
-        class ObservedLCEL:
-            def __init__(self, chain, observe_config=None):
-                self.chain = chain
-            
-            async def ainvoke(self, inputs):
-                return await self.chain.ainvoke(inputs)
-    
-    # Try to import atomic reader (optional)
-    try:
-        from linkedin.langchain.serialization.atomic.loading import AtomicReader
-    except ImportError:
-        class AtomicReader:
-            def __init__(self, source="LOCAL"):
-                self.source = source
-    
-    # Test if we can actually initialize ProxiedGPTChat (requires LinkedIn infrastructure)
-    try:
-        test_client = ProxiedGPTChat(resource_id="test", deployment_id="test")
-        LINKEDIN_GAI_AVAILABLE = True
-        
-        # Create a wrapper to make ProxiedGPTChat compatible with LangChain
-        def create_linkedin_gai_runnable(resource_id=None, deployment_id=None, max_tokens=2000, temperature=0.7):
-            gai_client = ProxiedGPTChat(
-                resource_id=resource_id,
-                deployment_id=deployment_id,
-                max_tokens=max_tokens,
-                temperature=temperature
-            )
-            
-            async def gai_invoke(inputs):
-                # Convert inputs to the format expected by ProxiedGPTChat
-                if isinstance(inputs, dict) and 'messages' in inputs:
-                    return await gai_client.ainvoke(inputs['messages'])
-                elif isinstance(inputs, list):
-                    return await gai_client.ainvoke(inputs)
-                else:
-                    # Handle string inputs by converting to message format
-                    messages = [{"role": "user", "content": str(inputs)}]
-                    return await gai_client.ainvoke(messages)
-            
-            return RunnableLambda(gai_invoke)
-            
-    except Exception:
-        # LinkedIn infrastructure not available, fall back to mock
-        LINKEDIN_GAI_AVAILABLE = False
-        raise ImportError("LinkedIn infrastructure not available")
-    
-except ImportError:
-    LINKEDIN_GAI_AVAILABLE = False
-    from langchain_core.runnables import RunnableLambda
-    # Mock classes for development environment
-    class ObserveConfig:
-        def __init__(self, has_hc_data=False):
-            self.has_hc_data = has_hc_data
-    
-    class ObservedLCEL:
-        def __init__(self, chain, observe_config=None):
-            self.chain = chain
-        
-        async def ainvoke(self, inputs):
-            return await self.chain.ainvoke(inputs)
-    
-    def create_linkedin_gai_runnable(resource_id=None, deployment_id=None, max_tokens=2000, temperature=0.7):
-        async def mock_gai_invoke(inputs):
-            # Mock response for development
-            return "Mock GAI response - LinkedIn GAI not available in development environment"
-        
-        return RunnableLambda(mock_gai_invoke)
-    
-    class AtomicReader:
-        def __init__(self, source="LOCAL"):
-            self.source = source
+from result_cache import ResultCache, canonical_key, normalize_skills
+from single_flight import SingleFlight
+from shared_flight import SharedFlight
+from skill_matcher import SkillMatcher, compatibility_from_match
+from job_index import JobIndex
+from job_features import JobFeatureStore, JobFeatures
+from keyword_engine import KeywordEngine
+from resume_store import ResumeStore
+import keyword_engine
+from streaming_json import IncrementalJSONParser
+from context_compactor import ContextCompactor, count_tokens
+import resume_sections
+import polish_sections
+from generation_settings import GenerationSettings, GenerationTuner
+import generation_settings
+from log_pipeline import log_payload, truncate
+from deadlines import DeadlineExceeded, iterate_with_deadline, with_deadline
+from circuit_breaker import CircuitBreaker, CircuitOpen
+import metrics
 
-logger = logging.getLogger(__name__)
+if TYPE_CHECKING:
+    from chain_registry import ChainRegistry
 
 load_dotenv()
 
+# Local state files (the generated resume store) default to this directory, created on first use
+DATA_DIR = os.getenv("LINKEDIN_GAI_DATA_DIR") or os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+# Operations that fell back to mock or profile content during the current resume generation; such resumes are not stored
+_resume_fallbacks: contextvars.ContextVar[Optional[List[str]]] = contextvars.ContextVar("gai_resume_fallbacks", default=None)
+
+class ResumeData(TypedDict, total=False):
+    """Resume content returned by generate_resume_from_profile"""
+    personalInfo: Dict[str, Any]
+    summary: str
+    experience: List[Dict[str, Any]]
+    skills: List[str]
+    education: List[Dict[str, Any]]
+
 class LinkedInGAIService:
     """Service class for LinkedIn GAI integration"""
     
-    def __init__(self):
-        # Initialize LinkedIn GAI runnable for LangChain compatibility
-        self.llm = create_linkedin_gai_runnable(
-            resource_id=os.getenv("LINKEDIN_GAI_RESOURCE_ID", "swc-generativeai-prod-001"),
-            deployment_id=os.getenv("LINKEDIN_GAI_DEPLOYMENT_ID", "shared-paygo-gpt41nano-0414"),
-            max_tokens=15000,
-            temperature=0.5,
+    def __init__(self, lazy: bool = False):
+        """
+        Args:
+            lazy: Defer backend detection and chain compilation to warm_up()/start_warm_up()
+                  (or the first LLM call), so constructing the service stays cheap
+        """
+        # Set by warm_up(): the GAI runnable and the prompt chains compiled against it
+        self.llm: Any = None
+        self.chains: Optional["ChainRegistry"] = None
+        self.gai_available = False
+        # Warm-up phase durations in ms, when it finished (perf_counter) and the error if it failed
+        self.startup: Dict[str, float] = {}
+        self.ready_at: Optional[float] = None
+        self.startup_error: Optional[str] = None
+        self._warm_lock = threading.Lock()
+        self._warm_future: Optional[asyncio.Future] = None
+        # Job match results keyed by a canonical hash of the inputs
+        self.match_cache = ResultCache(
+            max_entries=int(os.getenv("LINKEDIN_GAI_MATCH_CACHE_SIZE", "1024")),
+            ttl_seconds=float(os.getenv("LINKEDIN_GAI_MATCH_CACHE_TTL", "86400")),
+            disk_path=os.getenv("LINKEDIN_GAI_CACHE_PATH") or None,
+            namespace="analyze_job_match",
         )
-        self.gai_available = LINKEDIN_GAI_AVAILABLE
-        logger.info(f"LinkedIn GAI Service initialized. GAI Available: {self.gai_available}")
-    
-    async def generate_resume_from_profile(self, linkedin_url: str, target_role: Optional[str] = None, user_profile: Optional[Dict[str, Any]] = None) -> str:
+        # Zero-LLM skill matching, also used when the GAI response is not valid JSON
+        self.skill_matcher = SkillMatcher()
+        # Posting lists of indexed jobs for pre-LLM shortlisting
+        self.job_index = JobIndex(self.skill_matcher)
+        # Identical concurrent LLM calls are coalesced into one
+        self.inflight = SingleFlight()
+        # ...and across worker processes sharing LINKEDIN_GAI_CACHE_PATH
+        shared_path = os.getenv("LINKEDIN_GAI_CACHE_PATH")
+        self.shared_flight = None
+        if shared_path and os.getenv("LINKEDIN_GAI_SHARED_DEDUP", "1") != "0":
+            self.shared_flight = SharedFlight(
+                shared_path,
+                lease_seconds=float(os.getenv("LINKEDIN_GAI_SHARED_LEASE_SECONDS", "120")),
+            )
+        # Fails fast while the gateway is degraded instead of waiting on every call
+        self.breaker = CircuitBreaker.from_env()
+        # Last good raw LLM output per operation and inputs, served while the gateway is failing
+        self.last_good = ResultCache(
+            max_entries=int(os.getenv("LINKEDIN_GAI_STALE_CACHE_SIZE", "512")),
+            ttl_seconds=float(os.getenv("LINKEDIN_GAI_STALE_TTL", "604800")),
+            disk_path=os.getenv("LINKEDIN_GAI_CACHE_PATH") or None,
+            namespace="last_good",
+        )
+        self.stale_served = 0
+        # Shrinks profiles, resumes and job postings to per-operation token budgets before they reach a prompt
+        self.compactor = ContextCompactor.from_env()
+        # Per-operation max_tokens/temperature/stop, tightened from observed output lengths
+        self.generation = GenerationTuner.from_env()
+        # TF-IDF statistics over every posting seen, for local ATS keyword gaps
+        self.keyword_engine = KeywordEngine(self.skill_matcher, max_jobs=int(os.getenv("LINKEDIN_GAI_KEYWORD_CORPUS_SIZE", "20000")))
+        self.local_keywords = os.getenv("LINKEDIN_GAI_LOCAL_KEYWORDS", "0") == "1"
+        # Normalized text, skills, keywords and summary per job posting, computed once and reused by match and polish
+        self.job_features = JobFeatureStore(
+            self.skill_matcher,
+            self.compactor,
+            keyword_engine=self.keyword_engine,
+            max_entries=int(os.getenv("LINKEDIN_GAI_JOB_FEATURES_SIZE", "4096")),
+            ttl_seconds=float(os.getenv("LINKEDIN_GAI_JOB_FEATURES_TTL", "604800")),
+            disk_path=os.getenv("LINKEDIN_GAI_CACHE_PATH") or None,
+        )
+        # Polish results per resume section and job, reused by incremental polishing for unchanged sections
+        self.polish_cache = ResultCache(
+            max_entries=int(os.getenv("LINKEDIN_GAI_POLISH_CACHE_SIZE", "2048")),
+            ttl_seconds=float(os.getenv("LINKEDIN_GAI_POLISH_CACHE_TTL", "604800")),
+            disk_path=os.getenv("LINKEDIN_GAI_CACHE_PATH") or None,
+            namespace="polish_sections",
+        )
+        self.polish_mode = os.getenv("LINKEDIN_GAI_POLISH_MODE", "full")
+        # Above this fraction of changed sections, an incremental polish re-runs the full prompt
+        self.polish_full_ratio = float(os.getenv("LINKEDIN_GAI_POLISH_FULL_RATIO", "0.5"))
+        # Section-wise resume generation: default mode and how many section calls run at once per resume
+        self.resume_mode = os.getenv("LINKEDIN_GAI_RESUME_MODE", "single")
+        self.resume_section_concurrency = int(os.getenv("LINKEDIN_GAI_RESUME_SECTION_CONCURRENCY", "6"))
+        # Generated resumes by LinkedIn URL, normalized target role, profile hash and mode; repeat generations are lookups
+        self.resume_store = None
+        if os.getenv("LINKEDIN_GAI_RESUME_STORE", "1") != "0":
+            store_path = (
+                os.getenv("LINKEDIN_GAI_RESUME_STORE_PATH")
+                or os.getenv("LINKEDIN_GAI_CACHE_PATH")
+                or os.path.join(DATA_DIR, "generated_resumes.sqlite3")
+            )
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(store_path)), exist_ok=True)
+                self.resume_store = ResumeStore(
+                    store_path,
+                    max_versions=int(os.getenv("LINKEDIN_GAI_RESUME_STORE_VERSIONS", "10")),
+                    ttl_seconds=float(os.getenv("LINKEDIN_GAI_RESUME_STORE_TTL", "0")) or None,
+                )
+            except (OSError, sqlite3.Error) as e:
+                logger.warning("Resume store disabled, cannot open %s: %s", store_path, e)
+        # Per-operation LLM call outcomes: completed, failed, timed_out, cancelled, short_circuited
+        self.call_outcomes: Dict[str, Dict[str, int]] = {}
+        if not lazy:
+            self.warm_up()
+
+    @property
+    def ready(self) -> bool:
+        """True once the GAI backend is detected and the chains are compiled"""
+        return self.chains is not None
+
+    def warm_up(self) -> Dict[str, float]:
+        """
+        Detect the GAI backend and compile the prompt chains, once.
+
+        Blocking (imports lipy-langchain and langchain_core); safe to call from
+        several threads. Later calls return immediately.
+
+        Returns:
+            Phase durations in ms (libraries_ms, backend_ms, chains_ms)
+        """
+        with self._warm_lock:
+            if self.chains is not None:
+                return self.startup
+            started = time.perf_counter()
+            try:
+                # Imported here rather than at module load so a new worker can accept traffic first
+                from chain_registry import ChainRegistry
+                from gai_backend import load_backend
+                imported = time.perf_counter()
+                backend = load_backend(max_tokens=15000, temperature=0.5)
+                detected = time.perf_counter()
+                # Prompt templates and chains are compiled once here, not per request
+                chains = ChainRegistry(backend.llm, observe=backend.observe)
+            except Exception as e:
+                self.startup_error = f"{type(e).__name__}: {e}"
+                raise
+            self.ready_at = time.perf_counter()
+            self.llm = backend.llm
+            self.gai_available = backend.available
+            self.chains = chains
+            self.startup_error = None
+            self.startup = {
+                "libraries_ms": round((imported - started) * 1000, 1),
+                "backend_ms": round((detected - imported) * 1000, 1),
+                "chains_ms": round((self.ready_at - detected) * 1000, 1),
+            }
+        logger.info("LinkedIn GAI Service ready. GAI Available: %s (%s)", self.gai_available, self.startup)
+        return self.startup
+
+    def start_warm_up(self) -> asyncio.Future:
+        """Run warm_up() in a worker thread so the event loop keeps serving; returns its future"""
+        if self._warm_future is None or (self._warm_future.done() and not self.ready):
+            self._warm_future = asyncio.get_running_loop().run_in_executor(None, self.warm_up)
+        return self._warm_future
+
+    async def ensure_ready(self) -> None:
+        """
+        Wait for warm-up, starting it if nothing has yet.
+
+        Raises:
+            DeadlineExceeded: If the request deadline passes first
+        """
+        if self.chains is None:
+            await with_deadline(asyncio.shield(self.start_warm_up()), "warm_up")
+
+    async def _run_chain(self, operation: str, inputs: Dict[str, Any]) -> str:
+        """
+        Invoke the precompiled chain registered for an operation.
+
+        Concurrent calls with identical operation and inputs share a single
+        LLM call, also across worker processes when LINKEDIN_GAI_CACHE_PATH
+        is set; every caller receives its result. The call is cancelled
+        when the current request deadline passes (see deadlines.py) and goes
+        through the gateway circuit breaker. If the call fails or the circuit
+        is open, the last good result for the same inputs is served instead.
+
+        Raises:
+            DeadlineExceeded: If the request deadline passes first
+            CircuitOpen: If the circuit is open and no earlier result exists
+        """
+        await self.ensure_ready()
+        chain = self.chains.get(operation).chain
+        key = canonical_key(operation, inputs)
+        settings = self._generation_settings(operation, inputs)
+        usage: Dict[str, Any] = {}
+
+        async def call_gateway() -> str:
+            with metrics.LLM_IN_FLIGHT.track(operation=operation), generation_settings.use(settings, usage):
+                return await self.breaker.call(lambda: chain.ainvoke(inputs))
+
+        async def call_shared() -> str:
+            if self.shared_flight is None:
+                return await call_gateway()
+            return await self.shared_flight.do(key, call_gateway)
+
+        try:
+            with metrics.timed_call(operation):
+                result = await with_deadline(self.inflight.do(key, call_shared), operation)
+        except BaseException as e:
+            self._record_outcome(operation, e)
+            if isinstance(e, Exception) and not isinstance(e, DeadlineExceeded):
+                stale = self._stale_result(operation, key, e)
+                if stale is not None:
+                    return stale
+            raise
+        self._record_outcome(operation)
+        if result:
+            self._observe_output(operation, result, settings, usage)
+            self.last_good.set(key, result)
+        return result
+
+    async def _stream_chain(self, operation: str, inputs: Dict[str, Any]) -> AsyncIterator[str]:
+        """Stream text chunks from the precompiled chain registered for an operation, under the request deadline"""
+        await self.ensure_ready()
+        compiled = self.chains.get(operation)
+        # Observability wrappers without astream fall back to the raw chain
+        runnable = compiled.chain if hasattr(compiled.chain, "astream") else compiled.runnable
+        key = canonical_key(operation, inputs)
+        try:
+            self.breaker.before_call()
+        except CircuitOpen as e:
+            self._record_outcome(operation, e)
+            stale = self._stale_result(operation, key, e)
+            if stale is None:
+                raise
+            yield stale
+            return
+
+        settings = self._generation_settings(operation, inputs)
+        usage: Dict[str, Any] = {}
+        started = time.monotonic()
+        chunks = []
+        try:
+            with metrics.timed_call(operation), metrics.LLM_IN_FLIGHT.track(operation=operation), generation_settings.use(settings, usage):
+                async for chunk in iterate_with_deadline(runnable.astream(inputs), operation):
+                    if chunk:
+                        chunks.append(chunk)
+                        yield chunk
+        except (asyncio.CancelledError, GeneratorExit, DeadlineExceeded) as e:
+            self.breaker.record_cancelled(time.monotonic() - started)
+            self._record_outcome(operation, e)
+            raise
+        except BaseException as e:
+            self.breaker.record_failure()
+            self._record_outcome(operation, e)
+            raise
+        self.breaker.record_success(time.monotonic() - started)
+        self._record_outcome(operation)
+        if chunks:
+            result = "".join(chunks)
+            self._observe_output(operation, result, settings, usage)
+            self.last_good.set(key, result)
+
+    def _observe_output(self, operation: str, result: str, settings: GenerationSettings, usage: Dict[str, Any]) -> None:
+        """Learn an output's length, from the gateway's usage report when the call made one"""
+        reported = usage.get("output_tokens")
+        self.generation.observe(
+            operation,
+            reported if reported is not None else count_tokens(result),
+            settings,
+            exact=reported is not None,
+            finish_reason=usage.get("finish_reason"),
+        )
+
+    def _generation_settings(self, operation: str, inputs: Dict[str, Any]) -> GenerationSettings:
+        """max_tokens/temperature/stop for one call, sized by the prompt context"""
+        input_tokens = sum(count_tokens(value) for value in inputs.values() if isinstance(value, str))
+        return self.generation.settings_for(operation, input_tokens)
+
+    def _stale_result(self, operation: str, key: str, error: Exception) -> Optional[str]:
+        """Last good LLM output for the same inputs, used when the gateway call cannot be made or fails"""
+        stale = self.last_good.get(key)
+        if stale is not None:
+            self.stale_served += 1
+            # Counted like any fallback, so the resume store does not save stale output as a new version
+            self._count_fallback(operation, "stale")
+            logger.warning("Serving last good %s result: %s", operation, error)
+        return stale
+
+    def _record_outcome(self, operation: str, error: Optional[BaseException] = None) -> None:
+        """Count an LLM call as completed, failed, timed_out or cancelled"""
+        if error is None:
+            outcome = "completed"
+        elif isinstance(error, DeadlineExceeded):
+            outcome = "timed_out"
+        elif isinstance(error, CircuitOpen):
+            outcome = "short_circuited"
+        elif isinstance(error, (asyncio.CancelledError, GeneratorExit)):
+            outcome = "cancelled"
+        else:
+            outcome = "failed"
+        counts = self.call_outcomes.setdefault(operation, dict.fromkeys(("completed", "failed", "timed_out", "cancelled", "short_circuited"), 0))
+        counts[outcome] += 1
+
+    def _count_fallback(self, operation: str, reason: Any) -> None:
+        """Count a fallback response; reason is a label or the exception that caused it"""
+        if isinstance(reason, BaseException):
+            reason = "circuit_open" if isinstance(reason, CircuitOpen) else "error"
+        metrics.FALLBACKS.inc(operation=operation, reason=reason)
+        fallbacks = _resume_fallbacks.get()
+        if fallbacks is not None:
+            fallbacks.append(operation)
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for the service's result caches"""
+        return {
+            "analyze_job_match": self.match_cache.stats(),
+            "polish_sections": self.polish_cache.stats(),
+            "last_good": self.last_good.stats(),
+        }
+
+    def breaker_stats(self) -> Dict[str, Any]:
+        """Gateway circuit breaker state and stale results served"""
+        return {**self.breaker.stats(), "stale_served": self.stale_served}
+
+    def reload_chains(self) -> List[str]:
+        """Recompile all prompt chains (e.g. after editing prompt overrides) without a restart"""
+        if self.chains is None:
+            self.warm_up()
+        return self.chains.reload()
+
+    async def generate_resume_from_profile(
+        self,
+        linkedin_url: str,
+        target_role: Optional[str] = None,
+        user_profile: Optional[Dict[str, Any]] = None,
+        sectioned: Optional[bool] = None,
+        reuse: bool = True,
+    ) -> ResumeData:
         """
         Generate a resume from LinkedIn profile using LinkedIn GAI
         
@@ -131,197 +391,334 @@ class LinkedInGAIService:
             linkedin_url: LinkedIn profile URL
             target_role: Target job role for tailoring
             user_profile: Additional user profile data
+            sectioned: Generate the summary, each experience entry and the skills in concurrent
+                       sub-calls instead of one prompt; defaults to LINKEDIN_GAI_RESUME_MODE == "sections".
+                       Profiles without structured positions always use the single prompt.
+            reuse: Return the stored resume for this URL, role and profile if there is one;
+                   False always generates (and stores) a new version
             
         Returns:
-            Generated resume content as JSON string
+            Generated resume content
         """
-        logger.info(f"Starting resume generation for URL: {linkedin_url}")
-        logger.info(f"Target role: {target_role}")
-        logger.info(f"User profile: {user_profile}")
-        
+        logger.info("Starting resume generation for URL: %s", linkedin_url)
+        logger.info("Target role: %s", target_role)
+        log_payload(logger, "User profile: %s", truncate(user_profile))
+
+        if self.resume_store is None:
+            return await self._generate_resume(linkedin_url, target_role, user_profile, sectioned)
+        if sectioned is None:
+            sectioned = self.resume_mode == "sections"
+        mode = "sections" if sectioned and resume_sections.can_split(user_profile) else "single"
+        # SQLite reads and writes run in the default executor, off the event loop
+        if reuse:
+            stored = await asyncio.to_thread(self.resume_store.lookup, linkedin_url, target_role, user_profile, mode)
+            if stored is not None:
+                logger.info("Serving stored resume version %s for %s", stored["version_id"], linkedin_url)
+                return stored["resume"]
+
+        fallbacks: List[str] = []
+        previous = _resume_fallbacks.get()
+        _resume_fallbacks.set(fallbacks)
+        try:
+            resume = await self._generate_resume(linkedin_url, target_role, user_profile, sectioned)
+        finally:
+            _resume_fallbacks.set(previous)
+        if fallbacks:
+            logger.info("Not storing resume for %s: fell back in %s", linkedin_url, ", ".join(sorted(set(fallbacks))))
+        else:
+            version_id = await asyncio.to_thread(self.resume_store.save, linkedin_url, target_role, user_profile, resume, mode)
+            logger.info("Stored resume version %s for %s", version_id, linkedin_url)
+        return resume
+
+    async def _generate_resume(
+        self,
+        linkedin_url: str,
+        target_role: Optional[str],
+        user_profile: Optional[Dict[str, Any]],
+        sectioned: Optional[bool],
+    ) -> ResumeData:
+        """Generate a resume with the single prompt or in sections; failures return a placeholder resume"""
+        await self.ensure_ready()
         if not self.gai_available:
             logger.error("LinkedIn GAI is not available - check configuration")
             logger.info("Falling back to mock resume generation due to GAI unavailability")
-            # Return mock resume when GAI is not available
-            mock_resume = {
-                "personalInfo": {
-                    "name": "Mock Generated Resume",
-                    "email": "mock@example.com",
-                    "phone": "+1-555-0123",
-                    "location": "San Francisco, CA",
-                    "linkedinUrl": linkedin_url
-                },
-                "summary": f"Mock professional summary for {target_role or 'Software engineer'} role. This is generated when LinkedIn GAI is not available.",
-                "experience": [
-                    {
-                        "title": f"{target_role or 'Software Engineer'}",
-                        "company": "Mock Company",
-                        "duration": "2022 - Present",
-                        "achievements": [
-                            "Mock achievement 1",
-                            "Mock achievement 2"
-                        ]
-                    }
-                ],
-                "skills": ["Python", "JavaScript", "React", "Node.js"],
-                "education": [
-                    {
-                        "degree": "Mock Degree",
-                        "institution": "Mock University",
-                        "year": "2022"
-                    }
-                ]
-            }
-            return json.dumps(mock_resume, indent=2)
+            self._count_fallback("generate_resume", "gai_unavailable")
+            return self._mock_resume(linkedin_url, target_role)
+
+        if sectioned is None:
+            sectioned = self.resume_mode == "sections"
+        if sectioned and resume_sections.can_split(user_profile):
+            try:
+                return await self._generate_resume_sections(linkedin_url, target_role or "Software engineer", user_profile)
+            except DeadlineExceeded:
+                logger.warning("Resume generation for %s abandoned: deadline exceeded", linkedin_url)
+                raise
+        elif sectioned:
+            logger.info("Profile has no structured positions, generating the resume with a single prompt")
             
         try:
-            logger.info(f"LinkedIn GAI available: {self.gai_available}")
-            logger.info(f"LLM object type: {type(self.llm)}")
-            logger.info(f"Resource ID: {os.getenv('LINKEDIN_GAI_RESOURCE_ID')}")
-            logger.info(f"Deployment ID: {os.getenv('LINKEDIN_GAI_DEPLOYMENT_ID')}")
-            prompt_template = ChatPromptTemplate.from_template("""
-            You are an expert resume writer and career coach. The user context contains the user's LinkedIn profile. 
-            Given the user context and target role, generate a comprehensive, ATS-friendly resume in JSON format.
-
-            Linkedin Profile: {user_context}
-            LinkedIn URL: {linkedin_url}
-            Target Role: {target_role}
-
-            CRITICAL: Use ONLY real information from the LinkedIn profile. Do NOT include any placeholders, examples, or generic text like "Professional Title", "Full Name", "email@example.com", etc.
-
-            Generate a resume with the following JSON structure. ONLY include fields where you have actual data from the profile:
-            {{
-                "personalInfo": {{
-                    "name": "[actual name from profile]",
-                    "email": "[actual email if available]", 
-                    "phone": "[actual phone if available]",
-                    "location": "[actual location from profile]",
-                    "linkedinUrl": "{linkedin_url}"
-                }},
-                "summary": "[write actual professional summary based on profile and target role]",
-                "experience": [
-                    {{
-                        "title": "[actual job title from profile]",
-                        "company": "[actual company name from profile]", 
-                        "duration": "[actual dates from profile]",
-                        "achievements": ["[actual achievements from profile]"]
-                    }}
-                ],
-                "skills": ["[actual skills from profile]"],
-                "education": [
-                    {{
-                        "degree": "[actual degree from profile]",
-                        "institution": "[actual institution from profile]",
-                        "year": "[actual year from profile]"
-                    }}
-                ]
-            }}
-
-            IMPORTANT RULES:
-            1. Extract ONLY real information from the LinkedIn profile
-            2. Tailor content to the target role using actual experience
-            3. Use action verbs and quantifiable achievements from the profile
-            4. Ensure ATS compatibility
-            5. If information is not available in the profile, DO NOT include that field
-            6. NEVER use placeholder text, examples, or generic terms
-            7. Write a compelling summary based on actual profile content
-
-            Return only the JSON object with real data, no additional text or placeholders.
-            """)
-
-            # Create the chain with ProxiedGPTChat
-            chain = prompt_template | self.llm | StrOutputParser()
-            observed_chain = ObservedLCEL(chain, observe_config=ObserveConfig(has_hc_data=False))
-            
-            # Prepare context
-            user_context = json.dumps(user_profile) if user_profile else "No additional context provided"
-            logger.info(f"Prepared user context, length: {len(user_context)}")
+            logger.info("LinkedIn GAI available: %s", self.gai_available)
+            logger.debug("LLM object type: %s", type(self.llm))
+            logger.debug("Resource ID: %s", os.getenv('LINKEDIN_GAI_RESOURCE_ID'))
+            logger.debug("Deployment ID: %s", os.getenv('LINKEDIN_GAI_DEPLOYMENT_ID'))
             
             # Generate resume content
-            logger.info(f"Invoking LinkedIn GAI chain with target_role: {target_role or 'Software engineer'}")
+            logger.info("Invoking LinkedIn GAI chain with target_role: %s", target_role or 'Software engineer')
             
             try:
-                result = await observed_chain.ainvoke({
-                    "linkedin_url": linkedin_url,
-                    "target_role": target_role or "Software engineer",
-                    "user_context": user_context
-                })
+                result = await self._run_chain("generate_resume", self._resume_inputs(linkedin_url, target_role, user_profile))
                 
-                logger.info(f"Received GAI response, length: {len(result) if result else 0}")
-                logger.info(f"GAI response type: {type(result)}")
-                logger.info(f"GAI response: {result if result else 'None'}...")
+                logger.info("Received GAI response, length: %s", len(result) if result else 0)
+                logger.debug("GAI response type: %s", type(result))
+                log_payload(logger, "GAI response: %s", truncate(result))
                 
                 if not result or result.strip() == "":
                     logger.error("GAI returned empty response")
                     raise Exception("LinkedIn GAI returned empty response")
                 
+            except DeadlineExceeded:
+                raise
             except Exception as gai_error:
-                logger.error(f"LinkedIn GAI invocation failed: {str(gai_error)}", exc_info=True)
+                logger.error("LinkedIn GAI invocation failed: %s", gai_error, exc_info=True)
                 raise Exception(f"LinkedIn GAI service error: {str(gai_error)}")
             
-            # Parse the JSON response
-            try:
-                json_string = re.sub(r"^```json|```$", "", result.strip(), flags=re.MULTILINE).strip()
-                resume_data = json.loads(json_string)
-                logger.info("Successfully parsed GAI response as JSON")
-            except json.JSONDecodeError as e:
-                logger.warning(f"Failed to parse GAI response as JSON: {e}")
-                logger.error(f"Raw response (first 500 chars): '{result[:500] if result else 'EMPTY'}'")
-                # Fallback if JSON parsing fails
-                resume_data = {
-                    "personalInfo": {
-                        "name": "Generated from LinkedIn",
-                        "email": "user@example.com",
-                        "phone": "+1-555-0123",
-                        "location": "San Francisco, CA",
-                        "linkedinUrl": linkedin_url
-                    },
-                    "summary": f"Professional with expertise in {target_role or 'technology'}, generated from LinkedIn profile analysis using LinkedIn GAI gateway.",
-                    "experience": [
-                        {
-                            "title": "Senior Software Engineer",
-                            "company": "Tech Innovation Inc.",
-                            "duration": "2022 - Present",
-                            "achievements": [
-                                "Developed scalable web applications using modern technologies",
-                                "Improved system performance by 40% through optimization"
-                            ]
-                        }
-                    ],
-                    "skills": ["Python", "JavaScript", "React", "Node.js", "SQL"],
-                    "education": [
-                        {
-                            "degree": "Bachelor of Science in Computer Science",
-                            "institution": "University",
-                            "year": "2022"
-                        }
-                    ]
-                }
+            return self._parse_resume_response(result, linkedin_url, target_role)
             
-            return json.dumps(resume_data, indent=2)
+        except DeadlineExceeded:
+            logger.warning("Resume generation for %s abandoned: deadline exceeded", linkedin_url)
+            raise
+        except Exception as e:
+            logger.error("Error generating resume from profile: %s", e, exc_info=True)
+            self._count_fallback("generate_resume", e)
+            return self._error_resume(linkedin_url)
+
+    async def stream_resume_from_profile(self, linkedin_url: str, target_role: Optional[str] = None, user_profile: Optional[Dict[str, Any]] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Generate a resume like generate_resume_from_profile, yielding LLM tokens as they arrive
+        
+        Args:
+            linkedin_url: LinkedIn profile URL
+            target_role: Target job role for tailoring
+            user_profile: Additional user profile data
             
+        Yields:
+            {"event": "token", "data": {"text": ...}} per chunk,
+            {"event": "section", "data": {"section", ["index"], "value"}} per completed
+            top-level field or "experience" entry, then
+            {"event": "result", "data": <resume dict>}
+        """
+        logger.info("Starting streaming resume generation for URL: %s", linkedin_url)
+        await self.ensure_ready()
+        if not self.gai_available:
+            logger.info("Falling back to mock resume generation due to GAI unavailability")
+            self._count_fallback("generate_resume", "gai_unavailable")
+            yield {"event": "result", "data": self._mock_resume(linkedin_url, target_role)}
+            return
+
+        parser: Optional[IncrementalJSONParser] = IncrementalJSONParser(split_arrays=("experience",))
+        chunks = []
+        try:
+            async for chunk in self._stream_chain("generate_resume", self._resume_inputs(linkedin_url, target_role, user_profile)):
+                chunks.append(chunk)
+                yield {"event": "token", "data": {"text": chunk}}
+                if parser is not None:
+                    try:
+                        for section in parser.feed(chunk):
+                            yield {"event": "section", "data": section}
+                    except json.JSONDecodeError as e:
+                        # Keep streaming tokens; the lenient parse below runs on the whole text
+                        logger.warning("Streamed resume is not well-formed JSON, parsing it once complete: %s", e)
+                        parser = None
+
+            if parser is not None and parser.done:
+                resume_data = parser.result()
+            else:
+                result = "".join(chunks)
+                if not result.strip():
+                    raise Exception("LinkedIn GAI returned empty response")
+                resume_data = self._parse_resume_response(result, linkedin_url, target_role)
+        except DeadlineExceeded:
+            raise
         except Exception as e:
-            logger.error(f"Error generating resume from profile: {str(e)}", exc_info=True)
-            fallback_resume = {
+            logger.error("Error streaming resume from profile: %s", e, exc_info=True)
+            self._count_fallback("generate_resume", e)
+            resume_data = self._error_resume(linkedin_url)
+        yield {"event": "result", "data": resume_data}
+
+    async def _generate_resume_sections(self, linkedin_url: str, target_role: str, profile: Dict[str, Any]) -> ResumeData:
+        """
+        Build a resume from concurrent per-section LLM calls.
+
+        personalInfo and education are copied from the profile without an LLM
+        call; the summary, the achievements of each position and the skills
+        are drafted concurrently, each from only the profile slice it needs,
+        so wall-clock time is roughly that of the slowest section. A section
+        whose call fails or returns malformed output falls back to the
+        profile's own text.
+
+        Raises:
+            DeadlineExceeded: If the request deadline passes first
+        """
+        semaphore = asyncio.Semaphore(max(1, self.resume_section_concurrency))
+
+        async def draft(operation: str, fields: Dict[str, Any], parse, fallback):
+            inputs = {"target_role": target_role, **self.compactor.compact(operation, fields)}
+            try:
+                async with semaphore:
+                    result = await self._run_chain(operation, inputs)
+                return parse(result)
+            except DeadlineExceeded:
+                raise
+            except Exception as e:
+                logger.warning("Resume section %s failed, using profile content: %s", operation, e)
+                self._count_fallback(operation, e if not isinstance(e, ValueError) else "parse_failure")
+                return fallback
+
+        positions = resume_sections.positions(profile)
+        skill_names = resume_sections.skill_names(profile)
+        with metrics.PHASE_LATENCY.time(operation="generate_resume", phase="sections"):
+            summary, skills, *achievements = await asyncio.gather(
+                draft(
+                    "resume_summary",
+                    {"profile_excerpt": resume_sections.summary_excerpt(profile)},
+                    resume_sections.clean_summary,
+                    resume_sections.fallback_summary(profile),
+                ),
+                draft(
+                    "resume_skills",
+                    {"skills": skill_names, "positions": [resume_sections.position_excerpt(p)["title"] for p in positions]},
+                    lambda text: resume_sections.parse_string_list(text, resume_sections.MAX_SKILLS),
+                    skill_names[:resume_sections.MAX_SKILLS],
+                ),
+                *(
+                    draft(
+                        "resume_experience",
+                        {"position": resume_sections.position_excerpt(position)},
+                        lambda text: resume_sections.parse_string_list(text, resume_sections.MAX_ACHIEVEMENTS),
+                        resume_sections.fallback_achievements(position),
+                    )
+                    for position in positions
+                ),
+            )
+        logger.info("Generated resume in sections: summary, skills and %d experience entries", len(positions))
+        return {
+            "personalInfo": resume_sections.personal_info(profile, linkedin_url),
+            "summary": summary,
+            "experience": [resume_sections.experience_entry(p, bullets) for p, bullets in zip(positions, achievements)],
+            "skills": skills,
+            "education": resume_sections.education(profile),
+        }
+
+    def _resume_inputs(self, linkedin_url: str, target_role: Optional[str], user_profile: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Prompt inputs for the generate_resume chain"""
+        user_context = self.compactor.compact("generate_resume", {"user_context": user_profile})["user_context"] if user_profile else None
+        if not user_context or user_context == "null":
+            user_context = "No additional context provided"
+        logger.info("Prepared user context, length: %s", len(user_context))
+        return {
+            "linkedin_url": linkedin_url,
+            "target_role": target_role or "Software engineer",
+            "user_context": user_context
+        }
+
+    def _parse_resume_response(self, result: str, linkedin_url: str, target_role: Optional[str]) -> ResumeData:
+        """Parse the GAI resume JSON, falling back to a generic resume if it is malformed"""
+        try:
+            with metrics.PHASE_LATENCY.time(operation="generate_resume", phase="parse"):
+                json_string = re.sub(r"^```json|```$", "", result.strip(), flags=re.MULTILINE).strip()
+                resume_data = json.loads(json_string)
+            logger.info("Successfully parsed GAI response as JSON")
+            return resume_data
+        except json.JSONDecodeError as e:
+            logger.warning("Failed to parse GAI response as JSON: %s", e)
+            metrics.PARSE_FAILURES.inc(operation="generate_resume")
+            self._count_fallback("generate_resume", "parse_failure")
+            logger.error("Raw response: '%s'", truncate(result) if result else 'EMPTY')
+            # Fallback if JSON parsing fails
+            return {
                 "personalInfo": {
-                    "name": "Error in Generation",
-                    "email": "error@example.com",
-                    "phone": "+1-555-0000",
-                    "location": "Unknown",
+                    "name": "Generated from LinkedIn",
+                    "email": "user@example.com",
+                    "phone": "+1-555-0123",
+                    "location": "San Francisco, CA",
                     "linkedinUrl": linkedin_url
                 },
-                "summary": "Error occurred during resume generation",
-                "experience": [],
-                "skills": [],
-                "education": []
+                "summary": f"Professional with expertise in {target_role or 'technology'}, generated from LinkedIn profile analysis using LinkedIn GAI gateway.",
+                "experience": [
+                    {
+                        "title": "Senior Software Engineer",
+                        "company": "Tech Innovation Inc.",
+                        "duration": "2022 - Present",
+                        "achievements": [
+                            "Developed scalable web applications using modern technologies",
+                            "Improved system performance by 40% through optimization"
+                        ]
+                    }
+                ],
+                "skills": ["Python", "JavaScript", "React", "Node.js", "SQL"],
+                "education": [
+                    {
+                        "degree": "Bachelor of Science in Computer Science",
+                        "institution": "University",
+                        "year": "2022"
+                    }
+                ]
             }
-            return json.dumps(fallback_resume, indent=2)
+
+    def _mock_resume(self, linkedin_url: str, target_role: Optional[str]) -> ResumeData:
+        """Mock resume returned when LinkedIn GAI is not available"""
+        return {
+            "personalInfo": {
+                "name": "Mock Generated Resume",
+                "email": "mock@example.com",
+                "phone": "+1-555-0123",
+                "location": "San Francisco, CA",
+                "linkedinUrl": linkedin_url
+            },
+            "summary": f"Mock professional summary for {target_role or 'Software engineer'} role. This is generated when LinkedIn GAI is not available.",
+            "experience": [
+                {
+                    "title": f"{target_role or 'Software Engineer'}",
+                    "company": "Mock Company",
+                    "duration": "2022 - Present",
+                    "achievements": [
+                        "Mock achievement 1",
+                        "Mock achievement 2"
+                    ]
+                }
+            ],
+            "skills": ["Python", "JavaScript", "React", "Node.js"],
+            "education": [
+                {
+                    "degree": "Mock Degree",
+                    "institution": "Mock University",
+                    "year": "2022"
+                }
+            ]
+        }
+
+    def _error_resume(self, linkedin_url: str) -> ResumeData:
+        """Placeholder resume returned when generation fails"""
+        return {
+            "personalInfo": {
+                "name": "Error in Generation",
+                "email": "error@example.com",
+                "phone": "+1-555-0000",
+                "location": "Unknown",
+                "linkedinUrl": linkedin_url
+            },
+            "summary": "Error occurred during resume generation",
+            "experience": [],
+            "skills": [],
+            "education": []
+        }
     
     async def analyze_job_compatibility(
         self,
         user_skills: List[str],
         job_requirements: str,
-        job_description: str
+        job_description: str,
+        job_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Analyze job compatibility using LinkedIn GAI
@@ -330,78 +727,51 @@ class LinkedInGAIService:
             user_skills: List of user's current skills
             job_requirements: Job requirements text
             job_description: Full job description
+            job_id: Job identifier, stores the job's precomputed features under it
             
         Returns:
             Dict containing compatibility analysis
         """
+        features = self.job_features.features(job_requirements, job_description, job_id=job_id)
+        cache_key = canonical_key("analyze_job_match", {
+            "user_skills": normalize_skills(user_skills),
+            "job": features.content_hash,
+        })
+        cached = self.match_cache.get(cache_key)
+        if cached is not None:
+            logger.info("Job match cache hit")
+            return cached
+
         try:
-            # Create prompt for job compatibility analysis
-            prompt_template = ChatPromptTemplate.from_template("""
-            You are an expert career counselor and job matching specialist. Analyze the compatibility 
-            between a candidate's skills and a job opportunity.
-
-            User Skills: {user_skills}
-            Job Requirements: {job_requirements}
-            Job Description: {job_description}
-
-            Provide a comprehensive analysis in JSON format:
-            {{
-                "compatibilityScore": 85,
-                "matchingSkills": ["skill1", "skill2"],
-                "missingSkills": ["skill3", "skill4"],
-                "recommendations": [
-                    "Recommendation 1",
-                    "Recommendation 2"
-                ],
-                "strengthAreas": ["area1", "area2"],
-                "improvementAreas": ["area3", "area4"],
-                "overallAssessment": "Detailed assessment text"
-            }}
-
-            Focus on:
-            1. Accurate skill matching and gap analysis
-            2. Actionable recommendations for skill development
-            3. Realistic compatibility scoring (0-100)
-            4. Specific areas of strength and improvement
-            5. Professional career guidance
-
-            Return only the JSON object, no additional text.
-            """)
-
-            # Create the chain with ProxiedGPTChat
-            chain = prompt_template | self.llm | StrOutputParser()
-            observed_chain = ObservedLCEL(chain, observe_config=ObserveConfig(has_hc_data=False))
-            
-            # Generate compatibility analysis
-            result = await observed_chain.ainvoke({
+            # Generate compatibility analysis from the job's precomputed, normalized text
+            result = await self._run_chain("analyze_job_match", {
                 "user_skills": ", ".join(user_skills),
-                "job_requirements": job_requirements,
-                "job_description": job_description
+                "job_requirements": features.requirements,
+                "job_description": features.description,
             })
             
             # Parse the JSON response
             try:
-                compatibility_data = json.loads(result)
+                with metrics.PHASE_LATENCY.time(operation="analyze_job_match", phase="parse"):
+                    compatibility_data = json.loads(result)
+                self.match_cache.set(cache_key, compatibility_data)
             except json.JSONDecodeError:
                 # Fallback if JSON parsing fails
-                matching_skills = [skill for skill in user_skills if skill.lower() in job_requirements.lower()]
-                compatibility_data = {
-                    "compatibilityScore": min(85, len(matching_skills) * 20),
-                    "matchingSkills": matching_skills,
-                    "missingSkills": ["Advanced Analytics", "Leadership"],
-                    "recommendations": [
-                        "Consider developing missing technical skills",
-                        "Highlight relevant experience in your application"
-                    ],
-                    "strengthAreas": matching_skills[:3],
-                    "improvementAreas": ["Communication", "Project Management"],
-                    "overallAssessment": "Good compatibility with room for skill development"
-                }
+                metrics.PARSE_FAILURES.inc(operation="analyze_job_match")
+                self._count_fallback("analyze_job_match", "parse_failure")
+                compatibility_data = self.estimate_job_compatibility(user_skills, job_requirements, job_description)
             
             return compatibility_data
             
+        except DeadlineExceeded:
+            raise
+        except CircuitOpen as e:
+            logger.warning("Scoring job match locally: %s", e)
+            self._count_fallback("analyze_job_match", e)
+            return self.estimate_job_compatibility(user_skills, job_requirements, job_description)
         except Exception as e:
-            logger.error(f"Error analyzing job compatibility: {str(e)}")
+            logger.error("Error analyzing job compatibility: %s", e)
+            self._count_fallback("analyze_job_match", e)
             return {
                 "compatibilityScore": 0,
                 "matchingSkills": [],
@@ -412,6 +782,140 @@ class LinkedInGAIService:
                 "overallAssessment": "Analysis failed due to technical error"
             }
     
+    def estimate_job_compatibility(
+        self,
+        user_skills: List[str],
+        job_requirements: str,
+        job_description: str
+    ) -> Dict[str, Any]:
+        """
+        Estimate job compatibility locally, without calling LinkedIn GAI
+        
+        Args:
+            user_skills: List of user's current skills
+            job_requirements: Job requirements text
+            job_description: Full job description
+            
+        Returns:
+            Dict with the same shape as analyze_job_compatibility
+        """
+        match = self.skill_matcher.match(user_skills, f"{job_requirements}\n{job_description}")
+        return compatibility_from_match(match)
+
+    async def analyze_job_compatibility_batch(
+        self,
+        user_skills: List[str],
+        jobs: List[Dict[str, Any]],
+        concurrency: Optional[int] = None,
+        local_only: bool = False,
+        admit: Optional[Callable[[], AsyncContextManager[Any]]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Analyze one skill set against many jobs with bounded concurrency
+        
+        Args:
+            user_skills: List of user's current skills
+            jobs: Dicts with "job_requirements", "job_description" and optional "id"
+            concurrency: Maximum analyses in flight, defaults to LINKEDIN_GAI_BATCH_CONCURRENCY
+            local_only: Use the local skill matcher instead of LinkedIn GAI
+            admit: Context manager factory held around each item's LLM analysis (e.g. an admission
+                   slot), so a batch shares the endpoint's concurrency limit; an item it rejects fails alone
+            
+        Yields:
+            One result dict per job in completion order, with "index", "id",
+            "success" and either "match_analysis" or "error"
+        """
+        if local_only:
+            for index, job in enumerate(jobs):
+                match_analysis = self.estimate_job_compatibility(
+                    user_skills, job.get("job_requirements", ""), job.get("job_description", "")
+                )
+                yield {"index": index, "id": job.get("id"), "success": True, "match_analysis": match_analysis}
+            return
+
+        limit = concurrency or int(os.getenv("LINKEDIN_GAI_BATCH_CONCURRENCY", "8"))
+        semaphore = asyncio.Semaphore(max(1, limit))
+
+        async def analyze_one(index: int, job: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    async with admit() if admit else contextlib.nullcontext():
+                        match_analysis = await self.analyze_job_compatibility(
+                            user_skills=user_skills,
+                            job_requirements=job.get("job_requirements", ""),
+                            job_description=job.get("job_description", ""),
+                            job_id=job.get("id")
+                        )
+                    return {"index": index, "id": job.get("id"), "success": True, "match_analysis": match_analysis}
+                except Exception as e:
+                    logger.error("Batch job match failed for item %s: %s", index, e)
+                    return {"index": index, "id": job.get("id"), "success": False, "error": str(e)}
+
+        tasks = [asyncio.ensure_future(analyze_one(index, job)) for index, job in enumerate(jobs)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Stop outstanding work if the consumer goes away mid-batch
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    def index_jobs(self, jobs: List[Dict[str, Any]]) -> int:
+        """
+        Add or update jobs in the local skill index
+        
+        Args:
+            jobs: Dicts with "id", "job_requirements", "job_description" and optional "skills"/"title"
+            
+        Returns:
+            Number of jobs now in the index
+        """
+        for job in jobs:
+            # Features are computed here so later match calls for the job reuse them
+            self.job_features.features(job.get("job_requirements", ""), job.get("job_description", ""), job_id=str(job["id"]))
+            text = f"{job.get('job_requirements', '')}\n{job.get('job_description', '')}"
+            self.job_index.add_job(str(job["id"]), text, skills=job.get("skills"), payload=job)
+        return len(self.job_index)
+
+    async def rank_jobs(
+        self,
+        user_skills: List[str],
+        top_k: int = 20,
+        analyze: bool = False,
+        concurrency: Optional[int] = None,
+        admit: Optional[Callable[[], AsyncContextManager[Any]]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Shortlist indexed jobs for a skill set, optionally running LLM analysis on the shortlist only
+        
+        Args:
+            user_skills: List of user's current skills
+            top_k: Number of jobs to shortlist
+            analyze: Run analyze_job_compatibility on each shortlisted job
+            concurrency: Maximum analyses in flight when analyze is set
+            admit: Held around each analysis, as in analyze_job_compatibility_batch
+            
+        Returns:
+            List of dicts with "id", "score", "matchedTerms" and optional "match_analysis", best first
+        """
+        shortlist = self.job_index.top_k(user_skills, k=top_k)
+        results = [
+            {"id": ranked.job_id, "score": ranked.score, "matchedTerms": ranked.matched_terms}
+            for ranked in shortlist
+        ]
+        if not analyze or not results:
+            return results
+
+        jobs = [self.job_index.get_job(item["id"]) for item in results]
+        async for item in self.analyze_job_compatibility_batch(user_skills, jobs, concurrency=concurrency, admit=admit):
+            result = results[item["index"]]
+            if item["success"]:
+                result["match_analysis"] = item["match_analysis"]
+            else:
+                result["error"] = item["error"]
+        return results
+
     async def generate_linkedin_post(
         self,
         topic: str,
@@ -430,43 +934,8 @@ class LinkedInGAIService:
             Dict containing generated post content
         """
         try:
-            # Create prompt for LinkedIn post generation
-            prompt_template = ChatPromptTemplate.from_template("""
-            You are an expert LinkedIn content creator and social media strategist. Create an engaging 
-            LinkedIn post that will drive professional engagement and networking.
-
-            Topic: {topic}
-            Details: {details}
-            Tone: {tone}
-
-            Generate a LinkedIn post with the following characteristics:
-            - Professional and engaging tone
-            - Appropriate use of emojis (2-3 maximum)
-            - Relevant hashtags (3-5)
-            - Call-to-action for engagement
-            - 150-300 words optimal length
-            - Industry-appropriate content
-
-            Structure the post to include:
-            1. Hook/Opening statement
-            2. Main content with value
-            3. Personal insight or experience
-            4. Call-to-action
-            5. Relevant hashtags
-
-            Return the complete post content as a single string.
-            """)
-
-            # Create the chain with ProxiedGPTChat
-            chain = prompt_template | self.llm | StrOutputParser()
-            observed_chain = ObservedLCEL(chain, observe_config=ObserveConfig(has_hc_data=False))
-            
             # Generate LinkedIn post
-            result = await observed_chain.ainvoke({
-                "topic": topic,
-                "details": details or "No additional details provided",
-                "tone": tone
-            })
+            result = await self._run_chain("generate_post", self._post_inputs(topic, details, tone))
             
             return {
                 "success": True,
@@ -474,10 +943,62 @@ class LinkedInGAIService:
                 "error": None
             }
             
+        except DeadlineExceeded:
+            raise
+        except Exception as e:
+            logger.error("Error generating LinkedIn post: %s", e)
+            self._count_fallback("generate_post", e)
+            return {
+                "success": True,
+                "post_content": self._fallback_post(topic, details),
+                "error": None
+            }
+
+    async def stream_linkedin_post(
+        self,
+        topic: str,
+        details: Optional[str] = None,
+        tone: str = "professional"
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Generate a LinkedIn post like generate_linkedin_post, yielding LLM tokens as they arrive
+        
+        Args:
+            topic: Main topic for the post
+            details: Additional details or context
+            tone: Tone of the post (professional, casual, inspirational)
+            
+        Yields:
+            {"event": "token", "data": {"text": ...}} per chunk, then
+            {"event": "result", "data": <same dict as generate_linkedin_post>}
+        """
+        chunks = []
+        try:
+            async for chunk in self._stream_chain("generate_post", self._post_inputs(topic, details, tone)):
+                chunks.append(chunk)
+                yield {"event": "token", "data": {"text": chunk}}
+            post_content = "".join(chunks).strip()
+        except DeadlineExceeded:
+            raise
         except Exception as e:
-            logger.error(f"Error generating LinkedIn post: {str(e)}")
-            # Fallback post generation
-            fallback_post = f"""🚀 Excited to share insights about {topic}!
+            logger.error("Error streaming LinkedIn post: %s", e)
+            self._count_fallback("generate_post", e)
+            post_content = self._fallback_post(topic, details)
+        yield {"event": "result", "data": {"success": True, "post_content": post_content, "error": None}}
+
+    def _post_inputs(self, topic: str, details: Optional[str], tone: str) -> Dict[str, Any]:
+        """Prompt inputs for the generate_post chain"""
+        if details:
+            details = self.compactor.compact("generate_post", {"details": details})["details"]
+        return {
+            "topic": topic,
+            "details": details or "No additional details provided",
+            "tone": tone
+        }
+
+    def _fallback_post(self, topic: str, details: Optional[str]) -> str:
+        """Canned post used when generation fails"""
+        return f"""🚀 Excited to share insights about {topic}!
 
 {details or 'Sharing thoughts on this important topic.'}
 
@@ -489,147 +1010,358 @@ Key takeaways:
 What are your thoughts on {topic}? I'd love to hear your perspectives in the comments!
 
 #{topic.replace(' ', '')} #Professional #LinkedIn #Technology"""
-            
-            return {
-                "success": True,
-                "post_content": fallback_post,
-                "error": None
-            }
 
-    async def polish_resume_for_job(self, resume_data: dict, job_data: dict) -> dict:
+    async def polish_resume_for_job(
+        self,
+        resume_data: dict,
+        job_data: dict,
+        incremental: Optional[bool] = None,
+        local_keywords: Optional[bool] = None,
+    ) -> dict:
         """
         Polish and optimize a resume for a specific job position.
         
         Args:
             resume_data: Current resume content (personalInfo, experience, skills, etc.)
             job_data: Job details (title, company, requirements, skills, etc.)
+            incremental: Reuse cached suggestions for sections unchanged since the last polish against the same
+                         job and send only changed sections to the LLM; defaults to LINKEDIN_GAI_POLISH_MODE == "incremental"
+            local_keywords: Fill keywordOptimization from the local keyword engine and leave it out of the
+                            prompt; defaults to LINKEDIN_GAI_LOCAL_KEYWORDS == "1"
             
         Returns:
-            Dict containing polishing suggestions and optimized resume
+            Dict containing polishing suggestions and optimized resume; incremental polishes add
+            "incremental": {"mode": "cached"|"sections"|"full", "reused": [...], "regenerated": [...]}
         """
         try:
             logger.info("Starting resume polishing process")
-            logger.info(f"Job title: {job_data.get('title', 'Unknown')}")
-            logger.info(f"Company: {job_data.get('company', {}).get('name', 'Unknown')}")
+            logger.info("Job title: %s", job_data.get('title', 'Unknown'))
+            logger.info("Company: %s", job_data.get('company', {}).get('name', 'Unknown'))
             
             # Check if LinkedIn GAI is available
-            if not self.llm:
-                logger.warning("LinkedIn GAI not available, using mock polishing suggestions")
-                return self._generate_mock_polish_suggestions(resume_data, job_data)
-            
-            logger.info(f"Resource ID: {os.getenv('LINKEDIN_GAI_RESOURCE_ID')}")
-            logger.info(f"Deployment ID: {os.getenv('LINKEDIN_GAI_DEPLOYMENT_ID')}")
+            mock = await self._polish_unavailable(resume_data, job_data)
+            if mock is not None:
+                return mock
             
-            prompt_template = ChatPromptTemplate.from_template("""
-            You are an expert resume coach and career strategist. Analyze the provided resume and job posting to give specific, actionable suggestions for optimizing the resume for this particular role.
-
-            CURRENT RESUME:
-            {resume_content}
-
-            TARGET JOB:
-            Position: {job_title} at {company_name}
-            Location: {job_location}
-            Work Mode: {work_mode}
-            Salary Range: {salary_range}
-            Required Skills: {required_skills}
-            Job Requirements: {job_requirements}
-            Job Description: {job_description}
-
-            Provide detailed resume polishing suggestions in the following JSON format:
-            {{
-                "overallScore": [1-100 score for current resume fit],
-                "keyStrengths": ["strength 1", "strength 2", "strength 3"],
-                "criticalGaps": ["gap 1", "gap 2", "gap 3"],
-                "suggestions": [
-                    {{
-                        "section": "summary|experience|skills|education",
-                        "priority": "high|medium|low",
-                        "type": "emphasize|add|remove|rewrite|consolidate",
-                        "current": "current content or section",
-                        "suggested": "specific suggested improvement",
-                        "reasoning": "why this change will help for this specific role"
-                    }}
-                ],
-                "keywordOptimization": [
-                    {{
-                        "keyword": "important keyword from job posting",
-                        "currentUsage": "how it's currently used or missing",
-                        "suggestion": "how to better incorporate this keyword"
-                    }}
-                ],
-                "experienceOptimization": [
-                    {{
-                        "experienceTitle": "job title from resume",
-                        "suggestion": "how to better highlight relevant aspects",
-                        "focusAreas": ["area 1", "area 2"]
-                    }}
-                ],
-                "additionalRecommendations": [
-                    "recommendation 1",
-                    "recommendation 2"
-                ]
-            }}
-
-            Focus on:
-            1. Identifying which experiences to emphasize more for this specific role
-            2. Suggesting content consolidation where appropriate
-            3. Recommending keyword optimization for ATS systems
-            4. Highlighting transferable skills relevant to the target position
-            5. Suggesting quantifiable achievements that align with job requirements
-            6. Recommending section reordering or restructuring if beneficial
-
-            Return only the JSON object with specific, actionable suggestions.
-            """)
-
-            # Create the chain
-            chain = prompt_template | self.llm | StrOutputParser()
-            observed_chain = ObservedLCEL(chain, observe_config=ObserveConfig(has_hc_data=False))
-            
-            # Prepare input data
-            resume_content = json.dumps(resume_data, indent=2)
-            company_name = job_data.get('company', {}).get('name', 'Unknown Company')
-            salary_min = job_data.get('salaryMin', 0)
-            salary_max = job_data.get('salaryMax', 0)
-            salary_range = f"${salary_min//1000}k - ${salary_max//1000}k" if salary_min and salary_max else "Not specified"
+            logger.debug("Resource ID: %s", os.getenv('LINKEDIN_GAI_RESOURCE_ID'))
+            logger.debug("Deployment ID: %s", os.getenv('LINKEDIN_GAI_DEPLOYMENT_ID'))
+
+            if incremental is None:
+                incremental = self.polish_mode == "incremental"
+            if local_keywords is None:
+                local_keywords = self.local_keywords
+            if incremental:
+                incremental_result = await self._polish_incrementally(resume_data, job_data)
+                if incremental_result is not None:
+                    if local_keywords:
+                        self._apply_local_keywords(incremental_result["polishingSuggestions"], resume_data, job_data)
+                    return incremental_result
             
             logger.info("Invoking LinkedIn GAI for resume polishing")
             
             # Generate polishing suggestions
-            result = await observed_chain.ainvoke({
-                "resume_content": resume_content,
-                "job_title": job_data.get('title', ''),
-                "company_name": company_name,
-                "job_location": job_data.get('location', ''),
-                "work_mode": job_data.get('workMode', ''),
-                "salary_range": salary_range,
-                "required_skills": ', '.join(job_data.get('skills', [])),
-                "job_requirements": job_data.get('requirements', ''),
-                "job_description": job_data.get('description', '')
-            })
+            operation = "polish_resume_local_keywords" if local_keywords else "polish_resume"
+            result = await self._run_chain(operation, self._polish_inputs(resume_data, job_data, operation))
             
             logger.info("Successfully generated resume polishing suggestions")
             
             # Parse the JSON response
             try:
-                json_string = re.sub(r"^```json|```$", "", result.strip(), flags=re.MULTILINE).strip()
-                parsed_result = json.loads(json_string)
+                parsed_result = self._parse_polish_response(result, operation)
+                if local_keywords and isinstance(parsed_result, dict):
+                    self._apply_local_keywords(parsed_result, resume_data, job_data)
+                self._store_polish_sections(resume_data, job_data, parsed_result)
             except json.JSONDecodeError:
                 logger.warning("Failed to parse JSON response, returning raw result")
-                parsed_result = {"suggestions": [{"type": "general", "suggested": result}]}
+                parsed_result = self._raw_polish_result(result, operation)
             
-            return {
+            response = {
                 "success": True,
                 "polishingSuggestions": parsed_result,
                 "message": "Resume polishing suggestions generated successfully"
             }
+            if incremental:
+                response["incremental"] = {"mode": "full", "reused": [], "regenerated": list(polish_sections.split_sections(resume_data))}
+            return response
             
+        except DeadlineExceeded:
+            raise
         except Exception as e:
-            logger.error(f"Error polishing resume: {str(e)}")
-            return {
-                "success": False,
-                "error": str(e),
-                "message": "Failed to generate resume polishing suggestions"
+            logger.error("Error polishing resume: %s", e)
+            return self._polish_failure(e)
+
+    async def _polish_unavailable(self, resume_data: dict, job_data: dict) -> Optional[dict]:
+        """
+        Mock polishing suggestions, counted as a fallback, when LinkedIn GAI is not available.
+
+        Returns:
+            The mock polish response, or None when LinkedIn GAI is available
+
+        Raises:
+            DeadlineExceeded: If the request deadline passes during warm-up
+        """
+        await self.ensure_ready()
+        if self.llm:
+            return None
+        logger.warning("LinkedIn GAI not available, using mock polishing suggestions")
+        self._count_fallback("polish_resume", "gai_unavailable")
+        return self._generate_mock_polish_suggestions(resume_data, job_data)
+
+    def _raw_polish_result(self, result: str, operation: str) -> dict:
+        """Polishing suggestions wrapping an LLM response that is not a JSON object, counted as a fallback"""
+        metrics.PARSE_FAILURES.inc(operation=operation)
+        self._count_fallback(operation, "parse_failure")
+        return {"suggestions": [{"type": "general", "suggested": result}]}
+
+    def _polish_failure(self, error: Exception) -> dict:
+        """Error response for a failed polish, counted as a fallback"""
+        self._count_fallback("polish_resume", error)
+        return {
+            "success": False,
+            "error": str(error),
+            "message": "Failed to generate resume polishing suggestions"
+        }
+
+    async def _polish_incrementally(self, resume_data: dict, job_data: dict) -> Optional[dict]:
+        """
+        Polish only the sections that changed since the last polish of this resume against this job.
+
+        Returns:
+            The polish response, or None when a full polish is needed instead: no earlier
+            polish of this resume for this job is cached, too many sections changed, or the
+            section response could not be parsed
+
+        Raises:
+            DeadlineExceeded: If the request deadline passes first
+        """
+        identity = polish_sections.resume_identity(resume_data)
+        if identity is None:
+            logger.info("Resume has no personalInfo to identify it, polishing in full")
+            return None
+        job_fp = polish_sections.job_fingerprint(job_data)
+        overall = self.polish_cache.get(canonical_key("polish_overall", {"job": job_fp, "resume": identity}))
+        if overall is None:
+            logger.info("No earlier polish of this resume for this job, polishing in full")
+            return None
+
+        sections = polish_sections.split_sections(resume_data)
+        per_section: Dict[str, Dict[str, List[Any]]] = {}
+        changed: Dict[str, Any] = {}
+        for name, content in sections.items():
+            cached = self.polish_cache.get(polish_sections.section_key(job_fp, name, content))
+            if cached is None:
+                changed[name] = content
+            else:
+                per_section[name] = cached
+        if sections and len(changed) > self.polish_full_ratio * len(sections):
+            logger.info("%d of %d resume sections changed, polishing in full", len(changed), len(sections))
+            return None
+
+        if changed:
+            logger.info("Polishing %d changed resume sections: %s", len(changed), ", ".join(changed))
+            result = await self._run_chain("polish_resume_sections", self._polish_inputs(changed, job_data, "polish_resume_sections"))
+            try:
+                parsed = self._parse_polish_response(result, "polish_resume_sections")
+                if not isinstance(parsed, dict):
+                    raise json.JSONDecodeError("expected a JSON object", result, 0)
+            except json.JSONDecodeError:
+                logger.warning("Failed to parse section polish response, polishing in full")
+                metrics.PARSE_FAILURES.inc(operation="polish_resume_sections")
+                return None
+            _, fresh = polish_sections.split_result(parsed, changed)
+            for name, entries in fresh.items():
+                self.polish_cache.set(polish_sections.section_key(job_fp, name, changed[name]), entries)
+            per_section.update(fresh)
+        else:
+            logger.info("No resume sections changed since the last polish, serving cached suggestions")
+        metrics.POLISH_SECTIONS.inc(len(sections) - len(changed), outcome="reused")
+        metrics.POLISH_SECTIONS.inc(len(changed), outcome="regenerated")
+
+        return {
+            "success": True,
+            "polishingSuggestions": polish_sections.merge(overall, per_section, list(sections)),
+            "message": "Resume polishing suggestions generated successfully",
+            "incremental": {
+                "mode": "sections" if changed else "cached",
+                "reused": [name for name in sections if name not in changed],
+                "regenerated": list(changed),
+            },
+        }
+
+    def keyword_gaps(self, resume_data: dict, job_data: dict, top_k: int = 20) -> Dict[str, Any]:
+        """
+        ATS keyword gaps of a resume for a job, from corpus TF-IDF statistics, without calling LinkedIn GAI
+        
+        Args:
+            resume_data: Resume content (summary, experience, skills, education)
+            job_data: Job details (id, title, requirements, description, skills)
+            top_k: Number of the job's most distinctive keywords to check
+            
+        Returns:
+            Dict with "keywords" (keyword, weight, present, resumeCount, sections), weighted "coverage",
+            "matchedKeywords", "missingKeywords" and "keywordOptimization" in the polish response shape
+        """
+        features = self._job_features(job_data)
+        gaps = self.keyword_engine.gaps(features.content_hash, resume_data, top_k=top_k)
+        return {
+            "keywords": [
+                {"keyword": gap.keyword, "weight": gap.weight, "present": gap.present, "resumeCount": gap.resume_count, "sections": gap.sections}
+                for gap in gaps
+            ],
+            "coverage": keyword_engine.coverage(gaps),
+            "matchedKeywords": [gap.keyword for gap in gaps if gap.present],
+            "missingKeywords": [gap.keyword for gap in gaps if not gap.present],
+            "keywordOptimization": keyword_engine.keyword_optimization(gaps),
+            "corpusJobs": len(self.keyword_engine),
+        }
+
+    def _apply_local_keywords(self, suggestions: dict, resume_data: dict, job_data: dict) -> None:
+        """Replace keywordOptimization in a polish result with local keyword gaps"""
+        with metrics.PHASE_LATENCY.time(operation="polish_resume", phase="keywords"):
+            suggestions["keywordOptimization"] = self.keyword_gaps(resume_data, job_data)["keywordOptimization"]
+
+    def _store_polish_sections(self, resume_data: dict, job_data: dict, parsed_result: dict) -> None:
+        """Cache a full polish result split by section, so later incremental polishes can reuse it"""
+        identity = polish_sections.resume_identity(resume_data)
+        if identity is None or not isinstance(parsed_result, dict):
+            return
+        job_fp = polish_sections.job_fingerprint(job_data)
+        sections = polish_sections.split_sections(resume_data)
+        overall, per_section = polish_sections.split_result(parsed_result, sections)
+        self.polish_cache.set(canonical_key("polish_overall", {"job": job_fp, "resume": identity}), overall)
+        for name, entries in per_section.items():
+            self.polish_cache.set(polish_sections.section_key(job_fp, name, sections[name]), entries)
+
+    def _parse_polish_response(self, result: str, operation: str) -> dict:
+        """
+        Raises:
+            json.JSONDecodeError: If the response is not JSON
+        """
+        with metrics.PHASE_LATENCY.time(operation=operation, phase="parse"):
+            json_string = re.sub(r"^```json|```$", "", result.strip(), flags=re.MULTILINE).strip()
+            return json.loads(json_string)
+
+    async def stream_polish_resume_for_job(
+        self,
+        resume_data: dict,
+        job_data: dict,
+        incremental: Optional[bool] = None,
+        local_keywords: Optional[bool] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Polish a resume like polish_resume_for_job, yielding each suggestion as soon as it is complete
+        
+        Args:
+            resume_data: Current resume content (personalInfo, experience, skills, etc.)
+            job_data: Job details (title, company, requirements, skills, etc.)
+            incremental: As for polish_resume_for_job; a polish served from cached sections
+                         is not streamed and arrives as the result event alone
+            local_keywords: As for polish_resume_for_job; the local keywordOptimization
+                            is sent as a section event once the stream completes
+            
+        Yields:
+            {"event": "section", "data": {"section", ["index"], "value"}} per completed
+            top-level field or "suggestions" item, then
+            {"event": "result", "data": <same dict as polish_resume_for_job>}
+        """
+        logger.info("Starting streaming resume polishing for job: %s", job_data.get('title', 'Unknown'))
+        parser: Optional[IncrementalJSONParser] = IncrementalJSONParser(split_arrays=("suggestions",))
+        chunks = []
+        try:
+            mock = await self._polish_unavailable(resume_data, job_data)
+            if mock is not None:
+                yield {"event": "result", "data": mock}
+                return
+
+            if incremental is None:
+                incremental = self.polish_mode == "incremental"
+            if local_keywords is None:
+                local_keywords = self.local_keywords
+            if incremental:
+                incremental_result = await self._polish_incrementally(resume_data, job_data)
+                if incremental_result is not None:
+                    if local_keywords:
+                        self._apply_local_keywords(incremental_result["polishingSuggestions"], resume_data, job_data)
+                    yield {"event": "result", "data": incremental_result}
+                    return
+
+            operation = "polish_resume_local_keywords" if local_keywords else "polish_resume"
+            async for chunk in self._stream_chain(operation, self._polish_inputs(resume_data, job_data, operation)):
+                chunks.append(chunk)
+                if parser is not None:
+                    try:
+                        for section in parser.feed(chunk):
+                            yield {"event": "section", "data": section}
+                    except json.JSONDecodeError as e:
+                        logger.warning("Streamed polishing response is not well-formed JSON, parsing it once complete: %s", e)
+                        parser = None
+
+            if parser is not None and parser.done:
+                parsed_result = parser.result()
+            else:
+                result = "".join(chunks)
+                try:
+                    parsed_result = self._parse_polish_response(result, operation)
+                    if not isinstance(parsed_result, dict):
+                        raise json.JSONDecodeError("expected a JSON object", result, 0)
+                except json.JSONDecodeError:
+                    logger.warning("Streamed polishing response was not a complete JSON object, returning raw result")
+                    parsed_result = None
+            if parsed_result is None:
+                parsed_result = self._raw_polish_result(result, operation)
+            else:
+                if local_keywords:
+                    self._apply_local_keywords(parsed_result, resume_data, job_data)
+                    yield {"event": "section", "data": {"section": "keywordOptimization", "value": parsed_result["keywordOptimization"]}}
+                self._store_polish_sections(resume_data, job_data, parsed_result)
+            result = {
+                "success": True,
+                "polishingSuggestions": parsed_result,
+                "message": "Resume polishing suggestions generated successfully"
             }
+            if incremental:
+                result["incremental"] = {"mode": "full", "reused": [], "regenerated": list(polish_sections.split_sections(resume_data))}
+        except DeadlineExceeded:
+            raise
+        except Exception as e:
+            logger.error("Error streaming resume polishing: %s", e)
+            result = self._polish_failure(e)
+        yield {"event": "result", "data": result}
+
+    def _polish_inputs(self, resume_data: dict, job_data: dict, operation: str = "polish_resume") -> Dict[str, Any]:
+        """Prompt inputs for the polish_resume chain, or polish_resume_sections with the changed sections as resume_data"""
+        # Job text is compacted with this operation's budgets; the stored features only supply the skills
+        context = self.compactor.compact(operation, {
+            "resume_content": resume_data,
+            "job_requirements": job_data.get('requirements') or '',
+            "job_description": job_data.get('description') or '',
+        })
+        features = self._job_features(job_data)
+        company_name = job_data.get('company', {}).get('name', 'Unknown Company')
+        salary_min = job_data.get('salaryMin', 0)
+        salary_max = job_data.get('salaryMax', 0)
+        salary_range = f"${salary_min//1000}k - ${salary_max//1000}k" if salary_min and salary_max else "Not specified"
+        return {
+            "resume_content": context["resume_content"],
+            "job_title": job_data.get('title', ''),
+            "company_name": company_name,
+            "job_location": job_data.get('location', ''),
+            "work_mode": job_data.get('workMode', ''),
+            "salary_range": salary_range,
+            "required_skills": ', '.join(job_data.get('skills') or features.skills[:15]),
+            "job_requirements": context["job_requirements"],
+            "job_description": context["job_description"]
+        }
+
+    def _job_features(self, job_data: dict) -> JobFeatures:
+        """Stored features of a polish job_data dict"""
+        return self.job_features.features(
+            job_data.get('requirements') or '',
+            job_data.get('description') or '',
+            job_id=job_data.get('id'),
+            title=job_data.get('title'),
+            skills=job_data.get('skills'),
+        )
 
     def _generate_mock_polish_suggestions(self, resume_data: dict, job_data: dict) -> dict:
         """Generate mock polishing suggestions when LinkedIn GAI is not available"""
@@ -0,0 +1,143 @@
+"""
+Non-blocking logging pipeline for the GAI backend
+Records go through a bounded queue to a background writer thread with a size-capped log file
+"""
+
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import sys
+from typing import Any, Dict, Optional
+
+DEFAULT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+
+def _env_int(name: str, default: int) -> int:
+    return int(os.getenv(name, str(default)))
+
+
+class Truncated:
+    """
+    Lazily stringified, length-capped log argument.
+
+    Pass as a %-style argument; str() (and the truncation) only runs if the
+    record is actually emitted.
+    """
+
+    __slots__ = ("value", "limit")
+
+    def __init__(self, value: Any, limit: Optional[int] = None):
+        self.value = value
+        self.limit = limit if limit is not None else _env_int("LINKEDIN_GAI_LOG_PAYLOAD_LIMIT", 500)
+
+    def __str__(self) -> str:
+        text = self.value if isinstance(self.value, str) else str(self.value)
+        if self.limit and len(text) > self.limit:
+            return f"{text[:self.limit]}... [truncated {len(text) - self.limit} chars]"
+        return text
+
+    __repr__ = __str__
+
+
+def truncate(value: Any, limit: Optional[int] = None) -> Truncated:
+    """Wrap a payload so it is truncated to limit chars when logged"""
+    return Truncated(value, limit)
+
+
+def log_payload(logger: logging.Logger, msg: str, *args: Any) -> None:
+    """
+    Log a large payload at DEBUG, subject to payload sampling.
+
+    Nothing is formatted unless DEBUG is enabled for the logger.
+    """
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(msg, *args, extra={"payload": True})
+
+
+class PayloadSampler(logging.Filter):
+    """Keeps only a sampled fraction of records logged with extra={"payload": True}"""
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not getattr(record, "payload", False):
+            return True
+        return self.rate >= 1.0 or random.random() < self.rate
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that drops records instead of blocking or erroring when the queue is full"""
+
+    def __init__(self, log_queue: "queue.Queue"):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[DroppingQueueHandler] = None
+
+
+def stats() -> Dict[str, int]:
+    """Queue depth and dropped-record counters for the status endpoint"""
+    if _queue_handler is None:
+        return {"queued": 0, "dropped": 0}
+    return {"queued": _queue_handler.queue.qsize(), "dropped": _queue_handler.dropped}
+
+
+def setup_logging(log_file: Optional[str] = "python-backend.log", level: Optional[str] = None) -> logging.handlers.QueueListener:
+    """
+    Route all logging through a queue to a background writer thread.
+
+    Settings (environment):
+        LINKEDIN_GAI_LOG_LEVEL: Root level, default INFO
+        LINKEDIN_GAI_LOG_MAX_BYTES: Log file size before rotation, default 10 MB
+        LINKEDIN_GAI_LOG_BACKUPS: Rotated files kept, default 3
+        LINKEDIN_GAI_LOG_QUEUE_SIZE: Records buffered before dropping, default 10000
+        LINKEDIN_GAI_LOG_PAYLOAD_LIMIT: Max chars per truncated payload, default 500
+        LINKEDIN_GAI_LOG_PAYLOAD_SAMPLE_RATE: Fraction of DEBUG payload logs kept, default 0.1
+
+    Returns:
+        The running QueueListener (stopped automatically at exit)
+    """
+    global _listener, _queue_handler
+    if _listener is not None:
+        return _listener
+
+    formatter = logging.Formatter(DEFAULT_FORMAT)
+    handlers = [logging.StreamHandler(sys.stdout)]
+    if log_file:
+        handlers.append(logging.handlers.RotatingFileHandler(
+            log_file,
+            maxBytes=_env_int("LINKEDIN_GAI_LOG_MAX_BYTES", 10 * 1024 * 1024),
+            backupCount=_env_int("LINKEDIN_GAI_LOG_BACKUPS", 3),
+            encoding="utf-8",
+        ))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue: "queue.Queue" = queue.Queue(maxsize=_env_int("LINKEDIN_GAI_LOG_QUEUE_SIZE", 10000))
+    queue_handler = DroppingQueueHandler(log_queue)
+    queue_handler.addFilter(PayloadSampler(float(os.getenv("LINKEDIN_GAI_LOG_PAYLOAD_SAMPLE_RATE", "0.1"))))
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    _queue_handler = queue_handler
+    root.setLevel(level or os.getenv("LINKEDIN_GAI_LOG_LEVEL", "INFO").upper())
+
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+    return _listener
@@ -0,0 +1,339 @@
+"""
+Prometheus metrics for the GAI backend
+Counters, gauges and histograms rendered in the Prometheus text exposition format
+"""
+
+import bisect
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from starlette.routing import Match
+
+# Seconds; LLM calls run from sub-second to tens of seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0)
+
+# Rough characters per token for English text with GPT-style tokenizers
+CHARS_PER_TOKEN = 4
+
+Labels = Tuple[str, ...]
+Sample = Tuple[Dict[str, str], float]
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count for text, without a tokenizer"""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN if text else 0
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames: Labels = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, Any]) -> Labels:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _labels(self, key: Labels) -> Dict[str, str]:
+        return dict(zip(self.labelnames, key))
+
+    def samples(self) -> List[Tuple[str, Dict[str, str], float]]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        for name, labels, value in self.samples():
+            lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    """Monotonically increasing count per label set"""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Labels, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: Any) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> List[Tuple[str, Dict[str, str], float]]:
+        with self._lock:
+            return [(self.name, self._labels(key), value) for key, value in sorted(self._values.items())]
+
+
+class Gauge(_Metric):
+    """Value that can go up and down per label set"""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Labels, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: Any) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def value(self, **labels: Any) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    @contextmanager
+    def track(self, **labels: Any) -> Iterator[None]:
+        """Increment for the duration of the block"""
+        self.inc(**labels)
+        try:
+            yield
+        finally:
+            self.dec(**labels)
+
+    def samples(self) -> List[Tuple[str, Dict[str, str], float]]:
+        with self._lock:
+            return [(self.name, self._labels(key), value) for key, value in sorted(self._values.items())]
+
+
+class Histogram(_Metric):
+    """Cumulative-bucket histogram of observed values per label set"""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = (), buckets: Iterable[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # key -> (per-bucket counts incl. +Inf, sum, count)
+        self._values: Dict[Labels, List[Any]] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    @contextmanager
+    def time(self, **labels: Any) -> Iterator[None]:
+        """Observe the wall-clock duration of the block"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def count(self, **labels: Any) -> int:
+        state = self._values.get(self._key(labels))
+        return state[2] if state else 0
+
+    def samples(self) -> List[Tuple[str, Dict[str, str], float]]:
+        out = []
+        with self._lock:
+            for key, (counts, total, count) in sorted(self._values.items()):
+                labels = self._labels(key)
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                    cumulative += bucket_count
+                    out.append((f"{self.name}_bucket", {**labels, "le": _format_value(bound)}, cumulative))
+                out.append((f"{self.name}_sum", labels, total))
+                out.append((f"{self.name}_count", labels, count))
+        return out
+
+
+class Registry:
+    """
+    Holds metrics plus collectors for values owned elsewhere (cache, breaker
+    and queue stats). A collector returns (name, kind, help, samples) tuples
+    that are rendered on each scrape.
+    """
+
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+        self._collectors: List[Callable[[], Iterable[Tuple[str, str, str, List[Sample]]]]] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def add_collector(self, collector: Callable[[], Iterable[Tuple[str, str, str, List[Sample]]]]) -> None:
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        """All metrics in Prometheus text exposition format (version 0.0.4)"""
+        blocks = [metric.render() for metric in self._metrics]
+        for collector in self._collectors:
+            for name, kind, documentation, samples in collector():
+                lines = [f"# HELP {name} {documentation}", f"# TYPE {name} {kind}"]
+                lines.extend(f"{name}{_format_labels(labels)} {_format_value(value)}" for labels, value in samples)
+                blocks.append("\n".join(lines))
+        return "\n".join(blocks) + "\n"
+
+
+REGISTRY = Registry()
+
+HTTP_REQUESTS = REGISTRY.register(Counter(
+    "gai_http_requests_total", "HTTP requests by route, method and status", ("endpoint", "method", "status")))
+HTTP_LATENCY = REGISTRY.register(Histogram(
+    "gai_http_request_duration_seconds", "HTTP request latency by route", ("endpoint",)))
+HTTP_IN_PROGRESS = REGISTRY.register(Gauge(
+    "gai_http_requests_in_progress", "HTTP requests currently being handled by route", ("endpoint",)))
+LLM_IN_FLIGHT = REGISTRY.register(Gauge(
+    "gai_llm_calls_in_flight", "LLM gateway calls currently running by operation", ("operation",)))
+PHASE_LATENCY = REGISTRY.register(Histogram(
+    "gai_phase_duration_seconds", "Time per operation phase (prompt_format, llm_call, parse)", ("operation", "phase")))
+TIME_TO_FIRST_TOKEN = REGISTRY.register(Histogram(
+    "gai_llm_time_to_first_token_seconds", "Time from prompt formatted to first LLM output chunk", ("operation",)))
+PARSE_FAILURES = REGISTRY.register(Counter(
+    "gai_json_parse_failures_total", "LLM responses that were not valid JSON", ("operation",)))
+FALLBACKS = REGISTRY.register(Counter(
+    "gai_fallbacks_total", "Responses served from a fallback instead of the LLM", ("operation", "reason")))
+PROMPT_TOKENS = REGISTRY.register(Counter(
+    "gai_prompt_tokens_total", "Estimated prompt tokens sent to the LLM", ("operation",)))
+COMPLETION_TOKENS = REGISTRY.register(Counter(
+    "gai_completion_tokens_total", "Estimated completion tokens received from the LLM", ("operation",)))
+CONTEXT_TOKENS_SAVED = REGISTRY.register(Counter(
+    "gai_context_tokens_saved_total", "Estimated prompt context tokens removed by compaction", ("operation",)))
+POLISH_SECTIONS = REGISTRY.register(Counter(
+    "gai_polish_sections_total", "Resume sections in incremental polishes, reused from cache or sent to the LLM", ("outcome",)))
+
+
+class CallTimer:
+    """Phase timestamps for one LLM call, filled in by the chain probes"""
+
+    __slots__ = ("operation", "started", "llm_started", "first_chunk")
+
+    def __init__(self, operation: str):
+        self.operation = operation
+        self.started = time.perf_counter()
+        self.llm_started: Optional[float] = None
+        self.first_chunk = False
+
+
+_call_timer: contextvars.ContextVar[Optional[CallTimer]] = contextvars.ContextVar("gai_call_timer", default=None)
+
+
+@contextmanager
+def timed_call(operation: str) -> Iterator[CallTimer]:
+    """Make a CallTimer current so chain probes can attribute phases to operation"""
+    timer = CallTimer(operation)
+    # set() rather than reset(token): the block may span yields of an async generator
+    previous = _call_timer.set(timer).old_value
+    try:
+        yield timer
+    finally:
+        _call_timer.set(None if previous is contextvars.Token.MISSING else previous)
+
+
+def prompt_formatted(prompt_value: Any) -> Any:
+    """Chain probe placed after the prompt: records prompt_format time and prompt tokens"""
+    timer = _call_timer.get()
+    if timer is not None:
+        now = time.perf_counter()
+        PHASE_LATENCY.observe(now - timer.started, operation=timer.operation, phase="prompt_format")
+        text = prompt_value.to_string() if hasattr(prompt_value, "to_string") else str(prompt_value)
+        PROMPT_TOKENS.inc(estimate_tokens(text), operation=timer.operation)
+        timer.llm_started = now
+    return prompt_value
+
+
+async def aprompt_formatted(prompt_value: Any) -> Any:
+    """Async form of prompt_formatted, so async chains do not hop to a thread"""
+    return prompt_formatted(prompt_value)
+
+
+async def llm_output(chunks: Any) -> Any:
+    """Chain probe placed after the LLM: passes chunks through, recording llm_call time and completion tokens"""
+    timer = _call_timer.get()
+    length = 0
+    async for chunk in chunks:
+        if timer is not None:
+            if not timer.first_chunk and timer.llm_started is not None:
+                timer.first_chunk = True
+                TIME_TO_FIRST_TOKEN.observe(time.perf_counter() - timer.llm_started, operation=timer.operation)
+            content = getattr(chunk, "content", chunk)
+            length += len(content) if isinstance(content, str) else 0
+        yield chunk
+    if timer is not None and timer.llm_started is not None:
+        PHASE_LATENCY.observe(time.perf_counter() - timer.llm_started, operation=timer.operation, phase="llm_call")
+        COMPLETION_TOKENS.inc(-(-length // CHARS_PER_TOKEN), operation=timer.operation)
+
+
+class MetricsMiddleware:
+    """ASGI middleware counting requests and timing them per route template"""
+
+    def __init__(self, app: Any):
+        self.app = app
+
+    async def __call__(self, scope: Dict[str, Any], receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        endpoint = self._endpoint(scope)
+        status = {"code": 500}
+
+        async def wrapped_send(message: Dict[str, Any]) -> None:
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        HTTP_IN_PROGRESS.inc(endpoint=endpoint)
+        try:
+            await self.app(scope, receive, wrapped_send)
+        finally:
+            HTTP_IN_PROGRESS.dec(endpoint=endpoint)
+            HTTP_REQUESTS.inc(endpoint=endpoint, method=scope.get("method", ""), status=str(status["code"]))
+            HTTP_LATENCY.observe(time.perf_counter() - started, endpoint=endpoint)
+
+    @staticmethod
+    def _endpoint(scope: Dict[str, Any]) -> str:
+        """Route template (e.g. /api/jobs/index/{job_id}) so label cardinality stays bounded"""
+        app = scope.get("app")
+        for route in getattr(getattr(app, "router", None), "routes", ()):
+            match, _ = route.matches(scope)
+            if match == Match.FULL:
+                return getattr(route, "path", "unmatched")
+        return "unmatched"
@@ -0,0 +1,143 @@
+"""
+Section-level resume polishing helpers
+Fingerprints resume sections against a job, splits polish results by section and merges cached and fresh sections back together
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+from result_cache import canonical_key
+
+# Polish fields that describe the whole resume rather than one section; reused until the next full polish
+GLOBAL_FIELDS = ("overallScore", "keyStrengths", "criticalGaps", "keywordOptimization", "additionalRecommendations")
+
+# Per-section fields of the polishingSuggestions shape
+SECTION_FIELDS = ("suggestions", "experienceOptimization")
+
+_NORMALIZE = re.compile(r"[\W_]+", re.UNICODE)
+
+
+def _normalize(text: Any) -> str:
+    return _NORMALIZE.sub(" ", str(text or "")).strip().casefold()
+
+
+def job_fingerprint(job_data: Dict[str, Any]) -> str:
+    """Hash of the job fields the polish prompt reads"""
+    company = job_data.get("company")
+    return canonical_key("polish_job", {
+        "title": job_data.get("title"),
+        "company": company.get("name") if isinstance(company, dict) else company,
+        "location": job_data.get("location"),
+        "workMode": job_data.get("workMode"),
+        "salary": [job_data.get("salaryMin"), job_data.get("salaryMax")],
+        "skills": job_data.get("skills"),
+        "requirements": job_data.get("requirements"),
+        "description": job_data.get("description"),
+    })
+
+
+def resume_identity(resume_data: Dict[str, Any]) -> Optional[str]:
+    """Hash identifying whose resume this is (personalInfo name, email, URL), or None if it has none"""
+    info = resume_data.get("personalInfo") or {}
+    identity = {key: info.get(key) for key in ("name", "email", "linkedinUrl") if info.get(key)}
+    return canonical_key("polish_resume_identity", identity) if identity else None
+
+
+def split_sections(resume_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Resume sections that get their own suggestions, in resume order.
+
+    Returns:
+        "summary", "experience:<index>" per experience entry, "skills" and "education" -> content;
+        empty sections are left out
+    """
+    sections: Dict[str, Any] = {}
+    if resume_data.get("summary"):
+        sections["summary"] = resume_data["summary"]
+    for index, entry in enumerate(resume_data.get("experience") or []):
+        if entry:
+            sections[f"experience:{index}"] = entry
+    for name in ("skills", "education"):
+        if resume_data.get(name):
+            sections[name] = resume_data[name]
+    return sections
+
+
+def section_key(job_fp: str, name: str, content: Any) -> str:
+    """Cache key of one section's polish result; an experience entry's key does not depend on its position"""
+    return canonical_key("polish_section", {"job": job_fp, "section": name.split(":")[0], "content": content})
+
+
+def _experience_text(entry: Any) -> str:
+    if not isinstance(entry, dict):
+        return _normalize(entry)
+    achievements = entry.get("achievements") or []
+    return _normalize(" ".join([str(entry.get("title") or ""), str(entry.get("company") or ""), *map(str, achievements)]))
+
+
+def _match_experience(sections: Dict[str, Any], *texts: Any) -> Optional[str]:
+    """The experience section whose title or content the given suggestion text refers to"""
+    candidates = [_normalize(text) for text in texts if text]
+    candidates = [text for text in candidates if text]
+    if not candidates:
+        return None
+    for name, entry in sections.items():
+        if not name.startswith("experience:"):
+            continue
+        content = _experience_text(entry)
+        title = _normalize(entry.get("title")) if isinstance(entry, dict) else ""
+        for text in candidates:
+            if text in content or (title and title in text):
+                return name
+    return None
+
+
+def split_result(parsed: Dict[str, Any], sections: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Dict[str, List[Any]]]]:
+    """
+    Split a polish result into whole-resume fields and per-section entries.
+
+    Suggestions are assigned by their "section" field ("experience:<index>"
+    from the section prompt, or "experience" matched to an entry by its
+    quoted content); experienceOptimization entries by experienceTitle.
+    Entries that cannot be tied to a section stay with the whole-resume fields.
+
+    Returns:
+        (whole-resume fields, section name -> {"suggestions": [...], "experienceOptimization": [...]})
+    """
+    overall = {field: parsed[field] for field in GLOBAL_FIELDS if field in parsed}
+    per_section: Dict[str, Dict[str, List[Any]]] = {name: {field: [] for field in SECTION_FIELDS} for name in sections}
+    unassigned: Dict[str, List[Any]] = {field: [] for field in SECTION_FIELDS}
+
+    for suggestion in parsed.get("suggestions") or []:
+        name = suggestion.get("section") if isinstance(suggestion, dict) else None
+        if name == "experience":
+            name = _match_experience(sections, suggestion.get("current"), suggestion.get("experienceTitle"))
+        if name in per_section:
+            per_section[name]["suggestions"].append(suggestion)
+        else:
+            unassigned["suggestions"].append(suggestion)
+
+    for item in parsed.get("experienceOptimization") or []:
+        name = _match_experience(sections, item.get("experienceTitle")) if isinstance(item, dict) else None
+        if name in per_section:
+            per_section[name]["experienceOptimization"].append(item)
+        else:
+            unassigned["experienceOptimization"].append(item)
+
+    overall["unassigned"] = unassigned
+    return overall, per_section
+
+
+def merge(overall: Dict[str, Any], per_section: Dict[str, Dict[str, List[Any]]], order: List[str]) -> Dict[str, Any]:
+    """Rebuild the polishingSuggestions shape from whole-resume fields and per-section entries, in resume order"""
+    result = {field: overall[field] for field in GLOBAL_FIELDS if field in overall}
+    unassigned = overall.get("unassigned") or {}
+    for field in SECTION_FIELDS:
+        items: List[Any] = []
+        for name in order:
+            for item in (per_section.get(name) or {}).get(field, []):
+                if field == "suggestions" and isinstance(item, dict) and str(item.get("section", "")).startswith("experience:"):
+                    item = {**item, "section": "experience"}
+                items.append(item)
+        result[field] = items + list(unassigned.get(field, []))
+    return result
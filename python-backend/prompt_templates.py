@@ -0,0 +1,273 @@
+"""
+Prompt templates for LinkedIn GAI operations
+Each template is compiled once by the chain registry and looked up by operation name
+"""
+
+RESUME_GENERATION_TEMPLATE = """
+You are an expert resume writer and career coach. The user context contains the user's LinkedIn profile. 
+Given the user context and target role, generate a comprehensive, ATS-friendly resume in JSON format.
+
+Linkedin Profile: {user_context}
+LinkedIn URL: {linkedin_url}
+Target Role: {target_role}
+
+CRITICAL: Use ONLY real information from the LinkedIn profile. Do NOT include any placeholders, examples, or generic text like "Professional Title", "Full Name", "email@example.com", etc.
+
+Generate a resume with the following JSON structure. ONLY include fields where you have actual data from the profile:
+{{
+    "personalInfo": {{
+        "name": "[actual name from profile]",
+        "email": "[actual email if available]", 
+        "phone": "[actual phone if available]",
+        "location": "[actual location from profile]",
+        "linkedinUrl": "{linkedin_url}"
+    }},
+    "summary": "[write actual professional summary based on profile and target role]",
+    "experience": [
+        {{
+            "title": "[actual job title from profile]",
+            "company": "[actual company name from profile]", 
+            "duration": "[actual dates from profile]",
+            "achievements": ["[actual achievements from profile]"]
+        }}
+    ],
+    "skills": ["[actual skills from profile]"],
+    "education": [
+        {{
+            "degree": "[actual degree from profile]",
+            "institution": "[actual institution from profile]",
+            "year": "[actual year from profile]"
+        }}
+    ]
+}}
+
+IMPORTANT RULES:
+1. Extract ONLY real information from the LinkedIn profile
+2. Tailor content to the target role using actual experience
+3. Use action verbs and quantifiable achievements from the profile
+4. Ensure ATS compatibility
+5. If information is not available in the profile, DO NOT include that field
+6. NEVER use placeholder text, examples, or generic terms
+7. Write a compelling summary based on actual profile content
+
+Return only the JSON object with real data, no additional text or placeholders.
+"""
+
+JOB_MATCH_TEMPLATE = """
+You are an expert career counselor and job matching specialist. Analyze the compatibility 
+between a candidate's skills and a job opportunity.
+
+User Skills: {user_skills}
+Job Requirements: {job_requirements}
+Job Description: {job_description}
+
+Provide a comprehensive analysis in JSON format:
+{{
+    "compatibilityScore": 85,
+    "matchingSkills": ["skill1", "skill2"],
+    "missingSkills": ["skill3", "skill4"],
+    "recommendations": [
+        "Recommendation 1",
+        "Recommendation 2"
+    ],
+    "strengthAreas": ["area1", "area2"],
+    "improvementAreas": ["area3", "area4"],
+    "overallAssessment": "Detailed assessment text"
+}}
+
+Focus on:
+1. Accurate skill matching and gap analysis
+2. Actionable recommendations for skill development
+3. Realistic compatibility scoring (0-100)
+4. Specific areas of strength and improvement
+5. Professional career guidance
+
+Return only the JSON object, no additional text.
+"""
+
+LINKEDIN_POST_TEMPLATE = """
+You are an expert LinkedIn content creator and social media strategist. Create an engaging 
+LinkedIn post that will drive professional engagement and networking.
+
+Topic: {topic}
+Details: {details}
+Tone: {tone}
+
+Generate a LinkedIn post with the following characteristics:
+- Professional and engaging tone
+- Appropriate use of emojis (2-3 maximum)
+- Relevant hashtags (3-5)
+- Call-to-action for engagement
+- 150-300 words optimal length
+- Industry-appropriate content
+
+Structure the post to include:
+1. Hook/Opening statement
+2. Main content with value
+3. Personal insight or experience
+4. Call-to-action
+5. Relevant hashtags
+
+Return the complete post content as a single string.
+"""
+
+RESUME_POLISH_TEMPLATE = """
+You are an expert resume coach and career strategist. Analyze the provided resume and job posting to give specific, actionable suggestions for optimizing the resume for this particular role.
+
+CURRENT RESUME:
+{resume_content}
+
+TARGET JOB:
+Position: {job_title} at {company_name}
+Location: {job_location}
+Work Mode: {work_mode}
+Salary Range: {salary_range}
+Required Skills: {required_skills}
+Job Requirements: {job_requirements}
+Job Description: {job_description}
+
+Provide detailed resume polishing suggestions in the following JSON format:
+{{
+    "overallScore": [1-100 score for current resume fit],
+    "keyStrengths": ["strength 1", "strength 2", "strength 3"],
+    "criticalGaps": ["gap 1", "gap 2", "gap 3"],
+    "suggestions": [
+        {{
+            "section": "summary|experience|skills|education",
+            "priority": "high|medium|low",
+            "type": "emphasize|add|remove|rewrite|consolidate",
+            "current": "current content or section",
+            "suggested": "specific suggested improvement",
+            "reasoning": "why this change will help for this specific role"
+        }}
+    ],
+    "keywordOptimization": [
+        {{
+            "keyword": "important keyword from job posting",
+            "currentUsage": "how it's currently used or missing",
+            "suggestion": "how to better incorporate this keyword"
+        }}
+    ],
+    "experienceOptimization": [
+        {{
+            "experienceTitle": "job title from resume",
+            "suggestion": "how to better highlight relevant aspects",
+            "focusAreas": ["area 1", "area 2"]
+        }}
+    ],
+    "additionalRecommendations": [
+        "recommendation 1",
+        "recommendation 2"
+    ]
+}}
+
+Focus on:
+1. Identifying which experiences to emphasize more for this specific role
+2. Suggesting content consolidation where appropriate
+3. Recommending keyword optimization for ATS systems
+4. Highlighting transferable skills relevant to the target position
+5. Suggesting quantifiable achievements that align with job requirements
+6. Recommending section reordering or restructuring if beneficial
+
+Return only the JSON object with specific, actionable suggestions.
+"""
+
+# RESUME_POLISH_TEMPLATE without keywordOptimization, used when keyword gaps come from the local keyword engine
+RESUME_POLISH_LOCAL_KEYWORDS_TEMPLATE = RESUME_POLISH_TEMPLATE.replace(
+    """    "keywordOptimization": [
+        {{
+            "keyword": "important keyword from job posting",
+            "currentUsage": "how it's currently used or missing",
+            "suggestion": "how to better incorporate this keyword"
+        }}
+    ],
+""",
+    "",
+).replace(
+    "3. Recommending keyword optimization for ATS systems\n",
+    "3. Leaving ATS keyword coverage aside; it is analyzed separately\n",
+)
+
+RESUME_SECTION_POLISH_TEMPLATE = """
+You are an expert resume coach. The candidate edited some sections of a resume that was already reviewed for this job.
+Review only these changed resume sections, keyed by section name:
+
+{resume_content}
+
+TARGET JOB:
+Position: {job_title} at {company_name}
+Location: {job_location}
+Work Mode: {work_mode}
+Salary Range: {salary_range}
+Required Skills: {required_skills}
+Job Requirements: {job_requirements}
+Job Description: {job_description}
+
+Provide suggestions for these sections only, in the following JSON format:
+{{
+    "suggestions": [
+        {{
+            "section": "the section name exactly as keyed above, e.g. experience:2",
+            "priority": "high|medium|low",
+            "type": "emphasize|add|remove|rewrite|consolidate",
+            "current": "current content or section",
+            "suggested": "specific suggested improvement",
+            "reasoning": "why this change will help for this specific role"
+        }}
+    ],
+    "experienceOptimization": [
+        {{
+            "experienceTitle": "job title from the experience section",
+            "suggestion": "how to better highlight relevant aspects",
+            "focusAreas": ["area 1", "area 2"]
+        }}
+    ]
+}}
+
+Return only the JSON object with specific, actionable suggestions.
+"""
+
+# Section-wise resume generation (see resume_sections.py): each template drafts one section from a profile slice
+
+RESUME_SUMMARY_TEMPLATE = """
+You are an expert resume writer drafting one section of a resume. Write the professional summary paragraph
+(2-4 sentences) for a {target_role} resume, using only facts from this LinkedIn profile excerpt:
+
+{profile_excerpt}
+
+Do not invent employers, numbers or skills. Return only the summary text, without quotes, labels or markdown.
+"""
+
+RESUME_EXPERIENCE_TEMPLATE = """
+You are an expert resume writer drafting one section of a resume. Rewrite this position from a LinkedIn profile
+as 2-5 ATS-friendly achievement bullets tailored to a {target_role} role:
+
+{position}
+
+Start each bullet with an action verb, keep any numbers exactly as given, and use only facts from the position.
+Return only a JSON array of strings, no additional text.
+"""
+
+RESUME_SKILLS_TEMPLATE = """
+You are an expert resume writer drafting the skills section of a resume for a {target_role} role.
+Choose and order up to 15 skills, most relevant first, supported by this LinkedIn profile:
+
+Listed skills: {skills}
+Positions: {positions}
+
+Do not add skills the profile does not support. Return only a JSON array of strings, no additional text.
+"""
+
+# Operation name -> template text. Files named "<operation>.txt" in
+# LINKEDIN_GAI_PROMPT_DIR override these defaults on load/reload.
+PROMPT_TEMPLATES = {
+    "generate_resume": RESUME_GENERATION_TEMPLATE,
+    "analyze_job_match": JOB_MATCH_TEMPLATE,
+    "generate_post": LINKEDIN_POST_TEMPLATE,
+    "polish_resume": RESUME_POLISH_TEMPLATE,
+    "polish_resume_local_keywords": RESUME_POLISH_LOCAL_KEYWORDS_TEMPLATE,
+    "polish_resume_sections": RESUME_SECTION_POLISH_TEMPLATE,
+    "resume_summary": RESUME_SUMMARY_TEMPLATE,
+    "resume_experience": RESUME_EXPERIENCE_TEMPLATE,
+    "resume_skills": RESUME_SKILLS_TEMPLATE,
+}
@@ -0,0 +1,234 @@
+"""
+Content-addressed result cache for LinkedIn GAI operations
+In-memory LRU with per-entry TTL and an optional SQLite tier that survives restarts and is shared by worker processes
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_skills(skills: Iterable[str]) -> List[str]:
+    """Strip, de-duplicate and sort skills so input order does not change the cache key"""
+    cleaned = {skill.strip() for skill in skills if skill and skill.strip()}
+    return sorted(cleaned, key=lambda skill: (skill.casefold(), skill))
+
+
+def open_shared_db(path: str, timeout: float = 5.0) -> sqlite3.Connection:
+    """
+    Open a SQLite file for concurrent use by several processes.
+
+    WAL mode lets readers proceed while one process writes; busy_timeout makes
+    writers wait for each other instead of failing with "database is locked".
+    """
+    db = sqlite3.connect(path, timeout=timeout, check_same_thread=False)
+    db.execute("PRAGMA journal_mode=WAL")
+    db.execute("PRAGMA synchronous=NORMAL")
+    return db
+
+
+def canonical_key(operation: str, payload: Dict[str, Any]) -> str:
+    """
+    Hash an operation name and its inputs into a stable cache key.
+
+    Args:
+        operation: GAI operation name (e.g. "analyze_job_match")
+        payload: JSON-serializable inputs; dict key order does not matter
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    digest = hashlib.sha256()
+    digest.update(operation.encode("utf-8"))
+    digest.update(b"\x00")
+    digest.update(canonical.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    Size-bounded LRU cache with per-entry TTL.
+
+    When ``disk_path`` is set, entries are also written to a SQLite table so a
+    restarted process, or another worker using the same file, can serve them;
+    disk hits are promoted back into memory.
+    Cached values must be JSON-serializable and are returned as copies.
+    """
+
+    _PRUNE_EVERY = 256
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: Optional[float] = 3600,
+        disk_path: Optional[str] = None,
+        namespace: str = "default",
+    ):
+        """
+        Args:
+            max_entries: Maximum number of in-memory entries before LRU eviction
+            ttl_seconds: Default time-to-live per entry; None means no expiry
+            disk_path: Optional SQLite file for the persistent tier
+            namespace: Separates caches sharing one SQLite file
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.namespace = namespace
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._disk_hits = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._writes = 0
+        self._db: Optional[sqlite3.Connection] = None
+        if disk_path:
+            self._db = self._open_disk(disk_path)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return a copy of the cached value, or None on miss or expiry"""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at is None or expires_at > now:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return copy.deepcopy(value)
+                del self._entries[key]
+                self._expirations += 1
+
+            if self._db is not None:
+                row = self._disk_get(key, now)
+                if row is not None:
+                    value, expires_at = row
+                    self._store(key, value, expires_at)
+                    self._hits += 1
+                    self._disk_hits += 1
+                    return copy.deepcopy(value)
+
+            self._misses += 1
+            return None
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """Cache a value, overriding the default TTL if ttl_seconds is given"""
+        ttl = ttl_seconds if ttl_seconds is not None else self.ttl_seconds
+        expires_at = time.time() + ttl if ttl is not None else None
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._store(key, value, expires_at)
+            if self._db is not None:
+                self._disk_set(key, value, expires_at)
+
+    def invalidate(self, key: str) -> None:
+        """Drop a single entry from every tier"""
+        with self._lock:
+            self._entries.pop(key, None)
+            if self._db is not None:
+                self._db.execute(
+                    "DELETE FROM cache_entries WHERE namespace = ? AND key = ?",
+                    (self.namespace, key),
+                )
+                self._db.commit()
+
+    def clear(self) -> None:
+        """Drop all entries in this namespace from every tier"""
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM cache_entries WHERE namespace = ?", (self.namespace,))
+                self._db.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current size"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "disk_hits": self._disk_hits,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "persistent": self._db is not None,
+            }
+
+    def _store(self, key: str, value: Any, expires_at: Optional[float]) -> None:
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def _open_disk(self, path: str) -> Optional[sqlite3.Connection]:
+        try:
+            # Shared with other worker processes, see open_shared_db
+            db = open_shared_db(path)
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS cache_entries ("
+                "namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, "
+                "expires_at REAL, updated_at REAL NOT NULL, "
+                "PRIMARY KEY (namespace, key))"
+            )
+            db.commit()
+            return db
+        except sqlite3.Error as e:
+            logger.warning("Result cache disk tier disabled, cannot open %s: %s", path, e)
+            return None
+
+    def _disk_get(self, key: str, now: float) -> Optional[tuple]:
+        try:
+            row = self._db.execute(
+                "SELECT value, expires_at FROM cache_entries WHERE namespace = ? AND key = ?",
+                (self.namespace, key),
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning("Result cache disk read failed: %s", e)
+            return None
+        if row is None:
+            return None
+        value, expires_at = row
+        if expires_at is not None and expires_at <= now:
+            self._expirations += 1
+            return None
+        return json.loads(value), expires_at
+
+    def _disk_set(self, key: str, value: Any, expires_at: Optional[float]) -> None:
+        try:
+            self._db.execute(
+                "INSERT OR REPLACE INTO cache_entries (namespace, key, value, expires_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (self.namespace, key, json.dumps(value, separators=(",", ":")), expires_at, time.time()),
+            )
+            self._writes += 1
+            if self._writes % self._PRUNE_EVERY == 0:
+                self._disk_prune()
+            self._db.commit()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning("Result cache disk write failed: %s", e)
+
+    def _disk_prune(self) -> None:
+        """Remove expired rows and keep at most max_entries * 10 rows per namespace"""
+        self._db.execute(
+            "DELETE FROM cache_entries WHERE namespace = ? AND expires_at IS NOT NULL AND expires_at <= ?",
+            (self.namespace, time.time()),
+        )
+        self._db.execute(
+            "DELETE FROM cache_entries WHERE namespace = ? AND key NOT IN ("
+            "SELECT key FROM cache_entries WHERE namespace = ? ORDER BY updated_at DESC LIMIT ?)",
+            (self.namespace, self.namespace, self.max_entries * 10),
+        )
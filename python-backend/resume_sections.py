@@ -0,0 +1,165 @@
+"""
+Section-wise resume generation helpers
+Splits a LinkedIn profile into per-section slices, maps factual sections locally and validates LLM-drafted sections
+"""
+
+import json
+import re
+from typing import Any, Dict, List, Optional
+
+MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+# Caps on LLM-drafted sections, matching what the templates ask for
+MAX_ACHIEVEMENTS = 5
+MAX_SKILLS = 15
+
+_FENCE = re.compile(r"^```(?:json)?|```$", re.MULTILINE)
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+def positions(profile: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Positions in the profile (LinkedInProfile.positions, or "experience"), most recent first as given"""
+    items = profile.get("positions") or profile.get("experience") or []
+    return [item for item in items if isinstance(item, dict)]
+
+
+def can_split(profile: Optional[Dict[str, Any]]) -> bool:
+    """Section-wise generation needs a structured profile with at least one position"""
+    return isinstance(profile, dict) and bool(positions(profile))
+
+
+def _date(value: Any) -> Optional[str]:
+    if isinstance(value, dict):
+        year = value.get("year")
+        month = value.get("month")
+        if not year:
+            return None
+        return f"{MONTHS[month - 1]} {year}" if isinstance(month, int) and 1 <= month <= 12 else str(year)
+    return str(value) if value else None
+
+
+def duration(position: Dict[str, Any]) -> str:
+    """'Jan 2018 - Dec 2024', 'Jan 2024 - Present', or the position's own duration string"""
+    if position.get("duration"):
+        return str(position["duration"])
+    start = _date(position.get("startDate"))
+    end = "Present" if position.get("isCurrent") or not position.get("endDate") else _date(position.get("endDate"))
+    return f"{start} - {end}" if start else (end or "")
+
+
+def personal_info(profile: Dict[str, Any], linkedin_url: str) -> Dict[str, Any]:
+    """personalInfo copied from the profile; fields the profile lacks are omitted, as the single prompt asks"""
+    name = profile.get("name") or " ".join(part for part in (profile.get("firstName"), profile.get("lastName")) if part)
+    location = profile.get("location")
+    if isinstance(location, dict):
+        location = ", ".join(part for part in (location.get("region"), location.get("country")) if part)
+    info = {"name": name, "email": profile.get("email"), "phone": profile.get("phone"), "location": location}
+    info = {key: value for key, value in info.items() if value}
+    info["linkedinUrl"] = linkedin_url
+    return info
+
+
+def education(profile: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """education entries copied from the profile's educations"""
+    entries = []
+    for item in profile.get("educations") or profile.get("education") or []:
+        if not isinstance(item, dict):
+            continue
+        degree = ", ".join(part for part in (item.get("degree"), item.get("fieldOfStudy")) if part)
+        entry = {
+            "degree": degree,
+            "institution": item.get("schoolName") or item.get("institution") or item.get("school"),
+            "year": _date(item.get("endDate")) or _date(item.get("startDate")) or item.get("year"),
+        }
+        entry = {key: value for key, value in entry.items() if value}
+        if entry.get("institution") or entry.get("degree"):
+            entries.append(entry)
+    return entries
+
+
+def skill_names(profile: Dict[str, Any]) -> List[str]:
+    """Skill names from LinkedInProfile.skills ([{"name": ...}]) or a plain list"""
+    names = []
+    for skill in profile.get("skills") or []:
+        name = skill.get("name") if isinstance(skill, dict) else skill
+        if isinstance(name, str) and name.strip() and name.strip() not in names:
+            names.append(name.strip())
+    return names
+
+
+def summary_excerpt(profile: Dict[str, Any]) -> Dict[str, Any]:
+    """The profile slice the summary needs: headline, about text, industry, role history and top skills"""
+    return {
+        "headline": profile.get("headline"),
+        "about": profile.get("summary") or profile.get("about"),
+        "industry": profile.get("industry"),
+        "positions": [
+            {"title": p.get("title"), "company": p.get("companyName") or p.get("company"), "duration": duration(p)}
+            for p in positions(profile)
+        ],
+        "skills": skill_names(profile)[:MAX_SKILLS],
+    }
+
+
+def position_excerpt(position: Dict[str, Any]) -> Dict[str, Any]:
+    """The slice one experience entry needs"""
+    return {
+        "title": position.get("title"),
+        "company": position.get("companyName") or position.get("company"),
+        "duration": duration(position),
+        "description": position.get("description"),
+        "achievements": position.get("achievements"),
+    }
+
+
+def experience_entry(position: Dict[str, Any], achievements: List[str]) -> Dict[str, Any]:
+    """An experience entry: title, company and dates from the profile, achievements from the LLM"""
+    excerpt = position_excerpt(position)
+    entry = {key: excerpt[key] for key in ("title", "company", "duration") if excerpt[key]}
+    entry["achievements"] = achievements
+    return entry
+
+
+def fallback_achievements(position: Dict[str, Any]) -> List[str]:
+    """Achievements taken from the position description when its LLM call fails"""
+    if position.get("achievements"):
+        return [str(a) for a in position["achievements"]][:MAX_ACHIEVEMENTS]
+    description = (position.get("description") or "").strip()
+    return [sentence for sentence in _SENTENCE_END.split(description) if sentence][:MAX_ACHIEVEMENTS]
+
+
+def fallback_summary(profile: Dict[str, Any]) -> str:
+    return (profile.get("summary") or profile.get("headline") or "").strip()
+
+
+def parse_string_list(text: str, limit: int) -> List[str]:
+    """
+    Parse an LLM response that should be a JSON array of strings.
+
+    Raises:
+        ValueError: If it is not a non-empty JSON array of strings
+    """
+    value = json.loads(_FENCE.sub("", text.strip()).strip())
+    if isinstance(value, dict) and len(value) == 1:
+        # Tolerate {"achievements": [...]} / {"skills": [...]}
+        value = next(iter(value.values()))
+    if not isinstance(value, list):
+        raise ValueError("expected a JSON array")
+    items = [" ".join(item.split()) for item in value if isinstance(item, str) and item.strip()]
+    if not items:
+        raise ValueError("expected a non-empty array of strings")
+    return items[:limit]
+
+
+def clean_summary(text: str) -> str:
+    """
+    Strip quotes, labels and fences the LLM may wrap the summary in.
+
+    Raises:
+        ValueError: If nothing is left
+    """
+    summary = _FENCE.sub("", text.strip()).strip().strip('"').strip()
+    summary = re.sub(r"^(professional )?summary:\s*", "", summary, flags=re.IGNORECASE)
+    if not summary:
+        raise ValueError("empty summary")
+    return summary
@@ -0,0 +1,220 @@
+"""
+Persistent store of generated resumes
+Every generated resume is kept as a version keyed by LinkedIn URL, normalized target role, profile hash and generation mode, so a repeat generation is a lookup
+"""
+
+import json
+import logging
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
+
+from result_cache import canonical_key, open_shared_db
+
+logger = logging.getLogger(__name__)
+
+# Role the resume prompt uses when none is given
+DEFAULT_ROLE = "software engineer"
+
+# Mode of a resume generated with one prompt, as opposed to "sections"
+DEFAULT_MODE = "single"
+
+_ROLE_NOISE = re.compile(r"[^\w+#.]+", re.UNICODE)
+
+
+def normalize_url(linkedin_url: str) -> str:
+    """LinkedIn URL without scheme, www., query, fragment, trailing slash or case differences"""
+    url = (linkedin_url or "").strip()
+    parts = urlsplit(url if "://" in url else f"https://{url}")
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    return f"{host}{parts.path.rstrip('/')}".lower()
+
+
+def normalize_role(target_role: Optional[str]) -> str:
+    """Case-folded role with punctuation and repeated spaces collapsed ("Sr. Backend  Engineer" -> "sr. backend engineer")"""
+    role = " ".join(_ROLE_NOISE.sub(" ", target_role or "").split()).casefold().strip(".")
+    return role or DEFAULT_ROLE
+
+
+def profile_hash(user_profile: Optional[Dict[str, Any]]) -> str:
+    """Hash of the profile data a resume was generated from; key order does not matter"""
+    return canonical_key("resume_profile", user_profile or {})
+
+
+class ResumeStore:
+    """
+    Generated resumes in a SQLite table, one row per version.
+
+    Lookups return the newest valid version for the exact (URL, role,
+    profile hash, mode) key, so a sectioned generation never serves a
+    single-prompt resume or the other way around. Saving a resume generated from a different profile
+    hash invalidates the URL's older versions for every role, since they
+    were built from data that has since changed; invalidated versions are
+    never served but stay listable. At most max_versions versions are kept
+    per URL and role.
+    """
+
+    def __init__(self, path: str, max_versions: int = 10, ttl_seconds: Optional[float] = None):
+        """
+        Args:
+            path: SQLite file, shared with other worker processes if they use the same one
+            max_versions: Versions kept per URL and role; the oldest are deleted first
+            ttl_seconds: Age after which a version is no longer served by lookup(); None to serve it until invalidated
+        """
+        self.path = path
+        self.max_versions = max_versions
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._saved = 0
+        self._db = open_shared_db(path)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS gai_resumes ("
+            "version_id INTEGER PRIMARY KEY AUTOINCREMENT, url TEXT NOT NULL, role TEXT NOT NULL, "
+            "profile_hash TEXT NOT NULL, linkedin_url TEXT NOT NULL, target_role TEXT, mode TEXT, "
+            "resume TEXT NOT NULL, created_at REAL NOT NULL, invalidated_at REAL, invalidated_reason TEXT)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS gai_resumes_lookup ON gai_resumes (url, role, profile_hash, mode)")
+        self._db.commit()
+
+    def lookup(
+        self,
+        linkedin_url: str,
+        target_role: Optional[str],
+        user_profile: Optional[Dict[str, Any]],
+        mode: str = DEFAULT_MODE,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        The newest valid resume generated for this URL, role, profile and mode.
+
+        Returns:
+            The version record with its "resume", or None
+        """
+        query = (
+            "SELECT * FROM gai_resumes WHERE url = ? AND role = ? AND profile_hash = ? AND mode = ? AND invalidated_at IS NULL"
+            + (" AND created_at >= ?" if self.ttl_seconds else "")
+            + " ORDER BY version_id DESC LIMIT 1"
+        )
+        params: List[Any] = [normalize_url(linkedin_url), normalize_role(target_role), profile_hash(user_profile), mode]
+        if self.ttl_seconds:
+            params.append(time.time() - self.ttl_seconds)
+        record = self._one(query, params)
+        with self._lock:
+            if record is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return record
+
+    def save(
+        self,
+        linkedin_url: str,
+        target_role: Optional[str],
+        user_profile: Optional[Dict[str, Any]],
+        resume: Dict[str, Any],
+        mode: str = DEFAULT_MODE,
+    ) -> int:
+        """
+        Store a generated resume as a new version.
+
+        Args:
+            linkedin_url: LinkedIn profile URL as requested
+            target_role: Target role as requested
+            user_profile: Profile data the resume was generated from
+            resume: Generated resume content
+            mode: How it was generated ("single" or "sections")
+
+        Returns:
+            The new version id
+        """
+        url, role, digest = normalize_url(linkedin_url), normalize_role(target_role), profile_hash(user_profile)
+        now = time.time()
+        with self._lock:
+            superseded = self._db.execute(
+                "UPDATE gai_resumes SET invalidated_at = ?, invalidated_reason = 'profile_changed' "
+                "WHERE url = ? AND profile_hash != ? AND invalidated_at IS NULL",
+                (now, url, digest),
+            ).rowcount
+            cursor = self._db.execute(
+                "INSERT INTO gai_resumes (url, role, profile_hash, linkedin_url, target_role, mode, resume, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, role, digest, linkedin_url, target_role, mode, json.dumps(resume, ensure_ascii=False), now),
+            )
+            self._db.execute(
+                "DELETE FROM gai_resumes WHERE url = ? AND role = ? AND version_id NOT IN "
+                "(SELECT version_id FROM gai_resumes WHERE url = ? AND role = ? ORDER BY version_id DESC LIMIT ?)",
+                (url, role, url, role, self.max_versions),
+            )
+            self._db.commit()
+            self._saved += 1
+        if superseded:
+            logger.info("Profile of %s changed, invalidated %d stored resume(s)", url, superseded)
+        return cursor.lastrowid
+
+    def versions(self, linkedin_url: str, target_role: Optional[str] = None, include_invalidated: bool = True) -> List[Dict[str, Any]]:
+        """
+        Stored versions for a URL, newest first, without the resume content.
+
+        Args:
+            linkedin_url: LinkedIn profile URL
+            target_role: Only versions for this role; None for all roles
+            include_invalidated: Also list versions that are no longer served
+        """
+        query = "SELECT * FROM gai_resumes WHERE url = ?"
+        params: List[Any] = [normalize_url(linkedin_url)]
+        if target_role is not None:
+            query += " AND role = ?"
+            params.append(normalize_role(target_role))
+        if not include_invalidated:
+            query += " AND invalidated_at IS NULL"
+        rows = self._all(query + " ORDER BY version_id DESC", params)
+        for record in rows:
+            del record["resume"]
+        return rows
+
+    def get(self, version_id: int) -> Optional[Dict[str, Any]]:
+        """One version with its resume content, or None"""
+        return self._one("SELECT * FROM gai_resumes WHERE version_id = ?", [version_id])
+
+    def invalidate(self, linkedin_url: str, target_role: Optional[str] = None, reason: str = "invalidated") -> int:
+        """
+        Stop serving the stored resumes of a URL (of one role, if given); they stay listable.
+
+        Returns:
+            Number of versions invalidated
+        """
+        query = "UPDATE gai_resumes SET invalidated_at = ?, invalidated_reason = ? WHERE url = ? AND invalidated_at IS NULL"
+        params: List[Any] = [time.time(), reason, normalize_url(linkedin_url)]
+        if target_role is not None:
+            query += " AND role = ?"
+            params.append(normalize_role(target_role))
+        with self._lock:
+            count = self._db.execute(query, params).rowcount
+            self._db.commit()
+        return count
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            versions, valid = self._db.execute(
+                "SELECT COUNT(*), COUNT(*) - COUNT(invalidated_at) FROM gai_resumes"
+            ).fetchone()
+            return {"hits": self._hits, "misses": self._misses, "saved": self._saved, "versions": versions, "valid": valid}
+
+    def _one(self, query: str, params: List[Any]) -> Optional[Dict[str, Any]]:
+        rows = self._all(query, params)
+        return rows[0] if rows else None
+
+    def _all(self, query: str, params: List[Any]) -> List[Dict[str, Any]]:
+        with self._lock:
+            cursor = self._db.execute(query, params)
+            columns = [column[0] for column in cursor.description]
+            rows = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        for record in rows:
+            record["resume"] = json.loads(record["resume"])
+            record["valid"] = record["invalidated_at"] is None
+        return rows
@@ -0,0 +1,170 @@
+"""
+Cross-process request coalescing for LinkedIn GAI calls
+Worker processes share identical in-flight LLM calls through a lease table in a SQLite (WAL) file
+"""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from result_cache import open_shared_db
+
+logger = logging.getLogger(__name__)
+
+
+class SharedFlight:
+    """
+    Deduplicates identical calls across worker processes.
+
+    The first process to insert a lease row for a key runs the call and
+    writes the result into the row; other processes poll the row and return
+    that result instead of calling the LLM themselves. If the leader fails,
+    its row is deleted and a waiting process takes over; if the leader dies,
+    the lease expires after lease_seconds and is taken over the same way.
+
+    Finished rows are kept for result_seconds so waiters can read them, and
+    only waiters that started before the result was written accept it; a
+    later caller replaces the row and makes a fresh call.
+
+    Use behind SingleFlight, so each process holds at most one lease per key.
+    """
+
+    _PRUNE_EVERY = 256
+
+    def __init__(
+        self,
+        path: str,
+        lease_seconds: float = 120.0,
+        result_seconds: float = 30.0,
+        poll_interval: float = 0.05,
+    ):
+        """
+        Args:
+            path: SQLite file shared by all workers (e.g. LINKEDIN_GAI_CACHE_PATH)
+            lease_seconds: Time after which a running call is assumed dead and taken over
+            result_seconds: Time a finished result stays readable by waiters
+            poll_interval: Seconds between checks while waiting on another process
+        """
+        self.lease_seconds = lease_seconds
+        self.result_seconds = result_seconds
+        self.poll_interval = poll_interval
+        self._db: Optional[sqlite3.Connection] = None
+        self._acquired = 0
+        self._counts = {"led": 0, "followed": 0, "taken_over": 0, "errors": 0}
+        try:
+            db = open_shared_db(path)
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS shared_flights ("
+                "key TEXT PRIMARY KEY, owner TEXT NOT NULL, expires_at REAL NOT NULL, "
+                "result TEXT, finished_at REAL)"
+            )
+            db.commit()
+            self._db = db
+        except sqlite3.Error as e:
+            logger.warning("Cross-process coalescing disabled, cannot open %s: %s", path, e)
+
+    @property
+    def enabled(self) -> bool:
+        return self._db is not None
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run fn() once per key among concurrent callers in all processes.
+
+        Args:
+            key: Identity of the call, e.g. a canonical hash of its inputs
+            fn: Zero-argument factory returning the awaitable; its result must be JSON-serializable to be shared
+
+        Returns:
+            The result of this process's call or of another process's call
+        """
+        if self._db is None:
+            return await fn()
+        started = time.time()
+        owner = uuid.uuid4().hex
+        while True:
+            try:
+                leader = self._try_acquire(key, owner)
+            except sqlite3.Error as e:
+                self._counts["errors"] += 1
+                logger.warning("Cross-process coalescing unavailable, calling directly: %s", e)
+                return await fn()
+            if leader:
+                return await self._lead(key, owner, fn)
+
+            while True:
+                await asyncio.sleep(self.poll_interval)
+                try:
+                    row = self._read(key)
+                except sqlite3.Error as e:
+                    self._counts["errors"] += 1
+                    logger.warning("Cross-process coalescing unavailable, calling directly: %s", e)
+                    return await fn()
+                if row is None:
+                    # The leader failed; try to lead
+                    break
+                result, finished_at, expires_at = row
+                if finished_at is not None and finished_at >= started:
+                    self._counts["followed"] += 1
+                    return json.loads(result)
+                if finished_at is not None or expires_at < time.time():
+                    self._counts["taken_over"] += 1
+                    break
+
+    def stats(self) -> Dict[str, Any]:
+        """Calls led by this process, results taken from other processes, and lease takeovers"""
+        return {"enabled": self.enabled, **self._counts}
+
+    async def _lead(self, key: str, owner: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        self._counts["led"] += 1
+        try:
+            result = await fn()
+        except BaseException:
+            self._release(key, owner)
+            raise
+        try:
+            now = time.time()
+            self._db.execute(
+                "UPDATE shared_flights SET result = ?, finished_at = ?, expires_at = ? WHERE key = ? AND owner = ?",
+                (json.dumps(result, separators=(",", ":")), now, now + self.result_seconds, key, owner),
+            )
+            self._db.commit()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            self._counts["errors"] += 1
+            logger.warning("Could not share result for %s: %s", key[:12], e)
+            self._release(key, owner)
+        return result
+
+    def _try_acquire(self, key: str, owner: str) -> bool:
+        """Insert a lease, or replace a finished or expired one; True if this caller now owns the key"""
+        now = time.time()
+        self._db.execute(
+            "INSERT INTO shared_flights (key, owner, expires_at) VALUES (?, ?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET owner = excluded.owner, expires_at = excluded.expires_at, "
+            "result = NULL, finished_at = NULL "
+            "WHERE shared_flights.finished_at IS NOT NULL OR shared_flights.expires_at < ?",
+            (key, owner, now + self.lease_seconds, now),
+        )
+        self._acquired += 1
+        if self._acquired % self._PRUNE_EVERY == 0:
+            self._db.execute("DELETE FROM shared_flights WHERE expires_at < ?", (now,))
+        self._db.commit()
+        row = self._db.execute("SELECT owner FROM shared_flights WHERE key = ?", (key,)).fetchone()
+        return row is not None and row[0] == owner
+
+    def _read(self, key: str) -> Optional[Tuple[Optional[str], Optional[float], float]]:
+        return self._db.execute(
+            "SELECT result, finished_at, expires_at FROM shared_flights WHERE key = ?", (key,)
+        ).fetchone()
+
+    def _release(self, key: str, owner: str) -> None:
+        try:
+            self._db.execute("DELETE FROM shared_flights WHERE key = ? AND owner = ?", (key, owner))
+            self._db.commit()
+        except sqlite3.Error as e:
+            self._counts["errors"] += 1
+            logger.warning("Could not release lease for %s: %s", key[:12], e)
@@ -0,0 +1,80 @@
+"""
+Single-flight request coalescing for LinkedIn GAI calls
+Concurrent calls with the same key share one in-flight awaitable and its result
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict
+
+logger = logging.getLogger(__name__)
+
+
+class _Call:
+    """A shared in-flight task and the number of callers waiting on it"""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: "asyncio.Future"):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Deduplicates concurrent calls by key.
+
+    The first caller for a key starts the work as a task; later callers with
+    the same key await that same task. Each caller awaits through
+    ``asyncio.shield`` so cancelling one waiter leaves the shared call running
+    for the others. The shared call is cancelled only once every waiter has
+    gone away.
+    """
+
+    def __init__(self):
+        self._calls: Dict[str, _Call] = {}
+        self._started = 0
+        self._coalesced = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run fn() once per key among concurrent callers.
+
+        Args:
+            key: Identity of the call, e.g. a canonical hash of its inputs
+            fn: Zero-argument factory returning the awaitable to share
+
+        Returns:
+            The shared result; exceptions are raised to every waiter
+        """
+        call = self._calls.get(key)
+        if call is None:
+            call = _Call(asyncio.ensure_future(fn()))
+            self._calls[key] = call
+            call.task.add_done_callback(lambda _task, key=key, call=call: self._forget(key, call))
+            self._started += 1
+        else:
+            self._coalesced += 1
+            logger.debug("Coalesced in-flight call %s (%d waiters)", key[:12], call.waiters + 1)
+
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                # Nobody is left to read the result
+                self._forget(key, call)
+                call.task.cancel()
+
+    def stats(self) -> Dict[str, int]:
+        """Counters for started vs. coalesced calls"""
+        return {
+            "in_flight": len(self._calls),
+            "started": self._started,
+            "coalesced": self._coalesced,
+        }
+
+    def _forget(self, key: str, call: _Call) -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
@@ -0,0 +1,254 @@
+"""
+Local skill matching engine for job compatibility
+Word-boundary skill/phrase matching with NumPy-weighted coverage scoring, no LLM call
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Lowercase tokens; keeps "c++", "c#", "node.js", "asp.net" and ".net" (a leading "."
+# only at the start of a word) intact while dropping sentence punctuation such as
+# the trailing "." in "Python."
+TOKEN_RE = re.compile(r"(?:(?<![^\s(/])\.)?[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9+#]+)*")
+
+SKILL_VOCABULARY = [
+    # Languages
+    "Python", "Java", "JavaScript", "TypeScript", "Go", "Rust", "C++", "C#", "Scala",
+    "Kotlin", "Swift", "Objective-C", "Ruby", "PHP", "SQL", "Bash", "Perl", "Haskell",
+    "Elixir", "Dart", "MATLAB",
+    # Web and frameworks
+    "React", "Angular", "Vue", "Next.js", "Node.js", "Express", "Django", "Flask", "FastAPI",
+    "Spring", "Spring Boot", "Rails", ".NET", "ASP.NET", "GraphQL", "REST", "gRPC", "HTML",
+    "CSS", "Tailwind", "Redux", "jQuery",
+    # Data and ML
+    "Machine Learning", "Deep Learning", "Natural Language Processing", "Computer Vision",
+    "TensorFlow", "PyTorch", "scikit-learn", "Pandas", "NumPy", "Spark", "Hadoop", "Kafka",
+    "Airflow", "Flink", "Data Science", "Data Engineering", "Data Analysis", "Statistics",
+    "LLM", "Generative AI", "Recommendation Systems", "Search", "Information Retrieval",
+    "A/B Testing", "ETL", "Tableau", "Power BI",
+    # Databases
+    "PostgreSQL", "MySQL", "MongoDB", "Redis", "Cassandra", "Elasticsearch", "DynamoDB",
+    "SQLite", "Oracle", "Snowflake", "BigQuery",
+    # Cloud and infrastructure
+    "AWS", "Azure", "GCP", "Docker", "Kubernetes", "Terraform", "Ansible", "Linux", "CI/CD",
+    "Jenkins", "GitHub Actions", "Git", "Microservices", "Distributed Systems",
+    "System Design", "Serverless", "DevOps", "Site Reliability Engineering", "Observability",
+    "Prometheus", "Grafana",
+    # Mobile
+    "iOS", "Android", "React Native", "Flutter",
+    # Practices and roles
+    "Agile", "Scrum", "Product Management", "Project Management", "Leadership",
+    "Communication", "Mentoring", "Stakeholder Management", "UX", "UI Design", "Figma",
+    "Testing", "Unit Testing", "Security", "Performance Optimization", "Algorithms",
+    "Data Structures",
+]
+
+# Single-letter skills: any lone letter in running text ("Plan B", "R&D", "C-level")
+# would match them, so they are only recognized in explicit skill lists
+EXPLICIT_SKILLS = ["C", "R"]
+
+# Alternate spellings mapped onto a vocabulary entry
+SKILL_ALIASES = {
+    "js": "JavaScript",
+    "ts": "TypeScript",
+    "golang": "Go",
+    "k8s": "Kubernetes",
+    "postgres": "PostgreSQL",
+    "reactjs": "React",
+    "react.js": "React",
+    "nodejs": "Node.js",
+    "vue.js": "Vue",
+    "nextjs": "Next.js",
+    "ml": "Machine Learning",
+    "nlp": "Natural Language Processing",
+    "genai": "Generative AI",
+    "large language models": "LLM",
+    "llms": "LLM",
+    "sklearn": "scikit-learn",
+    "google cloud": "GCP",
+    "google cloud platform": "GCP",
+    "amazon web services": "AWS",
+    "ci cd": "CI/CD",
+    "sre": "Site Reliability Engineering",
+    "ab testing": "A/B Testing",
+    "restful": "REST",
+    "springboot": "Spring Boot",
+}
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase the text once and split it into skill tokens"""
+    return TOKEN_RE.findall(text.lower()) if text else []
+
+
+def skill_phrase(skill: str) -> Tuple[str, ...]:
+    """Token tuple used to match a skill or multi-word phrase on word boundaries"""
+    return tuple(tokenize(skill))
+
+
+@dataclass
+class SkillMatch:
+    """Result of matching a skill set against one job posting"""
+    score: int
+    coverage: float
+    matching_skills: List[str] = field(default_factory=list)
+    missing_skills: List[str] = field(default_factory=list)
+    job_skills: List[str] = field(default_factory=list)
+
+
+class SkillMatcher:
+    """
+    Matches user skills against job text using a fixed skill vocabulary.
+
+    The job text is tokenized once; every vocabulary phrase (plus any user
+    skill not in the vocabulary) is looked up as an n-gram of whole tokens,
+    so "Go" does not match inside "Google". Coverage is the share of the
+    job's weighted skill mentions that the user has. Explicit skills are
+    canonicalized in skill lists but never looked up in text.
+    """
+
+    def __init__(
+        self,
+        vocabulary: Sequence[str] = SKILL_VOCABULARY,
+        aliases: Optional[Dict[str, str]] = None,
+        explicit_skills: Sequence[str] = EXPLICIT_SKILLS,
+    ):
+        self._explicit: Dict[Tuple[str, ...], str] = {skill_phrase(name): name for name in explicit_skills}
+        self._names: List[str] = []
+        self._phrases: Dict[Tuple[str, ...], int] = {}
+        for name in vocabulary:
+            phrase = skill_phrase(name)
+            if phrase and phrase not in self._phrases:
+                self._phrases[phrase] = len(self._names)
+                self._names.append(name)
+
+        for alias, name in (SKILL_ALIASES if aliases is None else aliases).items():
+            phrase = skill_phrase(alias)
+            target = self._phrases.get(skill_phrase(name))
+            if phrase and target is not None:
+                self._phrases.setdefault(phrase, target)
+
+        self._max_len = max(len(phrase) for phrase in self._phrases)
+        # Multi-word phrases are more specific than single tokens
+        lengths = np.ones(len(self._names))
+        for phrase, index in self._phrases.items():
+            lengths[index] = max(lengths[index], len(phrase))
+        self._weights = 1.0 + 0.5 * (lengths - 1.0)
+
+    @property
+    def vocabulary(self) -> List[str]:
+        return list(self._names)
+
+    def canonical_skill(self, skill: str) -> Optional[str]:
+        """Vocabulary or explicit skill name for a skill or alias, or None if unknown"""
+        phrase = skill_phrase(skill)
+        index = self._phrases.get(phrase)
+        return self._names[index] if index is not None else self._explicit.get(phrase)
+
+    def extract_skills(self, text: str) -> Dict[str, int]:
+        """Vocabulary skills mentioned in text with their mention counts"""
+        counts = self._count(tokenize(text), self._phrases, self._max_len, len(self._names))
+        return {self._names[i]: int(counts[i]) for i in np.flatnonzero(counts)}
+
+    def match(self, user_skills: Iterable[str], job_text: str) -> SkillMatch:
+        """
+        Score a skill set against a job posting.
+
+        Args:
+            user_skills: User's skills, in any spelling/case
+            job_text: Job requirements and/or description
+
+        Returns:
+            SkillMatch with a 0-100 score, matching skills (in the user's
+            spelling) and missing vocabulary skills ordered by importance
+        """
+        phrases = self._phrases
+        names = self._names
+        weights = self._weights
+        user_indices: Dict[int, str] = {}
+        extra: Dict[Tuple[str, ...], int] = {}
+
+        for skill in user_skills:
+            phrase = skill_phrase(skill)
+            if not phrase or phrase in self._explicit:
+                continue
+            index = phrases.get(phrase, extra.get(phrase))
+            if index is None:
+                # Unknown skills still count when the job mentions them
+                index = len(names) + len(extra)
+                extra[phrase] = index
+            user_indices.setdefault(index, skill.strip())
+
+        size = len(names) + len(extra)
+        if extra:
+            phrases = {**phrases, **extra}
+            weights = np.concatenate([weights, 1.0 + 0.5 * (np.array([len(p) for p in extra]) - 1.0)])
+        max_len = max(self._max_len, max((len(p) for p in extra), default=1))
+
+        counts = self._count(tokenize(job_text), phrases, max_len, size)
+        job_weight = np.log1p(counts) * weights
+        total = float(job_weight.sum())
+
+        user_mask = np.zeros(size, dtype=bool)
+        if user_indices:
+            user_mask[list(user_indices)] = True
+
+        present = counts > 0
+        coverage = float(job_weight[user_mask].sum()) / total if total else 0.0
+        order = np.argsort(-job_weight, kind="stable")
+
+        return SkillMatch(
+            score=int(round(coverage * 100)),
+            coverage=round(coverage, 4),
+            matching_skills=[user_indices[i] for i in order if present[i] and user_mask[i]],
+            missing_skills=[names[i] for i in order if present[i] and not user_mask[i] and i < len(names)],
+            job_skills=[names[i] if i < len(names) else user_indices[i] for i in order if present[i]],
+        )
+
+    @staticmethod
+    def _count(tokens: List[str], phrases: Dict[Tuple[str, ...], int], max_len: int, size: int) -> np.ndarray:
+        unigrams = {phrase[0]: index for phrase, index in phrases.items() if len(phrase) == 1}
+        starts = {phrase[0] for phrase in phrases if len(phrase) > 1}
+        hits = [unigrams[token] for token in tokens if token in unigrams]
+        if starts:
+            n_tokens = len(tokens)
+            # Only positions that can begin a multi-word phrase need n-gram lookups
+            for start, token in enumerate(tokens):
+                if token not in starts:
+                    continue
+                for length in range(2, min(max_len, n_tokens - start) + 1):
+                    index = phrases.get(tuple(tokens[start:start + length]))
+                    if index is not None:
+                        hits.append(index)
+        return np.bincount(np.asarray(hits, dtype=np.intp), minlength=size).astype(float)
+
+
+def compatibility_from_match(match: SkillMatch) -> Dict[str, Any]:
+    """Shape a SkillMatch like the LLM job compatibility analysis"""
+    if not match.job_skills:
+        assessment = "No recognizable skills found in the job posting; a detailed analysis is needed"
+    elif match.score >= 75:
+        assessment = "Strong compatibility: most of the skills this job emphasizes are covered"
+    elif match.score >= 50:
+        assessment = "Good compatibility with room for skill development"
+    elif match.score >= 25:
+        assessment = "Partial compatibility: several key skills for this job are missing"
+    else:
+        assessment = "Low compatibility: the job emphasizes skills not in the current profile"
+
+    recommendations = [f"Build and demonstrate experience with {skill}" for skill in match.missing_skills[:3]]
+    if match.matching_skills:
+        recommendations.append(f"Highlight {', '.join(match.matching_skills[:3])} prominently in your application")
+
+    return {
+        "compatibilityScore": match.score,
+        "matchingSkills": match.matching_skills,
+        "missingSkills": match.missing_skills,
+        "recommendations": recommendations,
+        "strengthAreas": match.matching_skills[:3],
+        "improvementAreas": match.missing_skills[:3],
+        "overallAssessment": assessment,
+    }
@@ -0,0 +1,204 @@
+"""
+Incremental JSON parser for streamed LLM output
+Emits each top-level section of a JSON object as soon as it is syntactically complete
+"""
+
+import json
+from typing import Any, Dict, Iterable, List, Optional
+
+
+class IncrementalJSONParser:
+    """
+    Consumes a JSON object in arbitrary text chunks.
+
+    Each call to ``feed`` scans only the new characters and returns events for
+    values that completed in that chunk:
+
+    - ``{"section": key, "value": ...}`` for a finished top-level field
+    - ``{"section": key, "index": i, "value": ...}`` for each finished element
+      of a top-level array listed in ``split_arrays``
+
+    Anything before the first ``{`` (such as a ```json fence or a preamble) and
+    after the closing ``}`` is ignored. Only the completed slice of each value
+    is handed to ``json.loads``, so the buffer is never re-scanned as a whole.
+    """
+
+    def __init__(self, split_arrays: Iterable[str] = ()):
+        self._split_arrays = frozenset(split_arrays)
+        self._text = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._done = False
+        self._result: Dict[str, Any] = {}
+
+        # Top-level field state: key -> colon -> value -> in_value -> comma
+        self._state = "key"
+        self._key: Optional[str] = None
+        self._key_start = 0
+        self._value_start = 0
+        self._value_kind = ""
+
+        # Element state for the split array currently being read
+        self._items: Optional[List[Any]] = None
+        self._item_state = "value"
+        self._item_start = 0
+        self._item_kind = ""
+
+    @property
+    def done(self) -> bool:
+        """True once the root object has closed"""
+        return self._done
+
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        """Consume the next chunk of text and return events for values it completed"""
+        if self._done or not chunk:
+            return []
+        self._text += chunk
+        events: List[Dict[str, Any]] = []
+        text = self._text
+
+        for i in range(self._pos, len(text)):
+            c = text[i]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif c == "\\":
+                    self._escape = True
+                elif c == '"':
+                    self._in_string = False
+                    self._end_string(i, events)
+                continue
+
+            if self._depth == 0:
+                if c == "{":
+                    self._depth = 1
+                    self._state = "key"
+                continue
+
+            if c == '"':
+                self._in_string = True
+                self._start_value(i, "string")
+            elif c == "{" or c == "[":
+                self._start_value(i, "container", opens_array=c == "[")
+                self._depth += 1
+            elif c == "}" or c == "]":
+                self._depth -= 1
+                self._end_container(i, events)
+                if self._done:
+                    self._text = ""
+                    self._pos = 0
+                    return events
+            elif c == ",":
+                self._end_scalar(i, events)
+            elif c == ":":
+                if self._depth == 1 and self._state == "colon":
+                    self._state = "value"
+            elif not c.isspace():
+                self._start_value(i, "scalar")
+
+        self._pos = len(text)
+        self._discard_consumed()
+        return events
+
+    def result(self) -> Dict[str, Any]:
+        """
+        The fully assembled object.
+
+        Raises:
+            ValueError: If the root object has not closed yet
+        """
+        if not self._done:
+            raise ValueError("Incomplete JSON object in stream")
+        return self._result
+
+    def _discard_consumed(self) -> None:
+        """Drop buffered text that no pending key or value still needs"""
+        keep = self._pos
+        if self._depth == 1 and self._state == "key" and self._in_string:
+            keep = self._key_start
+        elif self._depth >= 1 and self._state == "in_value":
+            keep = self._value_start
+            if self._items is not None:
+                keep = self._item_start if self._item_state == "in_value" else self._pos
+        if keep <= 0:
+            return
+        self._text = self._text[keep:]
+        self._pos -= keep
+        self._key_start -= keep
+        self._value_start -= keep
+        self._item_start -= keep
+
+    def _in_split_array(self) -> bool:
+        return self._items is not None and self._depth == 2
+
+    def _start_value(self, i: int, kind: str, opens_array: bool = False) -> None:
+        if self._depth == 1:
+            if self._state == "key" and kind == "string":
+                self._key_start = i
+            elif self._state == "value":
+                self._value_start = i
+                self._value_kind = kind
+                self._state = "in_value"
+                if opens_array and self._key in self._split_arrays:
+                    self._items = []
+                    self._item_state = "value"
+        elif self._in_split_array() and self._item_state == "value":
+            self._item_start = i
+            self._item_kind = kind
+            self._item_state = "in_value"
+
+    def _end_string(self, i: int, events: List[Dict[str, Any]]) -> None:
+        if self._depth == 1:
+            if self._state == "key":
+                self._key = json.loads(self._text[self._key_start:i + 1])
+                self._state = "colon"
+            elif self._state == "in_value" and self._value_kind == "string":
+                self._emit_section(self._text[self._value_start:i + 1], events)
+        elif self._in_split_array() and self._item_state == "in_value" and self._item_kind == "string":
+            self._emit_item(self._text[self._item_start:i + 1], events)
+
+    def _end_scalar(self, i: int, events: List[Dict[str, Any]]) -> None:
+        """Handle a comma, which ends a pending scalar at its level"""
+        if self._depth == 1:
+            if self._state == "in_value" and self._value_kind == "scalar":
+                self._emit_section(self._text[self._value_start:i], events)
+            if self._state == "comma":
+                self._state = "key"
+        elif self._in_split_array():
+            if self._item_state == "in_value" and self._item_kind == "scalar":
+                self._emit_item(self._text[self._item_start:i], events)
+            if self._item_state == "comma":
+                self._item_state = "value"
+
+    def _end_container(self, i: int, events: List[Dict[str, Any]]) -> None:
+        """Handle a closing bracket; self._depth is already decremented"""
+        if self._depth == 0:
+            if self._state == "in_value" and self._value_kind == "scalar":
+                self._emit_section(self._text[self._value_start:i], events)
+            self._done = True
+        elif self._depth == 1 and self._state == "in_value" and self._value_kind == "container":
+            if self._items is not None:
+                if self._item_state == "in_value" and self._item_kind == "scalar":
+                    self._emit_item(self._text[self._item_start:i], events)
+                # Elements were parsed as they completed; no need to parse the array again
+                self._result[self._key] = self._items
+                self._items = None
+                self._state = "comma"
+            else:
+                self._emit_section(self._text[self._value_start:i + 1], events)
+        elif self._depth == 2 and self._items is not None and self._item_state == "in_value" and self._item_kind == "container":
+            self._emit_item(self._text[self._item_start:i + 1], events)
+
+    def _emit_section(self, raw: str, events: List[Dict[str, Any]]) -> None:
+        value = json.loads(raw)
+        self._result[self._key] = value
+        events.append({"section": self._key, "value": value})
+        self._state = "comma"
+
+    def _emit_item(self, raw: str, events: List[Dict[str, Any]]) -> None:
+        value = json.loads(raw)
+        events.append({"section": self._key, "index": len(self._items), "value": value})
+        self._items.append(value)
+        self._item_state = "comma"
@@ -0,0 +1,322 @@
+"""
+Asynchronous task queue for long LinkedIn GAI generations
+Submit returns a task id at once; a bounded in-process worker pool runs the work and results stay readable for a TTL
+"""
+
+import asyncio
+import contextvars
+import json
+import logging
+import sqlite3
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import deadlines
+from admission import Overloaded
+from result_cache import open_shared_db
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINISHED = (SUCCEEDED, FAILED, CANCELLED)
+
+Handler = Callable[[Dict[str, Any]], Awaitable[Any]]
+
+
+class TaskQueue:
+    """
+    Runs registered operations in the background and keeps their results.
+
+    Tasks wait in a bounded FIFO queue (submit fails fast with Overloaded
+    when it is full) and run on a fixed number of worker coroutines, each
+    under its own deadline. Task records live in memory and, when a SQLite
+    path is given, in a table shared by worker processes, so a client may
+    poll any process; long-polls on the process running the task wake up
+    as soon as it finishes, others poll the table. Finished tasks are kept
+    for ttl_seconds.
+    """
+
+    _PRUNE_EVERY = 64
+
+    def __init__(
+        self,
+        workers: int = 4,
+        max_queued: int = 100,
+        ttl_seconds: float = 3600.0,
+        task_timeout: Optional[float] = 300.0,
+        path: Optional[str] = None,
+        poll_interval: float = 0.25,
+    ):
+        """
+        Args:
+            workers: Tasks run concurrently
+            max_queued: Tasks waiting for a worker before submit is rejected
+            ttl_seconds: Time a finished task's record and result stay readable
+            task_timeout: Deadline for running one task; None for no deadline
+            path: Optional SQLite file shared with other worker processes (e.g. LINKEDIN_GAI_CACHE_PATH)
+            poll_interval: Seconds between table reads while long-polling a task of another process
+        """
+        self.workers = workers
+        self.max_queued = max_queued
+        self.ttl_seconds = ttl_seconds
+        self.task_timeout = task_timeout
+        self.poll_interval = poll_interval
+        self._handlers: Dict[str, Handler] = {}
+        self._tasks: Dict[str, Dict[str, Any]] = {}
+        self._done: Dict[str, asyncio.Event] = {}
+        self._running: Dict[str, asyncio.Task] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._stopping = False
+        self._submitted = 0
+        self._counts = {SUCCEEDED: 0, FAILED: 0, CANCELLED: 0, "rejected": 0}
+        self._db: Optional[sqlite3.Connection] = None
+        if path:
+            try:
+                db = open_shared_db(path)
+                db.execute(
+                    "CREATE TABLE IF NOT EXISTS gai_tasks ("
+                    "task_id TEXT PRIMARY KEY, record TEXT NOT NULL, expires_at REAL NOT NULL)"
+                )
+                db.commit()
+                self._db = db
+            except sqlite3.Error as e:
+                logger.warning("Task records kept in memory only, cannot open %s: %s", path, e)
+
+    def register(self, operation: str, handler: Handler) -> None:
+        """Make an operation submittable; handler receives the task payload and returns a JSON-serializable result"""
+        self._handlers[operation] = handler
+
+    @property
+    def operations(self) -> List[str]:
+        return sorted(self._handlers)
+
+    def start(self) -> None:
+        """Start the worker coroutines on the running event loop (also done by the first submit)"""
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queued)
+        self._stopping = False
+        self._workers = [worker for worker in self._workers if not worker.done()]
+        while len(self._workers) < self.workers:
+            # A fresh context, so workers started from a request do not inherit its deadline
+            self._workers.append(contextvars.Context().run(asyncio.ensure_future, self._work()))
+
+    async def stop(self) -> None:
+        """Cancel the workers and any running tasks"""
+        self._stopping = True
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    def submit(self, operation: str, payload: Dict[str, Any], timeout_seconds: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Queue a task.
+
+        Args:
+            operation: Registered operation name
+            payload: Handler input
+            timeout_seconds: Deadline for running the task, at most the queue's task_timeout
+
+        Returns:
+            The new task record
+
+        Raises:
+            KeyError: If the operation is not registered
+            Overloaded: If the queue is full
+        """
+        if operation not in self._handlers:
+            raise KeyError(operation)
+        self.start()
+        now = time.time()
+        timeout = self.task_timeout
+        if timeout_seconds and timeout_seconds > 0:
+            timeout = min(timeout, timeout_seconds) if timeout else timeout_seconds
+        record = {
+            "task_id": uuid.uuid4().hex,
+            "operation": operation,
+            "status": QUEUED,
+            "submitted_at": now,
+            "started_at": None,
+            "finished_at": None,
+            "result": None,
+            "error": None,
+        }
+        try:
+            self._queue.put_nowait((record["task_id"], payload, timeout))
+        except asyncio.QueueFull:
+            self._counts["rejected"] += 1
+            raise Overloaded("tasks", retry_after=self._retry_after(), reason=f"{self.max_queued} tasks queued")
+        self._tasks[record["task_id"]] = record
+        self._done[record["task_id"]] = asyncio.Event()
+        # Unfinished records outlive a process that dies mid-task by the task deadline plus the TTL
+        self._save(record, now + (timeout or 0) + self.ttl_seconds)
+        self._submitted += 1
+        if self._submitted % self._PRUNE_EVERY == 0:
+            self._prune()
+        return dict(record)
+
+    def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """The task record, or None if it is unknown or expired"""
+        record = self._tasks.get(task_id)
+        if record is not None:
+            if record["status"] in FINISHED and record["finished_at"] + self.ttl_seconds < time.time():
+                self._forget(task_id)
+                return None
+            return dict(record)
+        return self._load(task_id)
+
+    async def wait(self, task_id: str, timeout: float) -> Optional[Dict[str, Any]]:
+        """
+        Long-poll: return the task record once it finishes or after timeout seconds, whichever is first.
+
+        Returns:
+            The task record, or None if it is unknown or expired
+        """
+        record = self.get(task_id)
+        if record is None or record["status"] in FINISHED or timeout <= 0:
+            return record
+        done = self._done.get(task_id)
+        if done is not None:
+            try:
+                await asyncio.wait_for(done.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+            return self.get(task_id)
+        # Running in another process: poll the shared table
+        give_up = time.monotonic() + timeout
+        while time.monotonic() < give_up:
+            await asyncio.sleep(min(self.poll_interval, max(0.0, give_up - time.monotonic())))
+            record = self.get(task_id)
+            if record is None or record["status"] in FINISHED:
+                return record
+        return self.get(task_id)
+
+    def cancel(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Cancel a queued or running task of this process.
+
+        Returns:
+            The task record, or None if this process does not know the task
+        """
+        record = self._tasks.get(task_id)
+        if record is None:
+            return None
+        if record["status"] in FINISHED:
+            return dict(record)
+        running = self._running.get(task_id)
+        if running is not None:
+            running.cancel()
+        else:
+            # Still queued: the worker skips it when it comes up
+            self._finish(record, CANCELLED, error="Cancelled before it started")
+        return dict(record)
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth, running tasks and outcome counters"""
+        return {
+            "workers": self.workers,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "max_queued": self.max_queued,
+            "running": len(self._running),
+            "submitted": self._submitted,
+            **self._counts,
+            "shared": self._db is not None,
+        }
+
+    async def _work(self) -> None:
+        while True:
+            task_id, payload, timeout = await self._queue.get()
+            try:
+                record = self._tasks.get(task_id)
+                if record is None or record["status"] != QUEUED:
+                    continue
+                record["status"] = RUNNING
+                record["started_at"] = time.time()
+                self._save(record, record["started_at"] + (timeout or 0) + self.ttl_seconds)
+                # A separate asyncio task per run, so cancel() and the deadline only affect this task
+                run = asyncio.ensure_future(self._run(record["operation"], payload, timeout))
+                self._running[task_id] = run
+                try:
+                    result = await run
+                except asyncio.CancelledError:
+                    if self._stopping:
+                        # Cancelling the worker also cancelled the run it was awaiting
+                        run.cancel()
+                        self._finish(record, CANCELLED, error="Worker stopped")
+                        raise
+                    self._finish(record, CANCELLED, error="Cancelled while running")
+                except deadlines.DeadlineExceeded as e:
+                    self._finish(record, FAILED, error=str(e))
+                except Exception as e:
+                    logger.error("Task %s (%s) failed: %s", task_id, record["operation"], e, exc_info=True)
+                    self._finish(record, FAILED, error=str(e))
+                else:
+                    self._finish(record, SUCCEEDED, result=result)
+                finally:
+                    self._running.pop(task_id, None)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, operation: str, payload: Dict[str, Any], timeout: Optional[float]) -> Any:
+        deadlines.tighten(timeout)
+        return await self._handlers[operation](payload)
+
+    def _finish(self, record: Dict[str, Any], status: str, result: Any = None, error: Optional[str] = None) -> None:
+        record.update(status=status, finished_at=time.time(), result=result, error=error)
+        self._counts[status] += 1
+        self._save(record, record["finished_at"] + self.ttl_seconds)
+        done = self._done.get(record["task_id"])
+        if done is not None:
+            done.set()
+        logger.info("Task %s (%s) %s", record["task_id"], record["operation"], status)
+
+    def _retry_after(self) -> int:
+        # Rough drain time of a full queue, assuming ~10 s per generation
+        return max(1, int(10 * self.max_queued / max(1, self.workers)))
+
+    def _forget(self, task_id: str) -> None:
+        self._tasks.pop(task_id, None)
+        self._done.pop(task_id, None)
+
+    def _prune(self) -> None:
+        now = time.time()
+        for task_id, record in list(self._tasks.items()):
+            if record["status"] in FINISHED and record["finished_at"] + self.ttl_seconds < now:
+                self._forget(task_id)
+        if self._db is not None:
+            try:
+                self._db.execute("DELETE FROM gai_tasks WHERE expires_at < ?", (now,))
+                self._db.commit()
+            except sqlite3.Error as e:
+                logger.warning("Failed to prune task records: %s", e)
+
+    def _save(self, record: Dict[str, Any], expires_at: float) -> None:
+        if self._db is None:
+            return
+        try:
+            self._db.execute(
+                "INSERT INTO gai_tasks (task_id, record, expires_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(task_id) DO UPDATE SET record = excluded.record, expires_at = excluded.expires_at",
+                (record["task_id"], json.dumps(record, default=str), expires_at),
+            )
+            self._db.commit()
+        except sqlite3.Error as e:
+            logger.warning("Failed to persist task %s: %s", record["task_id"], e)
+
+    def _load(self, task_id: str) -> Optional[Dict[str, Any]]:
+        if self._db is None:
+            return None
+        try:
+            row = self._db.execute(
+                "SELECT record FROM gai_tasks WHERE task_id = ? AND expires_at >= ?", (task_id, time.time())
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning("Failed to read task %s: %s", task_id, e)
+            return None
+        return json.loads(row[0]) if row else None
@@ -0,0 +1,169 @@
+"""
+Tests for per-endpoint admission control (admission.py)
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import deadlines
+from admission import AdmissionController, AdmissionLimiter, Overloaded
+from deadlines import DeadlineExceeded
+
+
+async def settle():
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+def test_slots_up_to_the_concurrency_limit_are_immediate():
+    async def scenario():
+        limiter = AdmissionLimiter("op", max_concurrency=2, max_queue=0)
+        assert await limiter.acquire() == 0.0
+        assert await limiter.acquire() == 0.0
+        with pytest.raises(Overloaded) as excinfo:
+            await limiter.acquire()
+        assert excinfo.value.retry_after >= 1
+        return limiter.stats()
+
+    stats = asyncio.run(scenario())
+    assert (stats["active"], stats["admitted"], stats["rejected"]) == (2, 2, 1)
+
+
+def test_release_hands_the_slot_to_the_oldest_waiter():
+    async def scenario():
+        limiter = AdmissionLimiter("op", max_concurrency=1, max_queue=2)
+        await limiter.acquire()
+        order = []
+
+        async def wait(name):
+            await limiter.acquire()
+            order.append(name)
+
+        first = asyncio.ensure_future(wait("first"))
+        await settle()
+        second = asyncio.ensure_future(wait("second"))
+        await settle()
+        assert limiter.queued == 2
+
+        limiter.release()
+        await settle()
+        # The slot moved to the first waiter without ever being free
+        assert order == ["first"]
+        assert limiter.active == 1
+        limiter.release()
+        await asyncio.gather(first, second)
+        assert order == ["first", "second"]
+        limiter.release()
+        return limiter.active, limiter.queued
+
+    assert asyncio.run(scenario()) == (0, 0)
+
+
+def test_a_cancelled_waiter_leaves_the_queue_and_skips_handoff():
+    async def scenario():
+        limiter = AdmissionLimiter("op", max_concurrency=1, max_queue=2)
+        await limiter.acquire()
+        cancelled = asyncio.ensure_future(limiter.acquire())
+        waiting = asyncio.ensure_future(limiter.acquire())
+        await settle()
+        cancelled.cancel()
+        await settle()
+        assert limiter.queued == 1
+        limiter.release()
+        await asyncio.wait_for(waiting, 1)
+        limiter.release()
+        return limiter.active
+
+    assert asyncio.run(scenario()) == 0
+
+
+def test_cancel_after_handoff_passes_the_slot_on():
+    async def scenario():
+        limiter = AdmissionLimiter("op", max_concurrency=1, max_queue=2)
+        await limiter.acquire()
+        first = asyncio.ensure_future(limiter.acquire())
+        second = asyncio.ensure_future(limiter.acquire())
+        await settle()
+        # Hand the slot to the first waiter and cancel it before it resumes
+        limiter.release()
+        first.cancel()
+        await asyncio.wait_for(second, 1)
+        limiter.release()
+        return first.cancelled(), limiter.active, limiter.queued
+
+    assert asyncio.run(scenario()) == (True, 0, 0)
+
+
+def test_full_queue_is_rejected_by_acquire_and_check():
+    async def scenario():
+        limiter = AdmissionLimiter("op", max_concurrency=1, max_queue=1)
+        limiter.check()
+        await limiter.acquire()
+        limiter.check()
+        waiter = asyncio.ensure_future(limiter.acquire())
+        await settle()
+        with pytest.raises(Overloaded):
+            limiter.check()
+        with pytest.raises(Overloaded):
+            await limiter.acquire()
+        limiter.release()
+        await waiter
+        limiter.release()
+        return limiter.stats()["rejected"]
+
+    assert asyncio.run(scenario()) == 2
+
+
+def test_queue_timeout_rejects_the_waiter():
+    async def scenario():
+        limiter = AdmissionLimiter("op", max_concurrency=1, max_queue=1, queue_timeout=0.01)
+        await limiter.acquire()
+        with pytest.raises(Overloaded) as excinfo:
+            await limiter.acquire()
+        return excinfo.value.reason, limiter.stats()
+
+    reason, stats = asyncio.run(scenario())
+    assert reason == "queue timeout"
+    assert (stats["queued"], stats["timed_out"]) == (0, 1)
+
+
+def test_request_deadline_bounds_the_wait():
+    async def scenario():
+        limiter = AdmissionLimiter("op", max_concurrency=1, max_queue=1, queue_timeout=10)
+        await limiter.acquire()
+        deadlines.tighten(0.01)
+        with pytest.raises(DeadlineExceeded):
+            await limiter.acquire()
+        return limiter.queued
+
+    assert asyncio.run(scenario()) == 0
+
+
+def test_slot_releases_on_exit_and_on_error():
+    async def scenario():
+        limiter = AdmissionLimiter("op", max_concurrency=1, max_queue=0)
+        async with limiter.slot() as waited:
+            assert waited == 0.0
+            assert limiter.active == 1
+        with pytest.raises(RuntimeError):
+            async with limiter.slot():
+                raise RuntimeError("boom")
+        return limiter.active
+
+    assert asyncio.run(scenario()) == 0
+
+
+def test_controller_reads_per_operation_limits(monkeypatch):
+    monkeypatch.setenv("LINKEDIN_GAI_ADMISSION_CONCURRENCY", "3")
+    monkeypatch.setenv("LINKEDIN_GAI_POLISH_RESUME_CONCURRENCY", "1")
+    monkeypatch.setenv("LINKEDIN_GAI_ADMISSION_QUEUE_TIMEOUT", "0")
+    controller = AdmissionController(["generate_resume", "polish_resume"])
+    assert controller["generate_resume"].max_concurrency == 3
+    assert controller["polish_resume"].max_concurrency == 1
+    assert controller["polish_resume"].queue_timeout is None
+    assert set(controller.stats()) == {"generate_resume", "polish_resume"}
@@ -0,0 +1,106 @@
+"""
+Endpoint tests for the FastAPI app (api_server.py), run in-process through httpx's ASGI transport
+"""
+
+import asyncio
+import json
+import os
+import sys
+
+import httpx
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Importing the app must not warm up the GAI backend, open the resume store or write python-backend.log
+os.environ.setdefault("LINKEDIN_GAI_WARM_UP", "lazy")
+os.environ.setdefault("LINKEDIN_GAI_RESUME_STORE", "0")
+import log_pipeline
+log_pipeline.setup_logging(None)
+
+import api_server
+import deadlines
+from admission import AdmissionLimiter
+
+JOB_MATCH = {
+    "user_skills": ["Python"],
+    "job_requirements": "Python and Kafka",
+    "job_description": "Build streaming pipelines",
+}
+
+
+async def request(method: str, path: str, **kwargs) -> httpx.Response:
+    transport = httpx.ASGITransport(app=api_server.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.request(method, path, **kwargs)
+
+
+@pytest.fixture
+def saturated(monkeypatch):
+    """Replace an endpoint's limiter with one whose only slot is taken and whose queue is empty"""
+    def saturate(name: str) -> AdmissionLimiter:
+        limiter = AdmissionLimiter(name, max_concurrency=1, max_queue=0)
+        limiter._active = 1
+        monkeypatch.setitem(api_server.admission._limiters, name, limiter)
+        return limiter
+    return saturate
+
+
+@pytest.mark.parametrize("path, body, operation", [
+    ("/api/linkedin/analyze-job-match", JOB_MATCH, "analyze_job_match"),
+    ("/api/linkedin/generate-post", {"topic": "Launch"}, "generate_post"),
+])
+def test_overloaded_endpoint_returns_429_with_retry_after(saturated, path, body, operation):
+    limiter = saturated(operation)
+    response = asyncio.run(request("POST", path, json=body))
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "1"
+    assert response.json()["success"] is False
+    assert limiter.stats()["rejected"] == 1
+
+
+def test_local_only_job_match_skips_admission(saturated):
+    saturated("analyze_job_match")
+    response = asyncio.run(request("POST", "/api/linkedin/analyze-job-match", json={**JOB_MATCH, "local_only": True}))
+    assert response.status_code == 200
+    assert response.json()["match_analysis"]["matchingSkills"] == ["Python"]
+
+
+def test_request_timeout_header_maps_an_expired_deadline_to_504(monkeypatch):
+    async def slow_post(**kwargs):
+        await deadlines.with_deadline(asyncio.sleep(10), "generate_post")
+
+    monkeypatch.setattr(api_server.gai_service, "generate_linkedin_post", slow_post)
+    response = asyncio.run(request("POST", "/api/linkedin/generate-post", json={"topic": "Launch"}, headers={"X-Request-Timeout": "0.05"}))
+    assert response.status_code == 504
+    assert response.json() == {"success": False, "error": "Deadline exceeded during generate_post", "timed_out": True}
+
+
+def test_metrics_endpoint_serves_the_text_format_by_route_template():
+    asyncio.run(request("GET", "/api/jobs/job-42/features"))
+    response = asyncio.run(request("GET", "/metrics"))
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    lines = response.text.splitlines()
+    assert "# TYPE gai_http_requests_total counter" in lines
+    assert "# HELP gai_http_request_duration_seconds HTTP request latency by route" in lines
+    assert any(line.startswith('gai_http_requests_total{endpoint="/api/jobs/{job_id}/features",method="GET",') for line in lines)
+    assert not any("job-42" in line for line in lines)
+
+
+def test_failing_batch_item_yields_an_error_line_and_the_stream_continues(monkeypatch):
+    async def analyze(user_skills, job_requirements, job_description, job_id=None):
+        if job_id == "bad":
+            raise RuntimeError("gateway error")
+        await asyncio.sleep(0.01)
+        return {"compatibilityScore": 80, "matchingSkills": user_skills}
+
+    monkeypatch.setattr(api_server.gai_service, "analyze_job_compatibility", analyze)
+    jobs = [{"id": job_id, "job_requirements": "Python", "job_description": ""} for job_id in ("a", "bad", "c")]
+    response = asyncio.run(request("POST", "/api/linkedin/analyze-job-match/batch", json={"user_skills": ["Python"], "jobs": jobs}))
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    items = {item["id"]: item for item in map(json.loads, response.text.splitlines())}
+    assert set(items) == {"a", "bad", "c"}
+    assert items["bad"] == {"index": 1, "id": "bad", "success": False, "error": "gateway error"}
+    assert items["a"]["success"] and items["c"]["match_analysis"]["compatibilityScore"] == 80
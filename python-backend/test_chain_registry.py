@@ -0,0 +1,70 @@
+"""
+Tests for the compiled chain registry (chain_registry.py)
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from benchmarks.fake_llm import FakeLLMConfig, create_fake_llm
+from chain_registry import ChainRegistry
+from prompt_templates import PROMPT_TEMPLATES
+
+TEMPLATES = {"echo": "Say {word}", "other": "Other {word}"}
+
+
+def make_registry(llm=None, **kwargs):
+    observed = []
+
+    def observe(chain):
+        observed.append(chain)
+        return chain
+
+    return ChainRegistry(llm or create_fake_llm(FakeLLMConfig(latency_ms=0, latency_sigma=0)), observe, **kwargs), observed
+
+
+def test_chains_are_compiled_once_and_served_from_the_registry():
+    registry, observed = make_registry(templates=TEMPLATES, template_dir="")
+    assert len(observed) == 2
+    first = registry.get("echo")
+    assert registry.get("echo") is first
+    assert len(observed) == 2
+    assert registry.names() == ["echo", "other"]
+
+
+def test_default_templates_cover_every_operation():
+    registry, _ = make_registry(template_dir="")
+    assert registry.names() == sorted(PROMPT_TEMPLATES)
+    result = asyncio.run(registry.get("generate_post").chain.ainvoke({"topic": "Launch", "details": "", "tone": "casual"}))
+    assert isinstance(result, str) and result
+
+
+def test_unknown_operation_raises_key_error():
+    registry, _ = make_registry(templates=TEMPLATES, template_dir="")
+    with pytest.raises(KeyError, match="Unknown GAI operation: missing"):
+        registry.get("missing")
+
+
+def test_reload_rebuilds_every_chain_and_swaps_the_llm():
+    registry, observed = make_registry(templates=TEMPLATES, template_dir="")
+    before = registry.get("echo")
+    replacement = create_fake_llm(FakeLLMConfig(latency_ms=0, latency_sigma=0, failure_rate=1.0))
+    assert registry.reload(llm=replacement) == ["echo", "other"]
+    assert len(observed) == 4
+    assert registry.get("echo") is not before
+    assert registry._llm is replacement
+    registry.reload()
+    assert registry._llm is replacement
+
+
+def test_reload_reads_template_overrides_from_disk(tmp_path):
+    registry, _ = make_registry(templates=TEMPLATES, template_dir=str(tmp_path))
+    assert registry.get("echo").template == "Say {word}"
+    (tmp_path / "echo.txt").write_text("Shout {word}", encoding="utf-8")
+    registry.reload()
+    assert registry.get("echo").template == "Shout {word}"
+    assert registry.get("other").template == "Other {word}"
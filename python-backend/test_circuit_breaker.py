@@ -0,0 +1,130 @@
+"""
+Tests for the LinkedIn GAI gateway circuit breaker (circuit_breaker.py)
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import circuit_breaker
+from circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpen
+
+
+@pytest.fixture
+def clock(clock, monkeypatch):
+    monkeypatch.setattr(circuit_breaker.time, "monotonic", clock)
+    return clock
+
+
+def open_breaker(**settings) -> CircuitBreaker:
+    breaker = CircuitBreaker(consecutive_failures=2, open_seconds=30, **settings)
+    for _ in range(2):
+        breaker.before_call()
+        breaker.record_failure()
+    assert breaker.state == OPEN
+    return breaker
+
+
+def test_consecutive_failures_open_the_circuit(clock):
+    breaker = open_breaker()
+    with pytest.raises(CircuitOpen) as excinfo:
+        breaker.before_call()
+    assert excinfo.value.retry_after == 30
+    assert breaker.stats()["rejected"] == 1
+
+
+def test_failure_rate_opens_the_circuit_once_min_calls_is_reached(clock):
+    breaker = CircuitBreaker(failure_rate=0.5, min_calls=4, consecutive_failures=10)
+    breaker.record_failure()
+    breaker.record_success(0.1)
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+    breaker.record_failure()
+    assert breaker.state == OPEN
+
+
+def test_old_outcomes_leave_the_window(clock):
+    breaker = CircuitBreaker(failure_rate=0.5, min_calls=2, window_seconds=60, consecutive_failures=10)
+    breaker.record_failure()
+    clock.now += 61
+    breaker.record_success(0.1)
+    assert breaker.state == CLOSED
+    assert breaker.stats()["window_calls"] == 1
+
+
+def test_slow_successes_count_against_the_circuit(clock):
+    breaker = CircuitBreaker(consecutive_failures=2, slow_call_seconds=5)
+    breaker.record_success(6)
+    breaker.record_success(6)
+    assert breaker.state == OPEN
+    assert breaker.stats()["slow_calls"] == 2
+
+
+def test_half_open_after_open_seconds_allows_one_probe(clock):
+    breaker = open_breaker()
+    clock.now += 30
+    assert breaker.state == HALF_OPEN
+    breaker.before_call()
+    with pytest.raises(CircuitOpen):
+        breaker.before_call()
+
+
+def test_successful_probe_closes_the_circuit(clock):
+    breaker = open_breaker()
+    clock.now += 30
+    breaker.before_call()
+    breaker.record_success(0.1)
+    assert breaker.state == CLOSED
+    assert breaker.stats()["window_calls"] == 1
+    breaker.before_call()
+
+
+def test_failed_probe_reopens_the_circuit(clock):
+    breaker = open_breaker()
+    clock.now += 30
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    assert breaker.stats()["opened"] == 2
+    with pytest.raises(CircuitOpen):
+        breaker.before_call()
+
+
+def test_cancelled_probe_returns_its_slot(clock):
+    breaker = open_breaker()
+    clock.now += 30
+    breaker.before_call()
+    breaker.record_cancelled(0.1)
+    breaker.before_call()
+    assert breaker.state == HALF_OPEN
+
+
+def test_call_records_outcomes_and_fails_fast_while_open(clock):
+    async def ok():
+        return "ok"
+
+    async def fail():
+        raise ValueError("gateway down")
+
+    async def scenario():
+        breaker = CircuitBreaker(consecutive_failures=1)
+        assert await breaker.call(ok) == "ok"
+        with pytest.raises(ValueError):
+            await breaker.call(fail)
+        calls = 0
+
+        async def counted():
+            nonlocal calls
+            calls += 1
+
+        with pytest.raises(CircuitOpen):
+            await breaker.call(counted)
+        return calls, breaker.stats()
+
+    calls, stats = asyncio.run(scenario())
+    assert calls == 0
+    assert (stats["successes"], stats["failures"], stats["state"]) == (1, 1, OPEN)
@@ -0,0 +1,85 @@
+"""
+Tests for prompt context compaction (context_compactor.py)
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from context_compactor import ContextCompactor, compact_json, compact_text, count_tokens, prune
+
+REQUIREMENTS = "5+ years of Python. Experience with Kafka."
+DESCRIPTION = (
+    "Experience with Kafka. We build streaming pipelines.\n\n"
+    "We are an equal opportunity employer. Apply now!"
+)
+
+
+def test_count_tokens_charges_words_by_length_and_punctuation_per_character():
+    assert count_tokens("") == 0
+    assert count_tokens("Go") == 1
+    assert count_tokens("distributed") == 3
+    assert count_tokens('{"a":1}') == 7
+
+
+def test_prune_drops_empty_values_and_duplicates_but_keeps_zero_and_false():
+    value = {"name": "  Ada   Lovelace ", "title": "", "tags": ["x", "x", None], "meta": {}, "score": 0, "open": False}
+    assert prune(value) == {"name": "Ada Lovelace", "tags": ["x"], "score": 0, "open": False}
+    assert compact_json({"b": 1, "a": [None]}) == '{"b":1}'
+
+
+def test_text_within_the_budget_is_only_normalized():
+    text, trimmed = compact_text("Build   APIs.\n\n\nShip them.", budget=100)
+    assert (text, trimmed) == ("Build APIs.\nShip them.", False)
+
+
+def test_boilerplate_and_repeated_sentences_are_dropped():
+    seen = set()
+    requirements, _ = compact_text(REQUIREMENTS, seen=seen)
+    description, trimmed = compact_text(DESCRIPTION, seen=seen)
+    assert requirements == REQUIREMENTS
+    # The Kafka sentence was already sent with the requirements; the EEO and apply lines carry no signal
+    assert description == "We build streaming pipelines."
+    assert not trimmed
+
+
+def test_trimming_keeps_whole_sentences_from_the_start():
+    text = "First sentence here. Second sentence here. Third sentence here."
+    budget = count_tokens("First sentence here.") + count_tokens("Second sentence here.")
+    compacted, trimmed = compact_text(text, budget=budget)
+    assert trimmed
+    assert compacted == "First sentence here. Second sentence here. …"
+
+
+def test_compact_dedupes_across_fields_in_order():
+    compactor = ContextCompactor()
+    fields = compactor.compact("analyze_job_match", {"job_requirements": REQUIREMENTS, "job_description": DESCRIPTION})
+    assert fields == {"job_requirements": REQUIREMENTS, "job_description": "We build streaming pipelines."}
+    last = compactor.stats()["operations"]["analyze_job_match"]["last"]
+    assert last["tokens_saved"] > 0
+    assert last["trimmed_fields"] == []
+
+
+def test_over_budget_structured_fields_shorten_their_longest_strings():
+    resume = {"summary": "word " * 2000, "skills": ["Python"]}
+    compactor = ContextCompactor({"polish_resume": {"resume_content": 300}})
+    compacted = compactor.compact("polish_resume", {"resume_content": resume})["resume_content"]
+    assert count_tokens(compacted) <= 300
+    assert '"skills":["Python"]' in compacted
+    assert compactor.stats()["operations"]["polish_resume"]["last"]["trimmed_fields"] == ["resume_content"]
+
+
+def test_disabled_compactor_serializes_fields_as_before():
+    compactor = ContextCompactor(enabled=False)
+    fields = compactor.compact("analyze_job_match", {"job_description": DESCRIPTION, "resume": {"a": None}})
+    assert fields == {"job_description": DESCRIPTION, "resume": '{"a": null}'}
+
+
+def test_budgets_from_env_override_or_remove_defaults(monkeypatch):
+    monkeypatch.setenv("LINKEDIN_GAI_ANALYZE_JOB_MATCH_JOB_DESCRIPTION_TOKENS", "50")
+    monkeypatch.setenv("LINKEDIN_GAI_ANALYZE_JOB_MATCH_JOB_REQUIREMENTS_TOKENS", "0")
+    monkeypatch.setenv("LINKEDIN_GAI_COMPACT_CONTEXT", "0")
+    compactor = ContextCompactor.from_env()
+    assert compactor.budgets["analyze_job_match"] == {"job_description": 50}
+    assert not compactor.enabled
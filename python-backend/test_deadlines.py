@@ -0,0 +1,124 @@
+"""
+Tests for request deadlines and disconnect cancellation (deadlines.py), driven at the ASGI level
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import deadlines
+from deadlines import DeadlineExceeded, DeadlineMiddleware
+
+BODY = {"type": "http.request", "body": b"{}", "more_body": False}
+
+
+def http_scope(*headers) -> dict:
+    return {"type": "http", "method": "POST", "path": "/test", "headers": list(headers)}
+
+
+def client(disconnect_after=None):
+    """ASGI receive that delivers the body, then a disconnect after disconnect_after seconds (or never)"""
+    messages = [BODY]
+
+    async def receive():
+        if messages:
+            return messages.pop(0)
+        if disconnect_after is None:
+            await asyncio.Event().wait()
+        await asyncio.sleep(disconnect_after)
+        return {"type": "http.disconnect"}
+    return receive
+
+
+def responder(seen: dict, work=None):
+    """Inner ASGI app that reads the body, records its deadline, runs work and responds 200"""
+    async def app(scope, receive, send):
+        await receive()
+        seen["remaining"] = deadlines.remaining()
+        try:
+            if work is not None:
+                await work()
+        except asyncio.CancelledError:
+            seen["cancelled"] = True
+            raise
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+    return app
+
+
+def serve(app, scope, receive) -> list:
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(app(scope, receive, send))
+    return sent
+
+
+def test_header_starts_the_request_deadline():
+    seen = {}
+    sent = serve(DeadlineMiddleware(responder(seen)), http_scope((b"x-request-timeout", b"2.5")), client())
+    assert 2.0 < seen["remaining"] <= 2.5
+    assert sent[0]["status"] == 200
+
+
+def test_env_default_applies_without_a_valid_header(monkeypatch):
+    monkeypatch.setenv("LINKEDIN_GAI_REQUEST_TIMEOUT", "30")
+    seen = {}
+    serve(DeadlineMiddleware(responder(seen)), http_scope((b"x-request-timeout", b"soon")), client())
+    assert 29.0 < seen["remaining"] <= 30.0
+    monkeypatch.delenv("LINKEDIN_GAI_REQUEST_TIMEOUT")
+    serve(DeadlineMiddleware(responder(seen)), http_scope(), client())
+    assert seen["remaining"] is None
+
+
+def test_deadline_cancels_deadline_aware_work():
+    seen = {}
+
+    async def slow():
+        await deadlines.with_deadline(asyncio.sleep(10), "slow")
+
+    app = DeadlineMiddleware(responder(seen, slow))
+    with pytest.raises(DeadlineExceeded, match="during slow"):
+        serve(app, http_scope((b"x-request-timeout", b"0.05")), client())
+
+
+def test_client_disconnect_cancels_the_handler():
+    seen = {}
+    before = deadlines.stats()["disconnects"]
+    sent = serve(DeadlineMiddleware(responder(seen, lambda: asyncio.sleep(10))), http_scope(), client(disconnect_after=0.01))
+    assert seen["cancelled"]
+    assert sent == []
+    assert deadlines.stats()["disconnects"] == before + 1
+
+
+def test_completed_response_is_not_cancelled_by_a_later_disconnect():
+    seen = {}
+    sent = serve(DeadlineMiddleware(responder(seen)), http_scope(), client(disconnect_after=0))
+    assert "cancelled" not in seen
+    assert [message["type"] for message in sent] == ["http.response.start", "http.response.body"]
+
+
+def test_non_http_scopes_pass_through():
+    calls = []
+
+    async def app(scope, receive, send):
+        calls.append(scope["type"])
+
+    serve(DeadlineMiddleware(app), {"type": "lifespan"}, client())
+    assert calls == ["lifespan"]
+
+
+def test_tighten_only_shortens_the_deadline():
+    async def scenario():
+        deadlines.tighten(10)
+        deadlines.tighten(60)
+        deadlines.tighten(None)
+        return deadlines.remaining()
+
+    assert 9.0 < asyncio.run(scenario()) <= 10.0
@@ -0,0 +1,84 @@
+"""
+Tests for per-operation generation settings (generation_settings.py)
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import generation_settings
+from generation_settings import FALLBACK_POLICY, GenerationSettings, GenerationTuner, OutputPolicy
+
+
+@pytest.mark.parametrize("input_tokens, max_tokens", [(0, 4000), (500, 4500), (5000, 9000), (50000, 10000)])
+def test_max_tokens_scales_with_input_within_the_policy_bounds(input_tokens, max_tokens):
+    settings = GenerationTuner().settings_for("generate_resume", input_tokens)
+    assert settings.max_tokens == max_tokens
+    assert settings.budget == 4000 + input_tokens
+
+
+def test_fixed_policies_start_at_their_ceiling():
+    tuner = GenerationTuner()
+    assert tuner.settings_for("analyze_job_match", 10000).max_tokens == 1200
+    assert tuner.settings_for("unknown").max_tokens == FALLBACK_POLICY.ceiling
+
+
+def test_observed_outputs_tighten_max_tokens_but_not_below_the_floor():
+    tuner = GenerationTuner({"op": OutputPolicy(floor=100, ceiling=1000)}, min_samples=3)
+    for _ in range(3):
+        settings = tuner.settings_for("op")
+        tuner.observe("op", 250, settings)
+    # p99 of 0.25 of the budget, with 1.5x headroom
+    assert tuner.settings_for("op").max_tokens == 375
+    for _ in range(200):
+        tuner.observe("op", 1, tuner.settings_for("op"))
+    assert tuner.settings_for("op").max_tokens == 100
+
+
+def test_learned_ratio_applies_to_each_calls_own_budget():
+    tuner = GenerationTuner({"op": OutputPolicy(floor=100, ceiling=5000, per_input_token=1.0)}, min_samples=2)
+    for _ in range(2):
+        tuner.observe("op", 125, tuner.settings_for("op", 900))
+    # Outputs used 0.125 of a 1000-token budget, so a 3200-token budget gets 0.125 * 1.5 * 3200
+    assert tuner.settings_for("op", 3100).max_tokens == 600
+
+
+def test_non_adaptive_tuner_ignores_observed_outputs():
+    tuner = GenerationTuner({"op": OutputPolicy(floor=100, ceiling=1000)}, adaptive=False, min_samples=1)
+    tuner.observe("op", 10, tuner.settings_for("op"))
+    assert tuner.settings_for("op").max_tokens == 1000
+
+
+def test_truncated_outputs_are_counted():
+    tuner = GenerationTuner({"op": OutputPolicy(floor=100, ceiling=1000)})
+    settings = tuner.settings_for("op")
+    tuner.observe("op", 1000, settings)
+    tuner.observe("op", 960, settings, exact=True)
+    tuner.observe("op", 10, settings, finish_reason="length")
+    tuner.observe("op", 960, settings)
+    assert tuner.stats()["operations"]["op"]["truncated"] == 3
+
+
+def test_use_scopes_settings_and_usage_to_the_block():
+    settings = GenerationSettings(max_tokens=10, temperature=0.1, stop=("END",))
+    usage = {}
+    generation_settings.report_usage(output_tokens=1)
+    with generation_settings.use(settings, usage):
+        assert generation_settings.current() is settings
+        generation_settings.report_usage(output_tokens=7, finish_reason="stop")
+    assert generation_settings.current() is None
+    assert usage == {"output_tokens": 7, "finish_reason": "stop"}
+    assert settings.model_kwargs() == {"max_tokens": 10, "temperature": 0.1, "stop": ["END"]}
+
+
+def test_policies_from_env(monkeypatch):
+    monkeypatch.setenv("LINKEDIN_GAI_GENERATE_POST_MAX_TOKENS", "500")
+    monkeypatch.setenv("LINKEDIN_GAI_GENERATE_POST_STOP", '["###"]')
+    monkeypatch.setenv("LINKEDIN_GAI_ADAPTIVE_MAX_TOKENS", "0")
+    tuner = GenerationTuner.from_env()
+    settings = tuner.settings_for("generate_post")
+    assert (settings.max_tokens, settings.stop) == (500, ("###",))
+    assert not tuner.adaptive
@@ -0,0 +1,85 @@
+"""
+Tests for the job feature store (job_features.py)
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from context_compactor import ContextCompactor
+from job_features import JobFeatureStore, content_hash
+from keyword_engine import KeywordEngine
+
+REQUIREMENTS = "Python and Kafka. Experience with Kubernetes."
+DESCRIPTION = "Experience with Kubernetes. Build Kafka streaming pipelines. We are an equal opportunity employer."
+
+
+def test_features_are_computed_once_and_reused_by_content():
+    store = JobFeatureStore()
+    first = store.features(REQUIREMENTS, DESCRIPTION, title="Backend Engineer", skills=["Go"])
+    second = store.features(REQUIREMENTS, DESCRIPTION, title="Backend Engineer", skills=["Go"])
+    assert second.to_dict() == first.to_dict()
+    assert (store.stats()["computed"], store.stats()["reused"]) == (1, 1)
+    assert first.content_hash == content_hash(REQUIREMENTS, DESCRIPTION, "Backend Engineer", ["Go"])
+    assert first.description == "Build Kafka streaming pipelines."
+    # Skills are counted over the raw posting; a listed skill counts like two mentions
+    assert first.skill_counts == {"Python": 1, "Kafka": 2, "Kubernetes": 2, "Go": 2}
+    assert first.skills[-1] == "Python"
+    assert first.summary.startswith("Backend Engineer · ")
+
+
+def test_identical_postings_under_different_ids_share_features():
+    store = JobFeatureStore()
+    store.features(REQUIREMENTS, DESCRIPTION, job_id="a")
+    shared = store.features(REQUIREMENTS, DESCRIPTION, job_id=7)
+    assert shared.job_id == "7"
+    assert store.get("a").content_hash == store.get(7).content_hash
+    assert store.stats()["computed"] == 1
+
+
+def test_changed_posting_gets_fresh_features_under_its_id():
+    store = JobFeatureStore()
+    store.features(REQUIREMENTS, DESCRIPTION, job_id="a")
+    changed = store.features("Rust and Go", DESCRIPTION, job_id="a")
+    assert store.get("a").content_hash == changed.content_hash
+    assert "Rust" in store.get("a").skills
+    assert store.stats()["computed"] == 2
+
+
+def test_invalidate_forgets_the_id_but_keeps_the_features():
+    store = JobFeatureStore()
+    store.features(REQUIREMENTS, DESCRIPTION, job_id="a")
+    store.invalidate("a")
+    assert store.get("a") is None
+    assert store.get("missing") is None
+    store.features(REQUIREMENTS, DESCRIPTION)
+    assert store.stats()["reused"] == 1
+
+
+def test_changing_the_match_budgets_recomputes_features():
+    compactor = ContextCompactor()
+    store = JobFeatureStore(compactor=compactor)
+    store.features(REQUIREMENTS, DESCRIPTION)
+    compactor.budgets["analyze_job_match"] = {"job_requirements": 3, "job_description": 3}
+    trimmed = store.features(REQUIREMENTS, DESCRIPTION)
+    assert store.stats()["computed"] == 2
+    assert trimmed.requirements.endswith(" …")
+
+
+def test_features_are_shared_through_the_disk_tier(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    JobFeatureStore(disk_path=path).features(REQUIREMENTS, DESCRIPTION, job_id="a")
+    other = JobFeatureStore(disk_path=path)
+    assert other.get("a").requirements == "Python and Kafka. Experience with Kubernetes."
+    other.features(REQUIREMENTS, DESCRIPTION)
+    assert (other.stats()["computed"], other.stats()["reused"]) == (0, 1)
+
+
+def test_postings_are_added_to_the_keyword_corpus_once():
+    engine = KeywordEngine()
+    store = JobFeatureStore(keyword_engine=engine)
+    features = store.features(REQUIREMENTS, DESCRIPTION)
+    store.features(REQUIREMENTS, DESCRIPTION)
+    assert features.content_hash in engine
+    assert len(engine) == 1
@@ -0,0 +1,72 @@
+"""
+Tests for the inverted job skill index (job_index.py)
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from job_index import JobIndex
+
+
+def make_index() -> JobIndex:
+    index = JobIndex()
+    index.add_job("backend", "Python and PostgreSQL services on Kubernetes", payload={"title": "Backend Engineer"})
+    index.add_job("frontend", "React and TypeScript single page apps", skills=["CSS"])
+    index.add_job("data", "Python, Spark and Airflow pipelines")
+    return index
+
+
+def test_top_k_ranks_jobs_sharing_skills():
+    ranked = make_index().top_k(["Python", "PostgreSQL", "Kubernetes"], k=3)
+    assert [job.job_id for job in ranked] == ["backend", "data"]
+    assert ranked[0].score == 1.0
+    assert set(ranked[0].matched_terms) == {"python", "postgresql", "kubernetes"}
+    assert 0 < ranked[1].score < 1
+
+
+def test_top_k_limits_results_and_skips_unrelated_jobs():
+    index = make_index()
+    assert [job.job_id for job in index.top_k(["Python"], k=1)] in (["backend"], ["data"])
+    assert index.top_k(["Haskell"]) == []
+    assert index.top_k([]) == []
+
+
+def test_aliases_and_listed_skills_are_indexed():
+    index = make_index()
+    assert [job.job_id for job in index.top_k(["k8s"])] == ["backend"]
+    assert [job.job_id for job in index.top_k(["css"])] == ["frontend"]
+
+
+def test_unknown_skills_fall_back_to_keywords():
+    index = JobIndex()
+    index.add_job("quant", "Stochastic calculus for derivatives pricing")
+    ranked = index.top_k(["stochastic calculus"])
+    assert [job.job_id for job in ranked] == ["quant"]
+    assert 0 < ranked[0].score < 1
+
+
+def test_reindexing_replaces_the_old_terms():
+    index = make_index()
+    index.add_job("backend", "Rust and gRPC")
+    assert "backend" not in [job.job_id for job in index.top_k(["PostgreSQL"])]
+    assert [job.job_id for job in index.top_k(["Rust"])] == ["backend"]
+    assert len(index) == 3
+
+
+def test_remove_job_drops_its_postings():
+    index = make_index()
+    terms = index.stats()["terms"]
+    assert index.remove_job("frontend")
+    assert not index.remove_job("frontend")
+    assert "frontend" not in index
+    assert index.top_k(["React"]) == []
+    assert index.stats()["terms"] < terms
+
+
+def test_payload_is_kept_for_shortlisted_jobs():
+    index = make_index()
+    assert index.get_job("backend") == {"title": "Backend Engineer"}
+    assert index.get_job("data") == {}
+    assert index.get_job("missing") is None
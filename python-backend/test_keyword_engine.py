@@ -0,0 +1,100 @@
+"""
+Tests for the corpus TF-IDF keyword engine (keyword_engine.py)
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from keyword_engine import KeywordEngine, KeywordGap, coverage, extract_terms, keyword_optimization, resume_section_text
+from skill_matcher import SkillMatcher
+
+STREAMING_JOB = "Kafka and Flink streaming pipelines in Python. Kafka Connect, schema registry, exactly-once delivery."
+
+RESUME = {
+    "summary": "Backend engineer building Python services",
+    "experience": [{"title": "Engineer", "achievements": ["Ran Kafka clusters", "Tuned Kafka consumers"]}],
+    "skills": ["Python", "Kafka"],
+    "education": [],
+}
+
+
+def make_engine() -> KeywordEngine:
+    engine = KeywordEngine()
+    engine.add("streaming", STREAMING_JOB)
+    for i in range(5):
+        engine.add(f"web{i}", f"Python web services with React frontends, team {i}")
+    return engine
+
+
+def test_extract_terms_uses_skill_spellings_and_drops_stopwords():
+    counts, display = extract_terms("Go and machine learning with the team, go go", SkillMatcher())
+    assert counts["go"] == 3
+    assert counts["machine learning"] == 1
+    assert display["machine learning"] == "Machine Learning"
+    assert "the" not in counts and "team" not in counts
+
+
+def test_keywords_prefer_terms_rare_in_the_corpus():
+    keywords = [keyword for keyword, _ in make_engine().keywords("streaming", top_k=5)]
+    assert keywords[0] == "Kafka"
+    assert "Flink" in keywords
+    # Python is in every posting, so it is not distinctive
+    assert "Python" not in keywords
+
+
+def test_unknown_job_has_no_keywords():
+    assert make_engine().keywords("missing") == []
+
+
+def test_gaps_report_where_the_resume_uses_each_keyword():
+    gaps = {gap.keyword: gap for gap in make_engine().gaps("streaming", RESUME, top_k=20)}
+    assert gaps["Kafka"].present
+    assert gaps["Kafka"].sections == ["experience", "skills"]
+    assert gaps["Kafka"].resume_count == 3
+    assert not gaps["Flink"].present
+
+
+def test_readding_a_job_replaces_its_row():
+    engine = make_engine()
+    engine.add("streaming", "Rust systems programming")
+    assert len(engine) == 6
+    keywords = [keyword for keyword, _ in engine.keywords("streaming")]
+    assert "Kafka" not in keywords and "Rust" in keywords
+
+
+def test_oldest_jobs_are_evicted_beyond_max_jobs():
+    engine = KeywordEngine(max_jobs=2)
+    for i in range(3):
+        engine.add(f"job{i}", f"Python posting {i}")
+    assert len(engine) == 2
+    assert "job0" not in engine and "job2" in engine
+
+
+def test_unused_terms_are_pruned_and_their_columns_reused():
+    engine = KeywordEngine(max_jobs=2)
+    for i in range(50):
+        engine.add(f"job{i}", f"Python uniqueterm{i}")
+    assert engine.stats()["terms"] == 3
+    # Columns of evicted terms are reused, so the term table stays bounded
+    assert len(engine._terms) <= 4
+    assert [keyword for keyword, _ in engine.keywords("job49")][0] == "uniqueterm49"
+    engine.remove("job48")
+    engine.remove("job49")
+    assert engine.stats() == {"jobs": 0, "terms": 0, "nonzeros": 0}
+
+
+def test_coverage_and_keyword_optimization():
+    gaps = [KeywordGap("Kafka", 2.0, resume_count=1, sections=["skills"]), KeywordGap("Flink", 1.0)]
+    assert coverage(gaps) == round(2 / 3, 4)
+    assert coverage([]) == 0.0
+    entries = keyword_optimization(gaps)
+    assert [entry["keyword"] for entry in entries] == ["Flink", "Kafka"]
+    assert entries[0]["currentUsage"] == "Missing from the resume"
+    assert "experience" in entries[1]["suggestion"]
+
+
+def test_resume_section_text_flattens_nested_values():
+    assert resume_section_text(RESUME, "experience") == "Engineer\nRan Kafka clusters\nTuned Kafka consumers"
+    assert resume_section_text(RESUME, "missing") == ""
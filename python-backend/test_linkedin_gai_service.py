@@ -0,0 +1,107 @@
+"""
+Tests for LinkedInGAIService against the offline fake LLM (linkedin_gai_service.py)
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import metrics
+from benchmarks.fake_llm import FakeLLMConfig, create_fake_llm
+from linkedin_gai_service import LinkedInGAIService
+
+PROFILE = {
+    "name": "Ada",
+    "positions": [{"title": "Engineer", "company": "X", "description": "Built APIs"}],
+    "skills": ["Python"],
+}
+
+
+def use_fake_llm(service: LinkedInGAIService, **config) -> None:
+    service.gai_available = True
+    service.chains.reload(llm=create_fake_llm(FakeLLMConfig(latency_ms=0, latency_sigma=0, **config)))
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    monkeypatch.setenv("LINKEDIN_GAI_RESUME_STORE", "1")
+    monkeypatch.setenv("LINKEDIN_GAI_RESUME_STORE_PATH", str(tmp_path / "resumes.sqlite3"))
+    monkeypatch.delenv("LINKEDIN_GAI_CACHE_PATH", raising=False)
+    service = LinkedInGAIService(lazy=True)
+    service.warm_up()
+    use_fake_llm(service)
+    return service
+
+
+def test_stale_resume_is_served_but_not_stored(service):
+    async def scenario():
+        fresh = await service.generate_resume_from_profile("linkedin.com/in/ada", "Engineer", PROFILE, sectioned=False)
+        use_fake_llm(service, failure_rate=1.0)
+        stale = await service.generate_resume_from_profile("linkedin.com/in/ada", "Engineer", PROFILE, sectioned=False, reuse=False)
+        return fresh, stale
+
+    fresh, stale = asyncio.run(scenario())
+    assert stale == fresh
+    assert service.stale_served == 1
+    assert len(service.resume_store.versions("linkedin.com/in/ada")) == 1
+
+
+JOB = {"id": "job-1", "title": "Backend Engineer", "company": {"name": "Y"}, "requirements": "Python and Kafka", "skills": ["Python", "Kafka"]}
+RESUME = {
+    "personalInfo": {"name": "Ada", "email": "ada@example.com"},
+    "summary": "Backend engineer",
+    "experience": [{"title": "Engineer", "achievements": ["Built APIs"]}],
+    "skills": ["Python"],
+}
+
+
+async def collect(events) -> list:
+    return [event async for event in events]
+
+
+def fallbacks(reason: str) -> float:
+    return metrics.FALLBACKS.value(operation="polish_resume", reason=reason)
+
+
+def test_streaming_polish_serves_the_mock_when_gai_is_unavailable(service):
+    service.llm = None
+    before = fallbacks("gai_unavailable")
+    events = asyncio.run(collect(service.stream_polish_resume_for_job(RESUME, JOB)))
+    assert events == [{"event": "result", "data": service._generate_mock_polish_suggestions(RESUME, JOB)}]
+    assert fallbacks("gai_unavailable") == before + 1
+
+
+def test_streaming_polish_failure_is_counted_as_a_fallback(service):
+    use_fake_llm(service, failure_rate=1.0)
+    before = fallbacks("error")
+    events = asyncio.run(collect(service.stream_polish_resume_for_job(RESUME, JOB)))
+    assert events[-1]["event"] == "result"
+    assert events[-1]["data"]["success"] is False
+    assert fallbacks("error") == before + 1
+
+
+def test_streamed_full_polish_is_reused_by_an_incremental_stream(service):
+    async def scenario():
+        first = await collect(service.stream_polish_resume_for_job(RESUME, JOB, incremental=True))
+        second = await collect(service.stream_polish_resume_for_job(RESUME, JOB, incremental=True))
+        return first, second
+
+    first, second = asyncio.run(scenario())
+    assert first[-1]["data"]["success"] is True
+    assert first[-1]["data"]["incremental"]["mode"] == "full"
+    assert [event["event"] for event in second] == ["result"]
+    assert second[0]["data"]["incremental"]["mode"] == "cached"
+    assert second[0]["data"]["polishingSuggestions"]["overallScore"] == first[-1]["data"]["polishingSuggestions"]["overallScore"]
+
+
+def test_streaming_polish_with_local_keywords(service):
+    events = asyncio.run(collect(service.stream_polish_resume_for_job(RESUME, JOB, local_keywords=True)))
+    sections = {event["data"]["section"]: event["data"]["value"] for event in events if event["event"] == "section"}
+    result = events[-1]["data"]
+    assert result["success"] is True
+    assert sections["keywordOptimization"] == result["polishingSuggestions"]["keywordOptimization"]
+    assert sections["keywordOptimization"] == service.keyword_gaps(RESUME, JOB)["keywordOptimization"]
@@ -0,0 +1,91 @@
+"""
+Tests for the queued logging pipeline (log_pipeline.py)
+"""
+
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import log_pipeline
+from log_pipeline import DroppingQueueHandler, PayloadSampler, truncate
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.messages.append(record.getMessage())
+
+
+def isolated_logger(name: str, handler: logging.Handler) -> logging.Logger:
+    logger = logging.getLogger(f"test_log_pipeline.{name}")
+    logger.propagate = False
+    logger.handlers[:] = [handler]
+    logger.setLevel(logging.DEBUG)
+    return logger
+
+
+def test_queued_records_reach_the_handler_and_stop_flushes_them():
+    sink = ListHandler()
+    log_queue = queue.Queue()
+    listener = logging.handlers.QueueListener(log_queue, sink)
+    logger = isolated_logger("flush", DroppingQueueHandler(log_queue))
+    listener.start()
+    for i in range(100):
+        logger.info("record %d", i)
+    listener.stop()
+    assert sink.messages == [f"record {i}" for i in range(100)]
+
+
+def test_full_queue_drops_records_instead_of_blocking():
+    handler = DroppingQueueHandler(queue.Queue(maxsize=1))
+    logger = isolated_logger("full", handler)
+    logger.info("kept")
+    logger.info("dropped")
+    assert handler.dropped == 1
+    assert handler.queue.get_nowait().getMessage() == "kept"
+
+
+def test_payload_sampler_only_samples_payload_records():
+    handler = DroppingQueueHandler(queue.Queue())
+    handler.addFilter(PayloadSampler(0.0))
+    logger = isolated_logger("sampled", handler)
+    log_pipeline.log_payload(logger, "payload %s", "body")
+    logger.debug("regular")
+    assert [handler.queue.get_nowait().getMessage() for _ in range(handler.queue.qsize())] == ["regular"]
+
+
+def test_truncated_payloads_are_capped_when_formatted():
+    assert str(truncate("x" * 10, limit=4)) == "xxxx... [truncated 6 chars]"
+    assert str(truncate({"a": 1}, limit=100)) == "{'a': 1}"
+
+
+@pytest.fixture
+def fresh_pipeline(monkeypatch):
+    """Let setup_logging run again, restoring the root logger and pipeline globals afterwards"""
+    root = logging.getLogger()
+    handlers, level = list(root.handlers), root.level
+    monkeypatch.setattr(log_pipeline, "_listener", None)
+    monkeypatch.setattr(log_pipeline, "_queue_handler", None)
+    monkeypatch.setattr(log_pipeline.atexit, "register", lambda func: None)
+    yield
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+def test_setup_logging_writes_through_the_listener_once(fresh_pipeline, tmp_path):
+    path = tmp_path / "backend.log"
+    listener = log_pipeline.setup_logging(str(path), level="INFO")
+    assert log_pipeline.setup_logging(str(path)) is listener
+    logging.getLogger("test_log_pipeline.setup").info("written by the listener thread")
+    listener.stop()
+    assert "INFO - written by the listener thread" in path.read_text(encoding="utf-8")
+    assert log_pipeline.stats() == {"queued": 0, "dropped": 0}
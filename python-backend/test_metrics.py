@@ -0,0 +1,77 @@
+"""
+Tests for the Prometheus metrics and their text rendering (metrics.py)
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from metrics import Counter, Gauge, Histogram, Registry, estimate_tokens
+
+
+def test_counter_renders_help_type_and_sorted_samples():
+    counter = Counter("gai_test_total", "Test events", ("operation",))
+    counter.inc(operation="b")
+    counter.inc(2.5, operation="a")
+    assert counter.render() == "\n".join([
+        "# HELP gai_test_total Test events",
+        "# TYPE gai_test_total counter",
+        'gai_test_total{operation="a"} 2.5',
+        'gai_test_total{operation="b"} 1',
+    ])
+
+
+def test_label_values_are_escaped():
+    counter = Counter("gai_test_total", "Test events", ("reason",))
+    counter.inc(reason='say "hi"\\\nbye')
+    assert counter.render().splitlines()[-1] == 'gai_test_total{reason="say \\"hi\\"\\\\\\nbye"} 1'
+
+
+def test_labels_must_match_the_label_names():
+    counter = Counter("gai_test_total", "Test events", ("operation",))
+    with pytest.raises(ValueError):
+        counter.inc(status="200")
+
+
+def test_gauge_tracks_a_block():
+    gauge = Gauge("gai_test_in_flight", "Running", ("operation",))
+    with gauge.track(operation="x"):
+        assert gauge.value(operation="x") == 1
+    assert gauge.render().splitlines() == [
+        "# HELP gai_test_in_flight Running",
+        "# TYPE gai_test_in_flight gauge",
+        'gai_test_in_flight{operation="x"} 0',
+    ]
+
+
+def test_histogram_renders_cumulative_buckets_sum_and_count():
+    histogram = Histogram("gai_test_seconds", "Latency", ("endpoint",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 5.0):
+        histogram.observe(value, endpoint="/x")
+    assert histogram.render().splitlines()[1:] == [
+        "# TYPE gai_test_seconds histogram",
+        'gai_test_seconds_bucket{endpoint="/x",le="0.1"} 1',
+        'gai_test_seconds_bucket{endpoint="/x",le="1"} 2',
+        'gai_test_seconds_bucket{endpoint="/x",le="+Inf"} 3',
+        'gai_test_seconds_sum{endpoint="/x"} 5.55',
+        'gai_test_seconds_count{endpoint="/x"} 3',
+    ]
+    assert histogram.count(endpoint="/x") == 3
+
+
+def test_registry_renders_metrics_then_collectors():
+    registry = Registry()
+    registry.register(Counter("gai_a_total", "A")).inc()
+    registry.add_collector(lambda: [("gai_cache_entries", "gauge", "Entries", [({"cache": "jobs"}, 3)])])
+    assert registry.render() == (
+        "# HELP gai_a_total A\n# TYPE gai_a_total counter\ngai_a_total 1\n"
+        '# HELP gai_cache_entries Entries\n# TYPE gai_cache_entries gauge\ngai_cache_entries{cache="jobs"} 3\n'
+    )
+
+
+def test_estimate_tokens_rounds_up():
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("abcde") == 2
@@ -0,0 +1,105 @@
+"""
+Tests for the content-addressed result cache (result_cache.py)
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import result_cache
+from result_cache import ResultCache, canonical_key, normalize_skills
+
+
+def test_canonical_key_ignores_dict_key_order():
+    assert canonical_key("op", {"a": 1, "b": [1, 2]}) == canonical_key("op", {"b": [1, 2], "a": 1})
+
+
+def test_canonical_key_separates_operations_and_values():
+    assert canonical_key("op_a", {"x": 1}) != canonical_key("op_b", {"x": 1})
+    assert canonical_key("op", {"x": 1}) != canonical_key("op", {"x": 2})
+
+
+def test_normalize_skills_strips_dedupes_and_sorts():
+    assert normalize_skills([" Python", "aws", "Python", "", "  ", "AWS"]) == ["AWS", "aws", "Python"]
+
+
+def test_get_returns_copies():
+    cache = ResultCache()
+    value = {"skills": ["Python"]}
+    cache.set("k", value)
+    value["skills"].append("Go")
+    cached = cache.get("k")
+    assert cached == {"skills": ["Python"]}
+    cached["skills"].append("Rust")
+    assert cache.get("k") == {"skills": ["Python"]}
+
+
+def test_lru_eviction_keeps_recently_used_entries():
+    cache = ResultCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_entries_expire_after_their_ttl(clock, monkeypatch):
+    monkeypatch.setattr(result_cache.time, "time", clock)
+    cache = ResultCache(ttl_seconds=10)
+    cache.set("default", "v")
+    cache.set("long", "v", ttl_seconds=100)
+    clock.now += 11
+    assert cache.get("default") is None
+    assert cache.get("long") == "v"
+    assert cache.stats()["expirations"] == 1
+
+
+def test_stats_count_hits_and_misses():
+    cache = ResultCache()
+    cache.set("k", 1)
+    cache.get("k")
+    cache.get("missing")
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
+
+
+def test_disk_tier_is_shared_between_instances(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    writer = ResultCache(disk_path=path, namespace="match")
+    writer.set("k", {"score": 80})
+    reader = ResultCache(disk_path=path, namespace="match")
+    assert reader.get("k") == {"score": 80}
+    assert reader.stats()["disk_hits"] == 1
+    # Promoted into memory: the second read is not a disk hit
+    assert reader.get("k") == {"score": 80}
+    assert reader.stats()["disk_hits"] == 1
+
+
+def test_namespaces_do_not_collide(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    ResultCache(disk_path=path, namespace="a").set("k", "a")
+    assert ResultCache(disk_path=path, namespace="b").get("k") is None
+
+
+def test_invalidate_and_clear_reach_the_disk_tier(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    cache = ResultCache(disk_path=path)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.invalidate("a")
+    assert ResultCache(disk_path=path).get("a") is None
+    assert ResultCache(disk_path=path).get("b") == 2
+    cache.clear()
+    assert ResultCache(disk_path=path).get("b") is None
+
+
+def test_expired_disk_rows_are_not_served(tmp_path, clock, monkeypatch):
+    monkeypatch.setattr(result_cache.time, "time", clock)
+    path = str(tmp_path / "cache.sqlite3")
+    ResultCache(disk_path=path, ttl_seconds=5).set("k", 1)
+    clock.now += 6
+    assert ResultCache(disk_path=path).get("k") is None
@@ -0,0 +1,128 @@
+"""
+Tests for section-wise resume generation (resume_sections.py)
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import resume_sections
+from linkedin_gai_service import LinkedInGAIService
+
+PROFILE = {
+    "firstName": "Ada",
+    "lastName": "Lovelace",
+    "email": "ada@example.com",
+    "location": {"region": "London", "country": "UK"},
+    "headline": "Backend engineer",
+    "positions": [
+        {
+            "title": "Staff Engineer",
+            "companyName": "X",
+            "startDate": {"year": 2020, "month": 3},
+            "isCurrent": True,
+            "description": "Led the platform team. Cut latency by 40%.",
+        },
+        {"title": "Engineer", "company": "Y", "duration": "2016 - 2020", "achievements": ["Built APIs"]},
+    ],
+    "educations": [{"degree": "BSc", "fieldOfStudy": "Mathematics", "schoolName": "UCL", "endDate": {"year": 2016}}],
+    "skills": [{"name": "Python"}, "Go", {"name": "Python"}],
+}
+
+
+def test_can_split_needs_a_structured_profile_with_positions():
+    assert resume_sections.can_split(PROFILE)
+    assert not resume_sections.can_split({"name": "Ada"})
+    assert not resume_sections.can_split(None)
+
+
+def test_factual_sections_are_copied_from_the_profile():
+    assert resume_sections.personal_info(PROFILE, "linkedin.com/in/ada") == {
+        "name": "Ada Lovelace",
+        "email": "ada@example.com",
+        "location": "London, UK",
+        "linkedinUrl": "linkedin.com/in/ada",
+    }
+    assert resume_sections.education(PROFILE) == [{"degree": "BSc, Mathematics", "institution": "UCL", "year": "2016"}]
+    assert resume_sections.skill_names(PROFILE) == ["Python", "Go"]
+    assert [resume_sections.duration(p) for p in PROFILE["positions"]] == ["Mar 2020 - Present", "2016 - 2020"]
+
+
+def test_fallbacks_use_the_profile_text():
+    first, second = PROFILE["positions"]
+    assert resume_sections.fallback_achievements(first) == ["Led the platform team.", "Cut latency by 40%."]
+    assert resume_sections.fallback_achievements(second) == ["Built APIs"]
+    assert resume_sections.fallback_summary(PROFILE) == "Backend engineer"
+
+
+def test_parse_string_list_accepts_fenced_and_wrapped_arrays():
+    assert resume_sections.parse_string_list('```json\n["a", " b  c "]\n```', 5) == ["a", "b c"]
+    assert resume_sections.parse_string_list('{"skills": ["a", "b", "c"]}', 2) == ["a", "b"]
+    for text in ('{"a": 1, "b": 2}', "[]", '[""]'):
+        with pytest.raises(ValueError):
+            resume_sections.parse_string_list(text, 5)
+
+
+def test_clean_summary_strips_labels_and_quotes():
+    assert resume_sections.clean_summary('"Summary: Builds things."') == "Builds things."
+    with pytest.raises(ValueError):
+        resume_sections.clean_summary("```\n```")
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    monkeypatch.setenv("LINKEDIN_GAI_RESUME_STORE_PATH", str(tmp_path / "resumes.sqlite3"))
+    monkeypatch.delenv("LINKEDIN_GAI_CACHE_PATH", raising=False)
+    service = LinkedInGAIService(lazy=True)
+    service.warm_up()
+    return service
+
+
+def stub_sections(service, monkeypatch, responses):
+    """Answer each section call from responses[operation]; an exception instance is raised instead"""
+    async def run_chain(operation, inputs):
+        response = responses[operation]
+        if isinstance(response, Exception):
+            raise response
+        return response(inputs) if callable(response) else response
+    monkeypatch.setattr(service, "_run_chain", run_chain)
+
+
+def generate(service) -> dict:
+    return asyncio.run(service._generate_resume_sections("linkedin.com/in/ada", "Engineer", PROFILE))
+
+
+def test_drafted_sections_are_merged_with_the_copied_ones(service, monkeypatch):
+    stub_sections(service, monkeypatch, {
+        "resume_summary": "Summary: Engineer who ships.",
+        "resume_skills": '["Python", "Go", "Kafka"]',
+        "resume_experience": lambda inputs: f'["Drafted for {"Staff" if "Staff" in inputs["position"] else "other"}"]',
+    })
+    resume = generate(service)
+    assert list(resume) == ["personalInfo", "summary", "experience", "skills", "education"]
+    assert resume["summary"] == "Engineer who ships."
+    assert resume["skills"] == ["Python", "Go", "Kafka"]
+    assert resume["experience"] == [
+        {"title": "Staff Engineer", "company": "X", "duration": "Mar 2020 - Present", "achievements": ["Drafted for Staff"]},
+        {"title": "Engineer", "company": "Y", "duration": "2016 - 2020", "achievements": ["Drafted for other"]},
+    ]
+    assert resume["personalInfo"]["name"] == "Ada Lovelace"
+
+
+def test_failed_or_malformed_sections_fall_back_to_the_profile(service, monkeypatch):
+    stub_sections(service, monkeypatch, {
+        "resume_summary": RuntimeError("gateway error"),
+        "resume_skills": "not json",
+        "resume_experience": "[]",
+    })
+    resume = generate(service)
+    assert resume["summary"] == "Backend engineer"
+    assert resume["skills"] == ["Python", "Go"]
+    assert [entry["achievements"] for entry in resume["experience"]] == [
+        ["Led the platform team.", "Cut latency by 40%."],
+        ["Built APIs"],
+    ]
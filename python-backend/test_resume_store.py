@@ -0,0 +1,107 @@
+"""
+Tests for the generated resume store (resume_store.py)
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import resume_store
+from resume_store import DEFAULT_ROLE, ResumeStore, normalize_role, normalize_url, profile_hash
+
+URL = "https://www.linkedin.com/in/ada/"
+PROFILE = {"name": "Ada", "skills": ["Python", "Go"]}
+RESUME = {"summary": "Engineer", "skills": ["Python"]}
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ResumeStore(str(tmp_path / "resumes.sqlite3"))
+
+
+def test_url_normalization_ignores_scheme_www_query_and_case():
+    assert normalize_url("https://www.LinkedIn.com/in/Ada/?trk=x#top") == "linkedin.com/in/ada"
+    assert normalize_url("linkedin.com/in/ada") == normalize_url(URL)
+
+
+def test_role_normalization_collapses_case_and_punctuation():
+    assert normalize_role("Sr. Backend  Engineer") == "sr. backend engineer"
+    assert normalize_role("C++ / Go developer") == "c++ go developer"
+    assert normalize_role(None) == normalize_role("  ") == DEFAULT_ROLE
+
+
+def test_profile_hash_ignores_key_order():
+    assert profile_hash({"a": 1, "b": 2}) == profile_hash({"b": 2, "a": 1})
+    assert profile_hash(None) == profile_hash({})
+
+
+def test_save_then_lookup_by_the_normalized_key(store):
+    version_id = store.save(URL, "Backend Engineer", PROFILE, RESUME)
+    record = store.lookup("linkedin.com/in/ada", "backend engineer", dict(reversed(list(PROFILE.items()))))
+    assert record["version_id"] == version_id
+    assert record["resume"] == RESUME
+    assert record["valid"]
+    assert store.stats()["hits"] == 1
+
+
+def test_lookup_misses_on_another_role_or_mode(store):
+    store.save(URL, "Backend Engineer", PROFILE, RESUME, mode="single")
+    assert store.lookup(URL, "Data Engineer", PROFILE) is None
+    assert store.lookup(URL, "Backend Engineer", PROFILE, mode="sections") is None
+    assert store.lookup(URL, "Backend Engineer", PROFILE, mode="single") is not None
+    assert store.stats()["misses"] == 2
+
+
+def test_newest_version_is_served(store):
+    store.save(URL, None, PROFILE, {"summary": "old"})
+    store.save(URL, None, PROFILE, {"summary": "new"})
+    assert store.lookup(URL, None, PROFILE)["resume"] == {"summary": "new"}
+
+
+def test_changed_profile_invalidates_older_versions_for_every_role(store):
+    store.save(URL, "Backend Engineer", PROFILE, RESUME)
+    store.save(URL, "SRE", PROFILE, RESUME)
+    changed = {**PROFILE, "skills": ["Rust"]}
+    store.save(URL, "Backend Engineer", changed, RESUME)
+    assert store.lookup(URL, "SRE", PROFILE) is None
+    assert store.lookup(URL, "Backend Engineer", changed) is not None
+    reasons = {(version["role"], version["invalidated_reason"]) for version in store.versions(URL)}
+    assert ("sre", "profile_changed") in reasons
+    assert all("resume" not in version for version in store.versions(URL))
+
+
+def test_explicit_invalidation_by_url_and_role(store):
+    store.save(URL, "Backend Engineer", PROFILE, RESUME)
+    store.save(URL, "SRE", PROFILE, RESUME)
+    assert store.invalidate(URL, "SRE") == 1
+    assert store.lookup(URL, "SRE", PROFILE) is None
+    assert store.lookup(URL, "Backend Engineer", PROFILE) is not None
+    assert store.invalidate(URL) == 1
+    assert store.versions(URL, include_invalidated=False) == []
+    assert len(store.versions(URL)) == 2
+
+
+def test_versions_beyond_max_versions_are_deleted(tmp_path):
+    store = ResumeStore(str(tmp_path / "resumes.sqlite3"), max_versions=2)
+    ids = [store.save(URL, None, PROFILE, {"n": n}) for n in range(3)]
+    assert [version["version_id"] for version in store.versions(URL)] == [ids[2], ids[1]]
+    assert store.get(ids[0]) is None
+    assert store.get(ids[2])["resume"] == {"n": 2}
+
+
+def test_ttl_stops_serving_old_versions(tmp_path, clock, monkeypatch):
+    monkeypatch.setattr(resume_store.time, "time", clock)
+    store = ResumeStore(str(tmp_path / "resumes.sqlite3"), ttl_seconds=60)
+    store.save(URL, None, PROFILE, RESUME)
+    clock.now += 61
+    assert store.lookup(URL, None, PROFILE) is None
+    assert store.versions(URL)[0]["valid"]
+
+
+def test_versions_are_shared_through_the_file(tmp_path):
+    path = str(tmp_path / "resumes.sqlite3")
+    ResumeStore(path).save(URL, None, PROFILE, RESUME)
+    assert ResumeStore(path).lookup(URL, None, PROFILE)["resume"] == RESUME
@@ -0,0 +1,123 @@
+"""
+Tests for cross-process request coalescing (shared_flight.py)
+
+Two SharedFlight instances on one SQLite file stand in for two worker processes.
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import shared_flight
+from shared_flight import SharedFlight
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "flights.sqlite3")
+
+
+def test_follower_takes_the_leaders_result(path):
+    async def scenario():
+        leader, follower = SharedFlight(path, poll_interval=0.01), SharedFlight(path, poll_interval=0.01)
+        release = asyncio.Event()
+        calls = []
+
+        async def work(name):
+            calls.append(name)
+            await release.wait()
+            return {"by": name}
+
+        first = asyncio.ensure_future(leader.do("k", lambda: work("leader")))
+        await asyncio.sleep(0.01)
+        second = asyncio.ensure_future(follower.do("k", lambda: work("follower")))
+        await asyncio.sleep(0.03)
+        release.set()
+        return await first, await second, calls, leader.stats(), follower.stats()
+
+    first, second, calls, leader_stats, follower_stats = asyncio.run(scenario())
+    assert first == second == {"by": "leader"}
+    assert calls == ["leader"]
+    assert (leader_stats["led"], follower_stats["followed"]) == (1, 1)
+
+
+def test_a_later_caller_does_not_reuse_a_finished_result(path):
+    async def scenario():
+        flight = SharedFlight(path)
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        return [await flight.do("k", work), await SharedFlight(path).do("k", work)]
+
+    assert asyncio.run(scenario()) == [1, 2]
+
+
+def test_a_waiter_takes_over_when_the_leader_fails(path):
+    async def scenario():
+        leader, follower = SharedFlight(path, poll_interval=0.01), SharedFlight(path, poll_interval=0.01)
+        fail = asyncio.Event()
+
+        async def failing():
+            await fail.wait()
+            raise RuntimeError("gateway error")
+
+        async def working():
+            return "recovered"
+
+        first = asyncio.ensure_future(leader.do("k", failing))
+        await asyncio.sleep(0.01)
+        second = asyncio.ensure_future(follower.do("k", working))
+        await asyncio.sleep(0.02)
+        fail.set()
+        with pytest.raises(RuntimeError):
+            await first
+        return await asyncio.wait_for(second, 1), follower.stats()
+
+    result, stats = asyncio.run(scenario())
+    assert result == "recovered"
+    assert stats["led"] == 1
+
+
+def test_an_expired_lease_is_taken_over_after_lease_seconds(path, clock, monkeypatch):
+    monkeypatch.setattr(shared_flight.time, "time", clock)
+
+    async def scenario():
+        # A leader that died mid-call: its lease row stays behind with no result
+        dead = SharedFlight(path)
+        assert dead._try_acquire("k", "dead-owner")
+        waiter = SharedFlight(path, lease_seconds=120, poll_interval=0.01)
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            return "fresh"
+
+        task = asyncio.ensure_future(waiter.do("k", work))
+        await asyncio.sleep(0.05)
+        clock.now += 119
+        await asyncio.sleep(0.05)
+        assert not task.done() and calls == 0
+        clock.now += 2
+        return await asyncio.wait_for(task, 1), calls, waiter.stats()
+
+    result, calls, stats = asyncio.run(scenario())
+    assert (result, calls) == ("fresh", 1)
+    assert (stats["taken_over"], stats["led"]) == (1, 1)
+
+
+def test_unusable_path_disables_coalescing(tmp_path):
+    async def work():
+        return "direct"
+
+    flight = SharedFlight(str(tmp_path / "missing" / "flights.sqlite3"))
+    assert not flight.enabled
+    assert asyncio.run(flight.do("k", work)) == "direct"
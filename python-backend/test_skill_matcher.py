@@ -0,0 +1,93 @@
+"""
+Tests for local skill matching (skill_matcher.py)
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from skill_matcher import SkillMatcher, compatibility_from_match, tokenize
+
+JOB_TEXT = (
+    "We build distributed systems in Python and Go on Kubernetes. "
+    "Experience with Machine Learning and PostgreSQL is a plus. Python everywhere."
+)
+
+
+def test_tokenize_keeps_skill_punctuation():
+    assert tokenize("C++, C#, Node.js and CI/CD") == ["c++", "c#", "node.js", "and", "ci", "cd"]
+
+
+def test_dotnet_needs_its_leading_dot():
+    assert tokenize("C#/.NET (.NET Core), ASP.NET... net income") == ["c#", ".net", ".net", "core", "asp.net", "net", "income"]
+    assert SkillMatcher().extract_skills("Net revenue grew; we ship .NET services") == {".NET": 1}
+
+
+def test_single_letter_skills_only_come_from_skill_lists():
+    matcher = SkillMatcher()
+    assert matcher.extract_skills("Plan B: report to C-level, R&D budget, C and R") == {}
+    assert matcher.canonical_skill("c") == "C"
+    assert matcher.canonical_skill("R") == "R"
+    match = matcher.match(["C", "Python"], "Series A startup writing C and Python")
+    assert match.matching_skills == ["Python"]
+    assert match.score == 100
+
+
+def test_skills_match_on_word_boundaries_only():
+    matcher = SkillMatcher()
+    assert "Go" not in matcher.extract_skills("Experience at Google with Django")
+    assert matcher.extract_skills("Go and Django") == {"Go": 1, "Django": 1}
+
+
+def test_extract_counts_multi_word_skills_and_aliases():
+    counts = SkillMatcher().extract_skills("Machine Learning on k8s; more ML, golang services on Kubernetes")
+    assert counts["Machine Learning"] == 2
+    assert counts["Kubernetes"] == 2
+    assert counts["Go"] == 1
+
+
+def test_canonical_skill_resolves_aliases_and_case():
+    matcher = SkillMatcher()
+    assert matcher.canonical_skill("postgres") == "PostgreSQL"
+    assert matcher.canonical_skill("PYTHON") == "Python"
+    assert matcher.canonical_skill("underwater basket weaving") is None
+
+
+def test_match_reports_user_spelling_and_missing_skills_by_weight():
+    match = SkillMatcher().match(["python", "k8s"], JOB_TEXT)
+    assert match.matching_skills == ["python", "k8s"]
+    # Multi-word skills weigh more than single tokens mentioned as often
+    assert match.missing_skills[0] in ("Machine Learning", "Distributed Systems")
+    assert {"Go", "PostgreSQL"} <= set(match.missing_skills)
+    assert 0 < match.score < 100
+
+
+def test_full_coverage_scores_100_and_no_skills_scores_0():
+    matcher = SkillMatcher()
+    assert matcher.match(["Python"], "Python and more Python").score == 100
+    assert matcher.match([], JOB_TEXT).score == 0
+    assert matcher.match(["Python"], "").coverage == 0.0
+
+
+def test_unknown_user_skills_count_when_the_job_mentions_them():
+    match = SkillMatcher().match(["Zig"], "We write Zig and Python")
+    assert match.matching_skills == ["Zig"]
+    assert "Zig" in match.job_skills
+    assert "Zig" not in match.missing_skills
+
+
+def test_compatibility_from_match_has_the_llm_analysis_shape():
+    result = compatibility_from_match(SkillMatcher().match(["Python"], JOB_TEXT))
+    assert set(result) == {
+        "compatibilityScore", "matchingSkills", "missingSkills", "recommendations",
+        "strengthAreas", "improvementAreas", "overallAssessment",
+    }
+    assert result["matchingSkills"] == ["Python"]
+    assert result["recommendations"][-1].startswith("Highlight Python")
+
+
+def test_compatibility_without_job_skills_asks_for_analysis():
+    result = compatibility_from_match(SkillMatcher().match(["Python"], "Friendly team, great snacks"))
+    assert result["compatibilityScore"] == 0
+    assert "No recognizable skills" in result["overallAssessment"]
@@ -0,0 +1,80 @@
+"""
+Tests for the incremental JSON parser used on streamed LLM output (streaming_json.py)
+"""
+
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from streaming_json import IncrementalJSONParser
+
+RESUME = {
+    "personalInfo": {"name": "Ada", "title": "Engineer \"Lead\" {core}"},
+    "summary": "Builds systems, ships [fast].",
+    "experience": [{"company": "X", "achievements": ["a", "b"]}, {"company": "Y"}],
+    "skills": ["Python", "Go", 3, True, None],
+    "years": 12,
+    "remote": False,
+}
+
+
+def feed_all(parser: IncrementalJSONParser, text: str, size: int):
+    events = []
+    for start in range(0, len(text), size):
+        events.extend(parser.feed(text[start:start + size]))
+    return events
+
+
+@pytest.mark.parametrize("size", [1, 3, 7, 64, 10_000])
+def test_result_matches_json_loads_for_any_chunking(size):
+    text = json.dumps(RESUME, indent=2)
+    parser = IncrementalJSONParser(split_arrays=["experience"])
+    feed_all(parser, text, size)
+    assert parser.done
+    assert parser.result() == RESUME
+
+
+def test_sections_are_emitted_in_order_as_they_complete():
+    parser = IncrementalJSONParser()
+    events = feed_all(parser, json.dumps(RESUME), 5)
+    assert [event["section"] for event in events] == [
+        "personalInfo", "summary", "experience", "skills", "years", "remote",
+    ]
+    assert events[-1] == {"section": "remote", "value": False}
+
+
+def test_split_arrays_emit_each_element():
+    parser = IncrementalJSONParser(split_arrays=["experience", "skills"])
+    events = feed_all(parser, json.dumps(RESUME), 4)
+    experience = [event for event in events if event["section"] == "experience"]
+    assert experience == [
+        {"section": "experience", "index": 0, "value": RESUME["experience"][0]},
+        {"section": "experience", "index": 1, "value": RESUME["experience"][1]},
+    ]
+    skills = [event["value"] for event in events if event["section"] == "skills"]
+    assert skills == RESUME["skills"]
+
+
+def test_a_section_is_emitted_before_the_object_closes():
+    parser = IncrementalJSONParser()
+    assert parser.feed('{"summary": "done", "experience": [{"company"') == [{"section": "summary", "value": "done"}]
+    assert not parser.done
+    with pytest.raises(ValueError):
+        parser.result()
+
+
+def test_fences_and_preamble_are_ignored():
+    parser = IncrementalJSONParser()
+    feed_all(parser, 'Here you go:\n```json\n{"a": 1, "b": "x"}\n```\nThanks', 6)
+    assert parser.result() == {"a": 1, "b": "x"}
+    assert parser.feed('{"c": 2}') == []
+
+
+def test_malformed_values_raise_json_decode_error():
+    parser = IncrementalJSONParser()
+    with pytest.raises(json.JSONDecodeError):
+        parser.feed('{"a": tru, "b": 1}')
@@ -0,0 +1,177 @@
+"""
+Tests for the asynchronous task queue (task_queue.py)
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import deadlines
+import task_queue
+from admission import Overloaded
+from task_queue import CANCELLED, FAILED, QUEUED, RUNNING, SUCCEEDED, TaskQueue
+
+
+async def echo(payload):
+    await asyncio.sleep(0)
+    return {"echo": payload["value"]}
+
+
+async def blocked(payload):
+    # Deadline-aware like the service's LLM calls
+    await deadlines.with_deadline(asyncio.sleep(10), "blocked")
+
+
+def make_queue(**settings) -> TaskQueue:
+    queue = TaskQueue(**settings)
+    queue.register("echo", echo)
+    queue.register("blocked", blocked)
+    return queue
+
+
+def test_submitted_task_runs_and_keeps_its_result():
+    async def scenario():
+        queue = make_queue()
+        record = queue.submit("echo", {"value": 1})
+        assert record["status"] == QUEUED
+        finished = await queue.wait(record["task_id"], 1)
+        await queue.stop()
+        return finished, queue.stats()
+
+    finished, stats = asyncio.run(scenario())
+    assert finished["status"] == SUCCEEDED
+    assert finished["result"] == {"echo": 1}
+    assert finished["started_at"] is not None and finished["finished_at"] is not None
+    assert (stats["submitted"], stats[SUCCEEDED]) == (1, 1)
+
+
+def test_unknown_operation_is_rejected():
+    queue = make_queue()
+    with pytest.raises(KeyError):
+        queue.submit("missing", {})
+    assert queue.operations == ["blocked", "echo"]
+
+
+def test_full_queue_fails_fast():
+    async def scenario():
+        queue = make_queue(workers=1, max_queued=1)
+        queue.submit("blocked", {})
+        await asyncio.sleep(0.01)
+        queue.submit("blocked", {})
+        with pytest.raises(Overloaded) as excinfo:
+            queue.submit("blocked", {})
+        await queue.stop()
+        return excinfo.value, queue.stats()
+
+    error, stats = asyncio.run(scenario())
+    assert error.retry_after >= 1
+    assert stats["rejected"] == 1
+
+
+def test_handler_errors_fail_the_task():
+    async def broken(payload):
+        raise ValueError("bad payload")
+
+    async def scenario():
+        queue = make_queue()
+        queue.register("broken", broken)
+        record = await queue.wait(queue.submit("broken", {})["task_id"], 1)
+        await queue.stop()
+        return record
+
+    record = asyncio.run(scenario())
+    assert (record["status"], record["error"]) == (FAILED, "bad payload")
+
+
+def test_task_deadline_fails_a_slow_task():
+    async def scenario():
+        queue = make_queue(task_timeout=0.05)
+        record = await queue.wait(queue.submit("blocked", {})["task_id"], 1)
+        await queue.stop()
+        return record
+
+    record = asyncio.run(scenario())
+    assert record["status"] == FAILED
+    assert record["error"] == "Deadline exceeded during blocked"
+
+
+def test_cancel_a_running_task():
+    async def scenario():
+        queue = make_queue()
+        task_id = queue.submit("blocked", {})["task_id"]
+        await asyncio.sleep(0.01)
+        assert queue.get(task_id)["status"] == RUNNING
+        queue.cancel(task_id)
+        record = await queue.wait(task_id, 1)
+        await queue.stop()
+        return record, queue.stats()
+
+    record, stats = asyncio.run(scenario())
+    assert (record["status"], record["error"]) == (CANCELLED, "Cancelled while running")
+    assert stats["running"] == 0
+
+
+def test_cancel_a_queued_task_before_it_starts():
+    async def scenario():
+        queue = make_queue(workers=1)
+        first = queue.submit("blocked", {})["task_id"]
+        second = queue.submit("echo", {"value": 2})["task_id"]
+        await asyncio.sleep(0.01)
+        cancelled = queue.cancel(second)
+        queue.cancel(first)
+        await asyncio.sleep(0.01)
+        record = queue.get(second)
+        await queue.stop()
+        return cancelled, record
+
+    cancelled, record = asyncio.run(scenario())
+    assert cancelled["status"] == CANCELLED
+    assert (record["status"], record["result"]) == (CANCELLED, None)
+
+
+def test_stop_cancels_running_tasks_and_returns():
+    async def scenario():
+        queue = make_queue()
+        task_id = queue.submit("blocked", {})["task_id"]
+        await asyncio.sleep(0.01)
+        await asyncio.wait_for(queue.stop(), 1)
+        return queue.get(task_id)
+
+    record = asyncio.run(scenario())
+    assert (record["status"], record["error"]) == (CANCELLED, "Worker stopped")
+
+
+def test_finished_tasks_expire_after_the_ttl(clock, monkeypatch, tmp_path):
+    monkeypatch.setattr(task_queue.time, "time", clock)
+
+    async def scenario():
+        path = str(tmp_path / "tasks.sqlite3")
+        queue = make_queue(ttl_seconds=60, path=path)
+        task_id = queue.submit("echo", {"value": 3})["task_id"]
+        await queue.wait(task_id, 1)
+        await queue.stop()
+        other = TaskQueue(ttl_seconds=60, path=path)
+        shared = other.get(task_id)
+        clock.now += 61
+        return shared, queue.get(task_id), other.get(task_id)
+
+    shared, expired, expired_shared = asyncio.run(scenario())
+    assert shared["status"] == SUCCEEDED and shared["result"] == {"echo": 3}
+    assert expired is None and expired_shared is None
+
+
+def test_wait_polls_the_shared_table_for_tasks_of_another_process(tmp_path):
+    async def scenario():
+        path = str(tmp_path / "tasks.sqlite3")
+        runner = make_queue(path=path)
+        poller = TaskQueue(path=path, poll_interval=0.01)
+        task_id = runner.submit("echo", {"value": 4})["task_id"]
+        record = await poller.wait(task_id, 1)
+        await runner.stop()
+        return record
+
+    assert asyncio.run(scenario())["result"] == {"echo": 4}
@@ -42,7 +42,9 @@ class PythonGaiService {
       }, {
         timeout: 30000,
         headers: {
-          'Content-Type': 'application/json'
+          'Content-Type': 'application/json',
+          // Lets the Python service cancel the LLM call once we stop waiting
+          'X-Request-Timeout': '30'
         }
       });
       